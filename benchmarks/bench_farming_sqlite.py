@@ -0,0 +1,117 @@
+"""Benchmark the farming diary person/date lookups on a large synthetic records table.
+
+Fills a fresh FarmingLanceDBManager metadata.db with synthetic records (1M by
+default), then times the ``/works`` and ``/all_works_dates`` lookups two ways:
+
+- the previous ``(person = ? OR pid = ? OR person_name = ?)`` filter on a table
+  without the secondary indexes (full scan)
+- ``resolve_person`` + a single ``person = ?`` query on the indexed table
+
+    python benchmarks/bench_farming_sqlite.py --rows 1000000 --persons 1000
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from lance_db.FarmingLanceDBManager import FarmingLanceDBManager  # noqa: E402
+from utils.farming_diary.farming_diary_utils import (  # noqa: E402
+    get_all_works_date,
+    get_work_dates,
+)
+
+INDEXES = ["idx_records_person_date", "idx_records_pid_date", "idx_records_person_name_date"]
+OR_WORKS_SQL = """
+SELECT * FROM records
+WHERE (person = ? OR pid = ? OR person_name = ?) AND date = ?
+ORDER BY mtime ASC
+"""
+OR_DATES_SQL = """
+SELECT DISTINCT date FROM records
+WHERE (person = ? OR pid = ? OR person_name = ?)
+ORDER BY date ASC
+"""
+
+
+def _fill(db: FarmingLanceDBManager, num_rows: int, num_persons: int, num_dates: int):
+    rng = random.Random(0)
+    dates = [f"2024-{m:02d}-{d:02d}" for m in range(1, 13) for d in range(1, 29)][:num_dates]
+
+    def rows():
+        for i in range(num_rows):
+            p = i % num_persons
+            yield (
+                f"rec-{i}", f"{p}_person{p}", rng.choice(dates), f"{i % 24:02d}:00",
+                f"synthetic work {i}", f"/data/{p}/log.json", float(i), str(p), f"person{p}",
+            )
+
+    with db._sqlite_lock:  # noqa: SLF001
+        db.conn.executemany(
+            "INSERT INTO records(id, person, date, time, content, filepath, mtime, pid, person_name)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows(),
+        )
+        db.conn.commit()
+    return dates
+
+
+def _time(fn, queries) -> float:
+    start = time.perf_counter()
+    for q in queries:
+        fn(*q)
+    return (time.perf_counter() - start) / len(queries) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--persons", type=int, default=1000)
+    parser.add_argument("--dates", type=int, default=200)
+    parser.add_argument("--queries", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        db = FarmingLanceDBManager(root_dir=root)
+        start = time.perf_counter()
+        dates = _fill(db, args.rows, args.persons, args.dates)
+        print(f"inserted {args.rows} rows in {time.perf_counter() - start:.1f}s")
+
+        rng = random.Random(1)
+        # mix the three identifier forms the endpoints accept
+        queries = []
+        for _ in range(args.queries):
+            p = rng.randrange(args.persons)
+            person = rng.choice([f"{p}_person{p}", str(p), f"person{p}"])
+            queries.append((person, rng.choice(dates)))
+
+        with db._sqlite_lock:  # noqa: SLF001
+            for name in INDEXES:
+                db.conn.execute(f"DROP INDEX IF EXISTS {name}")
+            db.conn.commit()
+        expected = [db.sql_query(OR_WORKS_SQL, (p, p, p, d)) for p, d in queries]
+        or_works = _time(lambda p, d: db.sql_query(OR_WORKS_SQL, (p, p, p, d)), queries)
+        or_dates = _time(lambda p, _: db.sql_query(OR_DATES_SQL, (p, p, p)), queries)
+
+        start = time.perf_counter()
+        db._ensure_indexes()  # noqa: SLF001
+        print(f"built indexes in {time.perf_counter() - start:.1f}s")
+        actual = [get_all_works_date(db, p, d) for p, d in queries]
+        if actual != expected:
+            msg = "indexed lookup returned different rows than the OR filter"
+            raise AssertionError(msg)
+        idx_works = _time(lambda p, d: get_all_works_date(db, p, d), queries)
+        idx_dates = _time(lambda p, _: get_work_dates(db, p), queries)
+        db.conn.close()
+
+    print(f"{'lookup':<18}{'OR scan (ms)':>15}{'indexed (ms)':>15}{'speedup':>10}")
+    print(f"{'/works':<18}{or_works:>15.2f}{idx_works:>15.2f}{or_works / idx_works:>9.0f}x")
+    print(f"{'/all_works_dates':<18}{or_dates:>15.2f}{idx_dates:>15.2f}{or_dates / idx_dates:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
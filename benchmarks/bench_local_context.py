@@ -0,0 +1,164 @@
+"""Benchmark fitting the local search relationship/covariate context into its budget.
+
+Builds a synthetic graph and times the previous approach, which rebuilt and
+re-tokenized the whole relationship and covariate tables after adding each mapped
+entity, against ``LocalContextAssembler``, for 10, 50 and 100 mapped entities.
+
+    python benchmarks/bench_local_context.py --entities 20000 --max-tokens 20000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import tiktoken
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "graphrag_lib"))
+
+from graphrag.model import Covariate, Entity, Relationship  # noqa: E402
+from graphrag.query.context_builder.local_context import (  # noqa: E402
+    LocalContextAssembler,
+    build_covariates_context,
+    build_relationship_context,
+)
+from graphrag.query.input.retrieval.covariates import CovariateIndex  # noqa: E402
+from graphrag.query.input.retrieval.relationships import (  # noqa: E402
+    RelationshipIndex,
+)
+from graphrag.query.llm.text_utils import num_tokens  # noqa: E402
+
+
+def _synthetic_graph(
+    num_entities: int, seed: int = 0
+) -> tuple[list[Entity], RelationshipIndex, dict[str, CovariateIndex]]:
+    rng = random.Random(seed)
+    entities = [
+        Entity(
+            id=f"entity-{i}",
+            short_id=str(i),
+            title=f"ENTITY {i}",
+            description=f"synthetic description of tractor part {i}",
+            rank=rng.randint(1, 50),
+        )
+        for i in range(num_entities)
+    ]
+    relationships = [
+        Relationship(
+            id=f"rel-{i}",
+            short_id=str(i),
+            source=f"ENTITY {rng.randrange(num_entities)}",
+            target=f"ENTITY {rng.randrange(num_entities)}",
+            description=f"relationship {i} between two synthetic tractor parts",
+            weight=rng.random(),
+            attributes={"rank": rng.randint(1, 100)},
+        )
+        for i in range(num_entities * 5)
+    ]
+    claims = [
+        Covariate(
+            id=f"claim-{i}",
+            short_id=str(i),
+            subject_id=f"ENTITY {rng.randrange(num_entities)}",
+            attributes={"description": f"claim {i} about a synthetic part"},
+        )
+        for i in range(num_entities)
+    ]
+    return (
+        entities,
+        RelationshipIndex(relationships),
+        {"claims": CovariateIndex(claims)},
+    )
+
+
+def _rebuild(selected_entities, relationships, covariates, token_encoder, max_tokens):
+    """Rebuild and re-tokenize the whole tables after each added entity."""
+    added_entities = []
+    final_context = []
+    fitted = 0
+    for entity in selected_entities:
+        added_entities.append(entity)
+        relationship_context, _ = build_relationship_context(
+            selected_entities=added_entities,
+            relationships=relationships,
+            token_encoder=token_encoder,
+            max_tokens=max_tokens,
+            include_relationship_weight=True,
+        )
+        current_context = [relationship_context]
+        total_tokens = num_tokens(relationship_context, token_encoder)
+        for name, values in covariates.items():
+            covariate_context, _ = build_covariates_context(
+                selected_entities=added_entities,
+                covariates=values,
+                token_encoder=token_encoder,
+                max_tokens=max_tokens,
+                context_name=name,
+            )
+            total_tokens += num_tokens(covariate_context, token_encoder)
+            current_context.append(covariate_context)
+        if total_tokens > max_tokens:
+            break
+        final_context, fitted = current_context, len(added_entities)
+    return final_context, fitted
+
+
+def _assemble(selected_entities, relationships, covariates, token_encoder, max_tokens):
+    assembler = LocalContextAssembler(
+        relationships=relationships,
+        covariates=covariates,
+        token_encoder=token_encoder,
+        include_relationship_weight=True,
+        max_tokens=max_tokens,
+    )
+    for entity in selected_entities:
+        if not assembler.add(entity, max_tokens=max_tokens):
+            break
+    context, _ = assembler.build()
+    return context, len(assembler.selected_entities)
+
+
+def _time(fn, repeat: int, *args) -> tuple[float, tuple]:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn(*args)
+    return (time.perf_counter() - start) / repeat * 1e3, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entities", type=int, default=20_000)
+    parser.add_argument("--max-tokens", type=int, default=20_000)
+    parser.add_argument("--encoding", default="cl100k_base")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    token_encoder = tiktoken.get_encoding(args.encoding)
+    entities, relationships, covariates = _synthetic_graph(args.entities)
+    rng = random.Random(1)
+
+    print(
+        f"{'k':>5}{'entities fit':>14}{'rebuild (ms)':>15}"
+        f"{'assembler (ms)':>16}{'speedup':>10}"
+    )
+    for k in [10, 50, 100]:
+        selected_entities = rng.sample(entities, k)
+        case = (selected_entities, relationships, covariates, token_encoder)
+        rebuild_time, (expected_context, expected_fit) = _time(
+            _rebuild, args.repeat, *case, args.max_tokens
+        )
+        assemble_time, (context, fit) = _time(
+            _assemble, args.repeat, *case, args.max_tokens
+        )
+        if (context, fit) != (expected_context, expected_fit):
+            msg = f"assembled context for k={k} differs from the rebuilt context"
+            raise AssertionError(msg)
+        print(
+            f"{k:>5}{fit:>14}{rebuild_time:>15.1f}{assemble_time:>16.1f}"
+            f"{rebuild_time / assemble_time:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
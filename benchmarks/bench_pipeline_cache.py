@@ -0,0 +1,57 @@
+"""Benchmark warm-cache probes of the JSON file cache against the SQLite cache.
+
+Writes the same synthetic LLM responses into a JsonPipelineCache and a
+SqlitePipelineCache, then times ``get`` on every key (a warm re-index probes
+each cached response once).
+
+    python benchmarks/bench_pipeline_cache.py --entries 20000 --value-bytes 2000
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "graphrag_lib"))
+
+from graphrag.index.cache import JsonPipelineCache, SqlitePipelineCache  # noqa: E402
+from graphrag.index.storage import FilePipelineStorage  # noqa: E402
+
+
+async def _fill(cache, keys, value):
+    for key in keys:
+        await cache.set(key, value, {"input": "synthetic prompt"})
+
+
+async def _probe(cache, keys, value) -> float:
+    start = time.perf_counter()
+    for key in keys:
+        if await cache.get(key) != value:
+            msg = f"cache returned a different value for {key}"
+            raise AssertionError(msg)
+    return (time.perf_counter() - start) / len(keys) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=20_000)
+    parser.add_argument("--value-bytes", type=int, default=2000)
+    args = parser.parse_args()
+
+    keys = [f"chat-{i:032x}" for i in range(args.entries)]
+    value = "r" * args.value_bytes
+    with tempfile.TemporaryDirectory() as root:
+        caches = {
+            "json files": JsonPipelineCache(FilePipelineStorage(root)).child("json"),
+            "sqlite": SqlitePipelineCache(Path(root) / "cache.sqlite").child("sqlite"),
+        }
+        print(f"{'cache':<12}{'probe (us)':>12}")
+        for name, cache in caches.items():
+            asyncio.run(_fill(cache, keys, value))
+            print(f"{name:<12}{asyncio.run(_probe(cache, keys, value)):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
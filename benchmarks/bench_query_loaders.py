@@ -0,0 +1,200 @@
+"""Benchmark the columnar query loaders against the previous row-wise loaders.
+
+Builds a synthetic index (100k entities by default) shaped like the graphrag
+output parquet tables and times ``read_entities``, ``read_relationships`` and
+``read_text_units`` against the ``df.iterrows()`` implementation they replaced.
+
+    python benchmarks/bench_query_loaders.py --entities 100000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "graphrag_lib"))
+
+from graphrag.model import Entity, Relationship, TextUnit  # noqa: E402
+from graphrag.query.input.loaders.dfs import (  # noqa: E402
+    read_entities,
+    read_relationships,
+    read_text_units,
+)
+from graphrag.query.input.loaders.utils import (  # noqa: E402
+    to_optional_int,
+    to_optional_list,
+    to_optional_str,
+    to_str,
+)
+
+
+def _iterrows_entities(df: pd.DataFrame) -> list[Entity]:
+    return [
+        Entity(
+            id=to_str(row, "id"),
+            short_id=to_optional_str(row, "human_readable_id"),
+            title=to_str(row, "name"),
+            type=to_optional_str(row, "type"),
+            description=to_optional_str(row, "description"),
+            description_embedding=to_optional_list(
+                row, "description_embedding", item_type=float
+            ),
+            community_ids=to_optional_list(row, "community", item_type=str),
+            text_unit_ids=to_optional_list(row, "text_unit_ids"),
+            rank=to_optional_int(row, "rank"),
+        )
+        for _, row in df.iterrows()
+    ]
+
+
+def _iterrows_relationships(df: pd.DataFrame) -> list[Relationship]:
+    return [
+        Relationship(
+            id=to_str(row, "id"),
+            short_id=to_optional_str(row, "human_readable_id"),
+            source=to_str(row, "source"),
+            target=to_str(row, "target"),
+            description=to_optional_str(row, "description"),
+            weight=float(row["weight"]),
+            text_unit_ids=to_optional_list(row, "text_unit_ids", item_type=str),
+            attributes={"rank": row.get("rank")},
+        )
+        for _, row in df.iterrows()
+    ]
+
+
+def _iterrows_text_units(df: pd.DataFrame) -> list[TextUnit]:
+    return [
+        TextUnit(
+            id=to_str(row, "id"),
+            short_id=str(idx),
+            text=to_str(row, "text"),
+            entity_ids=to_optional_list(row, "entity_ids", item_type=str),
+            relationship_ids=to_optional_list(row, "relationship_ids", item_type=str),
+            n_tokens=to_optional_int(row, "n_tokens"),
+            document_ids=to_optional_list(row, "document_ids", item_type=str),
+        )
+        for idx, row in df.iterrows()
+    ]
+
+
+def _synthetic_index(
+    num_entities: int, embedding_dim: int, seed: int = 0
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    rng = np.random.default_rng(seed)
+    num_relationships = num_entities * 2
+    num_text_units = max(num_entities // 10, 1)
+
+    def ids(prefix: str, n: int) -> list[str]:
+        return [f"{prefix}{i}" for i in range(n)]
+
+    def id_lists(prefix: str, n: int, upper: int, size: int) -> list[np.ndarray]:
+        return [
+            np.array([f"{prefix}{j}" for j in rng.integers(0, upper, size)], dtype=object)
+            for _ in range(n)
+        ]
+
+    entities = pd.DataFrame({
+        "id": ids("entity-", num_entities),
+        "human_readable_id": [str(i) for i in range(num_entities)],
+        "name": ids("ENTITY ", num_entities),
+        "type": rng.choice(["PART", "PROCEDURE", "MODEL"], num_entities),
+        "description": [f"synthetic description {i}" for i in range(num_entities)],
+        "community": [[str(c)] for c in rng.integers(0, 500, num_entities)],
+        "rank": rng.integers(1, 50, num_entities),
+        "description_embedding": list(
+            rng.random((num_entities, embedding_dim), dtype=np.float64)
+        ),
+        "text_unit_ids": id_lists("unit-", num_entities, num_text_units, 3),
+    })
+    relationships = pd.DataFrame({
+        "id": ids("rel-", num_relationships),
+        "human_readable_id": [str(i) for i in range(num_relationships)],
+        "source": rng.choice(entities["name"], num_relationships),
+        "target": rng.choice(entities["name"], num_relationships),
+        "description": [f"relationship {i}" for i in range(num_relationships)],
+        "weight": rng.random(num_relationships),
+        "rank": rng.integers(1, 100, num_relationships),
+        "text_unit_ids": id_lists("unit-", num_relationships, num_text_units, 2),
+    })
+    text_units = pd.DataFrame({
+        "id": ids("unit-", num_text_units),
+        "text": [f"chunk text {i} " * 40 for i in range(num_text_units)],
+        "n_tokens": rng.integers(100, 300, num_text_units),
+        "entity_ids": id_lists("entity-", num_text_units, num_entities, 10),
+        "relationship_ids": id_lists("rel-", num_text_units, num_relationships, 20),
+        "document_ids": id_lists("doc-", num_text_units, 10, 1),
+    })
+    return entities, relationships, text_units
+
+
+def _time(fn, *args, **kwargs) -> tuple[float, list]:
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entities", type=int, default=100_000)
+    parser.add_argument("--embedding-dim", type=int, default=1536)
+    args = parser.parse_args()
+
+    print(f"Building synthetic index: {args.entities} entities, dim={args.embedding_dim}")
+    entities_df, relationships_df, text_units_df = _synthetic_index(
+        args.entities, args.embedding_dim
+    )
+
+    cases = [
+        (
+            "entities",
+            lambda: _iterrows_entities(entities_df),
+            lambda: read_entities(
+                entities_df,
+                title_col="name",
+                short_id_col="human_readable_id",
+                community_col="community",
+                rank_col="rank",
+                name_embedding_col=None,
+                graph_embedding_col=None,
+                document_ids_col=None,
+            ),
+        ),
+        (
+            "relationships",
+            lambda: _iterrows_relationships(relationships_df),
+            lambda: read_relationships(
+                relationships_df,
+                short_id_col="human_readable_id",
+                description_embedding_col=None,
+                document_ids_col=None,
+                attributes_cols=["rank"],
+            ),
+        ),
+        (
+            "text_units",
+            lambda: _iterrows_text_units(text_units_df),
+            lambda: read_text_units(
+                text_units_df, short_id_col=None, covariates_col=None
+            ),
+        ),
+    ]
+
+    print(f"{'table':<15}{'rows':>10}{'iterrows (s)':>15}{'columnar (s)':>15}{'speedup':>10}")
+    for name, rowwise, columnar in cases:
+        rowwise_time, expected = _time(rowwise)
+        columnar_time, actual = _time(columnar)
+        if actual != expected:
+            msg = f"columnar {name} loader output differs from the row-wise loader"
+            raise AssertionError(msg)
+        print(
+            f"{name:<15}{len(actual):>10}{rowwise_time:>15.3f}{columnar_time:>15.3f}"
+            f"{rowwise_time / columnar_time:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Benchmark entity description search of the LanceDB store against the NumPy store.
+
+Loads the same synthetic unit-length embeddings into a LanceDBVectorStore and a
+NumpyVectorStore, then times ``similarity_search_by_vector`` without a filter and
+with a ``filter_by_id`` filter on a third of the documents, as local search does
+with included and excluded entities.
+
+    python benchmarks/bench_vector_store.py --documents 30000 --dimension 1536
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "graphrag_lib"))
+
+from graphrag.vector_stores import (  # noqa: E402
+    LanceDBVectorStore,
+    NumpyVectorStore,
+    VectorStoreDocument,
+)
+
+STORES = {"lancedb": LanceDBVectorStore, "numpy": NumpyVectorStore}
+
+
+def _documents(num_documents: int, dimension: int) -> list[VectorStoreDocument]:
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(num_documents, dimension))
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return [
+        VectorStoreDocument(
+            id=f"entity-{i}",
+            text=f"synthetic description of tractor part {i}",
+            vector=vector,
+            attributes={"title": f"ENTITY {i}"},
+        )
+        for i, vector in enumerate(vectors.tolist())
+    ]
+
+
+def _search(store, queries, k) -> tuple[float, list[list[str]]]:
+    store.similarity_search_by_vector(queries[0], k=k)
+    start = time.perf_counter()
+    ids = [
+        [result.document.id for result in store.similarity_search_by_vector(query, k=k)]
+        for query in queries
+    ]
+    return (time.perf_counter() - start) / len(queries) * 1e3, ids
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=30_000)
+    parser.add_argument("--dimension", type=int, default=1536)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--k", type=int, default=20)
+    parser.add_argument("--stores", default="lancedb,numpy")
+    args = parser.parse_args()
+
+    documents = _documents(args.documents, args.dimension)
+    rng = np.random.default_rng(1)
+    queries = rng.normal(size=(args.queries, args.dimension)).tolist()
+    include_ids = [document.id for document in documents[::3]]
+
+    print(f"{'store':>10}{'load (s)':>10}{'search (ms)':>13}{'filtered (ms)':>15}")
+    results = {}
+    with tempfile.TemporaryDirectory() as db_uri:
+        for name in args.stores.split(","):
+            store = STORES[name](collection_name="entity_description_embeddings")
+            store.connect(db_uri=db_uri)
+            start = time.perf_counter()
+            store.load_documents(documents)
+            load_time = time.perf_counter() - start
+
+            store.filter_by_id([])
+            search_time, ids = _search(store, queries, args.k)
+            store.filter_by_id(include_ids)
+            filtered_time, filtered_ids = _search(store, queries, args.k)
+            results[name] = (ids, filtered_ids)
+            print(f"{name:>10}{load_time:>10.2f}{search_time:>13.2f}{filtered_time:>15.2f}")
+
+    if len({str(ids) for ids in results.values()}) > 1:
+        msg = "the stores returned different documents"
+        raise AssertionError(msg)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Load test for domain routing against a local stub OpenAI server.
+
+Starts a stub ``/v1/chat/completions`` endpoint that answers after a fixed delay,
+then fires concurrent routing calls from inside one event loop, the way the
+FastAPI handlers run them. The blocking ``query_domain_routing`` serializes the
+calls (wall time ~ N * delay); ``aquery_domain_routing`` overlaps them
+(wall time ~ delay).
+
+Run from the repository root:
+
+    python benchmarks/load_test_routing.py --concurrency 20 --delay 0.5
+"""
+
+import argparse
+import asyncio
+import copy
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+
+import uvicorn
+from fastapi import FastAPI
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from config.configs import llm_config, web_config  # noqa: E402
+from llm.utils import get_llm  # noqa: E402
+from routing.domain_router import aquery_domain_routing, query_domain_routing  # noqa: E402
+
+
+def _create_stub_app(delay: float, answer: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(payload: dict):
+        await asyncio.sleep(delay)
+        return {
+            "id": "chatcmpl-stub",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": payload.get("model", "stub"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": answer},
+                "finish_reason": "stop",
+            }],
+            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+        }
+
+    return app
+
+
+def _start_stub_server(app: FastAPI) -> tuple[uvicorn.Server, int]:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning")
+    )
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server, port
+
+
+async def _run_sync_routing(llm, config, concurrency: int) -> float:
+    async def handler(i: int):
+        # what the handlers did before: a blocking call inside an async def
+        return query_domain_routing(f"질문 {i}", web_config.KR_DOMAINS, llm, config)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(handler(i) for i in range(concurrency)))
+    return time.perf_counter() - start
+
+
+async def _run_async_routing(llm, config, concurrency: int) -> float:
+    async def handler(i: int):
+        return await aquery_domain_routing(f"질문 {i}", web_config.KR_DOMAINS, llm, config)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(handler(i) for i in range(concurrency)))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--delay", type=float, default=0.5)
+    args = parser.parse_args()
+
+    server, port = _start_stub_server(
+        _create_stub_app(args.delay, web_config.KR_DOMAINS[0])
+    )
+
+    config = copy.deepcopy(llm_config)
+    config["llm"]["api_key"] = "stub"
+    config["llm"]["api_base"] = f"http://127.0.0.1:{port}/v1"
+    config["llm"]["max_retries"] = 1
+    llm = get_llm(config)
+
+    try:
+        sync_time = asyncio.run(_run_sync_routing(llm, config, args.concurrency))
+        async_time = asyncio.run(_run_async_routing(llm, config, args.concurrency))
+    finally:
+        server.should_exit = True
+
+    print(f"concurrency={args.concurrency} stub delay={args.delay:.2f}s")
+    print(f"  query_domain_routing  (blocking): {sync_time:.2f}s")
+    print(f"  aquery_domain_routing (async)   : {async_time:.2f}s")
+    if async_time * 2 > sync_time:
+        msg = "async routing did not overlap concurrent requests"
+        raise AssertionError(msg)
+
+
+if __name__ == "__main__":
+    main()
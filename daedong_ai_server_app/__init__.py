@@ -3,6 +3,7 @@ import threading
 import os 
 from pathlib import Path
 import time
+from dotenv import load_dotenv
 
 # from flask import Flask
 # from flask_cors import CORS
@@ -13,6 +14,8 @@ from fastapi.responses import FileResponse
 
 from config.configs import web_config, llm_config, rag_config, util_config
 from lance_db.FarmingLanceDBManager import FarmingLanceDBManager
+from graphrag_lib.graphrag.query.index_registry import get_index_registry
+from llm.client_registry import init_llm_client_registry
 from utils.farming_diary.farming_diary_utils import get_persons, get_all_works_date, get_search_works, add_work
 
 def create_app(PUBLIC_IP, HOST, PORT):
@@ -122,6 +125,19 @@ def create_app(PUBLIC_IP, HOST, PORT):
 
         # 데몬 스레드로 백그라운드 ingest (서버 스타트업 블로킹하지 않음)
         threading.Thread(target=db_ingest, daemon=True).start()
+
+        # LLM 클라이언트는 요청마다 만들지 않고 앱 전체에서 커넥션 풀을 공유
+        load_dotenv()
+        llm_config['llm']['api_key'] = os.getenv('token')
+        app.state.llm_clients = init_llm_client_registry(llm_config)
+        print(" ==> LLM client registry 초기화 완료")
+
+        # GraphRAG 도메인 인덱스를 미리 메모리에 적재 (이후 요청은 디스크를 다시 읽지 않음)
+        await get_index_registry().preload(
+            list(web_config.DOMAIN_TO_FOLDER_MAP.values()),
+            community_level=rag_config.COMMUNITY_LEVEL,
+        )
+        print(" ==> GraphRAG index preload 완료")
         
         # folders = get_persons(db)
         # print('Folders:', folders)
@@ -138,6 +154,11 @@ def create_app(PUBLIC_IP, HOST, PORT):
             if callable(close_fn):
                 close_fn()
             print(" ==> FarmingLanceDBManager 정리 완료")
+
+        llm_clients = getattr(app.state, "llm_clients", None)
+        if llm_clients is not None:
+            await llm_clients.aclose()
+            print(" ==> LLM client registry 정리 완료")
     
     @app.get("/")
     def read_root():
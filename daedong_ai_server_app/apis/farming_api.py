@@ -34,6 +34,7 @@ from graphrag_lib.graphrag.query.structured_search.local_search.system_prompt im
 from utils.sql_extraction.sql_extractor import sql_extraction
 from utils.recommand_business_list.business_list_filter import business_list_filtering
 from utils.farming_diary.farming_diary_utils import add_work as add_work_util
+from utils.farming_diary.farming_diary_utils import get_all_works_date, get_work_dates
 from utils.farming_diary.farming_diary_utils import delete_works_by_date as delete_works_by_date_util
 from lance_db.FarmingLanceDBManager import FarmingLanceDBManager
 
@@ -71,13 +72,7 @@ async def all_works_dates(request: Request, person: str):
     if db is None:
         raise HTTPException(status_code=500, detail="Farming DB not initialized")
     try:
-        sql = """
-        SELECT DISTINCT date FROM records
-        WHERE (person = ? OR pid = ? OR person_name = ?)
-        ORDER BY date ASC
-        """
-        rows = db.sql_query(sql, (person, person, person))
-        dates = [r["date"] for r in rows if r.get("date")]
+        dates = get_work_dates(db, person)
         return dates
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -92,12 +87,7 @@ async def get_works(request: Request, person: str, date: str):
     if db is None:
         raise HTTPException(status_code=500, detail="Farming DB not initialized")
     try:
-        sql = """
-        SELECT * FROM records
-        WHERE (person = ? OR pid = ? OR person_name = ?) AND date = ?
-        ORDER BY mtime ASC
-        """
-        rows = db.sql_query(sql, (person, person, person, date))
+        rows = get_all_works_date(db, person, date)
         return rows
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -5,20 +5,18 @@ from typing import List, Dict, Any
 from starlette.responses import StreamingResponse
 
 import json
-import os
-from dotenv import load_dotenv
 
 from config.configs import web_config, llm_config, rag_config, util_config
 from utils.parsing import message_parsing
 from web.stream import async_stream_generator, get_data_from_service #sync_stream_gen 
-from llm.utils import get_llm
-from routing.domain_router import query_domain_routing, get_domain_info
+from llm.client_registry import get_llm_client_registry
+from routing.domain_router import aquery_domain_routing, get_domain_info
 
 from graphrag_lib.graphrag.query import cli
 from graphrag_lib.graphrag.query.structured_search.local_search.system_prompt import (
     LOCAL_SEARCH_SYSTEM_PROMPT, LOCAL_SEARCH_SYSTEM_PROMPT_REF
 )
-from utils.sql_extraction.sql_extractor import sql_extraction
+from utils.sql_extraction.sql_extractor import asql_extraction
 from utils.recommand_business_list.business_list_filter import business_list_filtering
 
 # kr_api_bp = Blueprint('kr_ai_server_test', __name__)
@@ -51,16 +49,12 @@ async def kr_ai_server_test(chat_req: ChatRequest):
     query = message_parsing(messages, recent_message_num=2)
     print(f' ==> Query:\n{query}')
     
-    ## LLM
-    load_dotenv()
-    llm_config['llm']['api_key'] = os.getenv('token')
-    # print(config['llm']['api_key'])
-    
-    llm = get_llm(llm_config)
+    ## LLM (startup에서 만든 공유 클라이언트 재사용)
+    llm = get_llm_client_registry().get_llm(llm_config)
     
     ## Routing
     domains = web_config.KR_DOMAINS
-    domain_routing_response = query_domain_routing(query, domains, llm, llm_config)
+    domain_routing_response = await aquery_domain_routing(query, domains, llm, llm_config)
     domain_info = get_domain_info(domain_routing_response)
 
     reference = domain_info['reference']
@@ -70,7 +64,7 @@ async def kr_ai_server_test(chat_req: ChatRequest):
 
     ## Business Support
     if domain == '지원사업':
-        sql_filter = sql_extraction(query, llm, llm_config)
+        sql_filter = await asql_extraction(query, llm, llm_config)
         async_response_stream = await business_list_filtering(sql_filter, llm, llm_config, \
             stream=True, table_name=util_config.BUSINESS_LIST_TABLE_NAME, text_path=root_folder)
 
@@ -180,16 +174,12 @@ async def kr_ai_server(chat_req: ChatRequest):
     query = message_parsing(messages, recent_message_num=2)
     print(f' ==> Query:\n{query}')
     
-    ## LLM
-    load_dotenv()
-    llm_config['llm']['api_key'] = os.getenv('token')
-    # print(config['llm']['api_key'])
-    
-    llm = get_llm(llm_config)
+    ## LLM (startup에서 만든 공유 클라이언트 재사용)
+    llm = get_llm_client_registry().get_llm(llm_config)
     
     ## Routing
     domains = web_config.KR_DOMAINS
-    domain_routing_response = query_domain_routing(query, domains, llm, llm_config)
+    domain_routing_response = await aquery_domain_routing(query, domains, llm, llm_config)
     domain_info = get_domain_info(domain_routing_response)
 
     reference = domain_info['reference']
@@ -300,16 +290,12 @@ async def kr_farming_call_api(chat_req: ChatRequest):
     query = message_parsing(messages, recent_message_num=2)
     print(f' ==> Query:\n{query}')
     
-    ## LLM
-    load_dotenv()
-    llm_config['llm']['api_key'] = os.getenv('token')
-    # print(config['llm']['api_key'])
-    
-    llm = get_llm(llm_config)
+    ## LLM (startup에서 만든 공유 클라이언트 재사용)
+    llm = get_llm_client_registry().get_llm(llm_config)
     
     ## Routing
     domains = web_config.KR_DOMAINS
-    domain_routing_response = query_domain_routing(query, domains, llm, llm_config)
+    domain_routing_response = await aquery_domain_routing(query, domains, llm, llm_config)
     domain_info = get_domain_info(domain_routing_response)
 
     reference = domain_info['reference']
@@ -319,19 +305,19 @@ async def kr_farming_call_api(chat_req: ChatRequest):
 
     ## Business Support
     if domain == '영농일지_조회':
-        sql_filter = sql_extraction(query, llm, llm_config)
+        sql_filter = await asql_extraction(query, llm, llm_config)
         async_response_stream = await business_list_filtering(sql_filter, llm, llm_config, \
             stream=True, table_name=util_config.BUSINESS_LIST_TABLE_NAME, text_path=root_folder)
     if domain == '영농일지_삽입':
-        sql_filter = sql_extraction(query, llm, llm_config)
+        sql_filter = await asql_extraction(query, llm, llm_config)
         async_response_stream = await business_list_filtering(sql_filter, llm, llm_config, \
             stream=True, table_name=util_config.BUSINESS_LIST_TABLE_NAME, text_path=root_folder)
     if domain == '영농일지_삭제':
-        sql_filter = sql_extraction(query, llm, llm_config)
+        sql_filter = await asql_extraction(query, llm, llm_config)
         async_response_stream = await business_list_filtering(sql_filter, llm, llm_config, \
             stream=True, table_name=util_config.BUSINESS_LIST_TABLE_NAME, text_path=root_folder)
     if domain == '영농일지_수정':
-        sql_filter = sql_extraction(query, llm, llm_config)
+        sql_filter = await asql_extraction(query, llm, llm_config)
         async_response_stream = await business_list_filtering(sql_filter, llm, llm_config, \
             stream=True, table_name=util_config.BUSINESS_LIST_TABLE_NAME, text_path=root_folder)
     
@@ -359,6 +359,8 @@ def create_graphrag_config(
                 storage_account_blob_url=reader.str(Fragment.storage_account_blob_url),
                 container_name=reader.str(Fragment.container_name),
                 base_dir=reader.str(Fragment.base_dir) or defs.CACHE_BASE_DIR,
+                max_bytes=reader.int("max_bytes"),
+                compression=reader.str("compression"),
             )
         with (
             reader.envvar_prefix(Section.reporting),
@@ -428,6 +430,8 @@ def create_graphrag_config(
                 entity_types=reader.list("entity_types")
                 or defs.ENTITY_EXTRACTION_ENTITY_TYPES,
                 max_gleanings=max_gleanings,
+                gleaning_early_exit=reader.bool("gleaning_early_exit")
+                or defs.ENTITY_EXTRACTION_GLEANING_EARLY_EXIT,
                 prompt=reader.str("prompt", Fragment.prompt_file),
                 strategy=entity_extraction_config.get("strategy"),
                 encoding_model=reader.str(Fragment.encoding_model),
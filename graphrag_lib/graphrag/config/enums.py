@@ -19,6 +19,8 @@ class CacheType(str, Enum):
     """The none cache configuration type."""
     blob = "blob"
     """The blob cache configuration type."""
+    sqlite = "sqlite"
+    """The single-file SQLite cache configuration type."""
 
     def __repr__(self):
         """Get a string representation."""
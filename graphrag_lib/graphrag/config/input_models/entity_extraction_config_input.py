@@ -14,5 +14,6 @@ class EntityExtractionConfigInput(LLMConfigInput):
     prompt: NotRequired[str | None]
     entity_types: NotRequired[list[str] | str | None]
     max_gleanings: NotRequired[int | str | None]
+    gleaning_early_exit: NotRequired[bool | str | None]
     strategy: NotRequired[dict | None]
     encoding_model: NotRequired[str | None]
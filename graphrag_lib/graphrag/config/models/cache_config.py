@@ -27,3 +27,10 @@ class CacheConfig(BaseModel):
     storage_account_blob_url: str | None = Field(
         description="The storage account blob url to use.", default=None
     )
+    max_bytes: int | None = Field(
+        description="The size above which the sqlite cache evicts least recently used entries.",
+        default=None,
+    )
+    compression: str | None = Field(
+        description="The compression for sqlite cache values (zstd).", default=None
+    )
@@ -26,6 +26,10 @@ class EntityExtractionConfig(LLMConfig):
         description="The maximum number of entity gleanings to use.",
         default=defs.ENTITY_EXTRACTION_MAX_GLEANINGS,
     )
+    gleaning_early_exit: bool = Field(
+        description="Stop gleaning a text unit once a pass finds no new entities or relationships.",
+        default=defs.ENTITY_EXTRACTION_GLEANING_EARLY_EXIT,
+    )
     strategy: dict | None = Field(
         description="Override the default entity extraction strategy", default=None
     )
@@ -47,6 +51,7 @@ class EntityExtractionConfig(LLMConfig):
             if self.prompt
             else None,
             "max_gleanings": self.max_gleanings,
+            "gleaning_early_exit": self.gleaning_early_exit,
             # It's prechunked in create_base_text_units
             "encoding_name": self.encoding_model or encoding_model,
             "prechunked": True,
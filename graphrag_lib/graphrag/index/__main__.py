@@ -7,7 +7,9 @@ import argparse
 
 from graphrag.utils.cli import dir_exist, file_exist
 
-from .cli import index_cli
+from .api import DEFAULT_MAX_CONCURRENT_DOMAINS
+from .cli import batch_index_cli, index_cli
+from .run.scheduler import DEFAULT_MAX_CONCURRENT_WORKFLOWS
 from .emit.types import TableEmitterType
 from .progress.types import ReporterType
 
@@ -88,6 +90,49 @@ if __name__ == "__main__":
         default=None,
         type=str,
     )
+    parser.add_argument(
+        "--max-concurrent-workflows",
+        help=f"How many workflows whose dependencies are met may run at the same time. Default: {DEFAULT_MAX_CONCURRENT_WORKFLOWS}",
+        required=False,
+        default=DEFAULT_MAX_CONCURRENT_WORKFLOWS,
+        type=int,
+    )
+    parser.add_argument(
+        "--batch-roots",
+        help="Index several root directories in one process, sharing the LLM rate limits and connection pool",
+        nargs="+",
+        required=False,
+        default=None,
+        type=dir_exist,
+    )
+    parser.add_argument(
+        "--max-concurrent-domains",
+        help=f"With --batch-roots, how many roots may be indexed at the same time. Default: {DEFAULT_MAX_CONCURRENT_DOMAINS}",
+        required=False,
+        default=DEFAULT_MAX_CONCURRENT_DOMAINS,
+        type=int,
+    )
+    parser.add_argument(
+        "--tpm",
+        help="With --batch-roots, the tokens per minute shared by all roots, per model. Default: from each settings.yaml",
+        required=False,
+        default=None,
+        type=int,
+    )
+    parser.add_argument(
+        "--rpm",
+        help="With --batch-roots, the requests per minute shared by all roots, per model. Default: from each settings.yaml",
+        required=False,
+        default=None,
+        type=int,
+    )
+    parser.add_argument(
+        "--concurrent-requests",
+        help="With --batch-roots, the in-flight requests shared by all roots, per model. Default: from each settings.yaml",
+        required=False,
+        default=None,
+        type=int,
+    )
     parser.add_argument(
         "--output",
         help="The output directory to use for the pipeline.",
@@ -101,6 +146,22 @@ if __name__ == "__main__":
         msg = "Cannot resume and update a run at the same time"
         raise ValueError(msg)
 
+    if args.batch_roots:
+        batch_index_cli(
+            root_dirs=args.batch_roots,
+            verbose=args.verbose,
+            memprofile=args.memprofile,
+            nocache=args.nocache,
+            reporter=args.reporter,
+            emit=[TableEmitterType(value) for value in args.emit.split(",")],
+            skip_validations=args.skip_validations,
+            max_concurrent_workflows=args.max_concurrent_workflows,
+            max_concurrent_domains=args.max_concurrent_domains,
+            tokens_per_minute=args.tpm,
+            requests_per_minute=args.rpm,
+            concurrent_requests=args.concurrent_requests,
+        )
+
     index_cli(
         root_dir=args.root,
         verbose=args.verbose,
@@ -115,4 +176,5 @@ if __name__ == "__main__":
         init=args.init,
         skip_validations=args.skip_validations,
         output_dir=args.output,
+        max_concurrent_workflows=args.max_concurrent_workflows,
     )
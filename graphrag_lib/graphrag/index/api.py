@@ -8,7 +8,12 @@ WARNING: This API is under development and may undergo changes in future release
 Backwards compatibility is not guaranteed at this time.
 """
 
-from graphrag.config import CacheType, GraphRagConfig
+import asyncio
+
+import httpx
+
+from graphrag.config import CacheType, GraphRagConfig, LLMConfig
+from graphrag.llm.openai import set_shared_http_client
 
 from .cache.noop_pipeline_cache import NoopPipelineCache
 from .create_pipeline_config import create_pipeline_config
@@ -17,8 +22,11 @@ from .progress import (
     ProgressReporter,
 )
 from .run import run_pipeline_with_config
+from .run.scheduler import DEFAULT_MAX_CONCURRENT_WORKFLOWS
 from .typing import PipelineRunResult
 
+DEFAULT_MAX_CONCURRENT_DOMAINS = 4
+
 
 async def build_index(
     config: GraphRagConfig,
@@ -28,6 +36,7 @@ async def build_index(
     memory_profile: bool = False,
     progress_reporter: ProgressReporter | None = None,
     emit: list[TableEmitterType] = [TableEmitterType.Parquet],  # noqa: B006
+    max_concurrent_workflows: int = DEFAULT_MAX_CONCURRENT_WORKFLOWS,
 ) -> list[PipelineRunResult]:
     """Run the pipeline with the given configuration.
 
@@ -48,6 +57,8 @@ async def build_index(
     emit : list[str]
         The list of emitter types to emit.
         Accepted values {"parquet", "csv"}.
+    max_concurrent_workflows : int
+        How many workflows whose dependencies are met may run at the same time.
 
     Returns
     -------
@@ -72,6 +83,7 @@ async def build_index(
         emit=emit,
         is_resume_run=is_resume_run,
         is_update_run=is_update_run,
+        max_concurrent_workflows=max_concurrent_workflows,
     ):
         outputs.append(output)
         if progress_reporter:
@@ -81,3 +93,110 @@ async def build_index(
                 progress_reporter.success(output.workflow)
             progress_reporter.info(str(output.result))
     return outputs
+
+
+async def build_indexes(
+    configs: dict[str, GraphRagConfig],
+    run_id: str = "",
+    memory_profile: bool = False,
+    progress_reporter: ProgressReporter | None = None,
+    emit: list[TableEmitterType] = [TableEmitterType.Parquet],  # noqa: B006
+    max_concurrent_workflows: int = DEFAULT_MAX_CONCURRENT_WORKFLOWS,
+    max_concurrent_domains: int = DEFAULT_MAX_CONCURRENT_DOMAINS,
+    tokens_per_minute: int | None = None,
+    requests_per_minute: int | None = None,
+    concurrent_requests: int | None = None,
+    max_connections: int = 100,
+) -> dict[str, list[PipelineRunResult]]:
+    """Index several GraphRAG roots in one process.
+
+    The pipelines share the process-wide TPM/RPM limiters (one per model, see
+    `create_tpm_rpm_limiters`) and a single HTTP connection pool, so while one
+    domain is in a CPU-bound stage the others keep the LLM budget busy.
+
+    Parameters
+    ----------
+    configs : dict[str, GraphRagConfig]
+        The configuration of each root, keyed by a display name.
+    run_id : str
+        The run id shared by all domains.
+    memory_profile : bool
+        Whether to enable memory profiling.
+    progress_reporter : ProgressReporter | None default=None
+        The progress reporter. Each domain reports through a child reporter.
+    emit : list[str]
+        The list of emitter types to emit.
+        Accepted values {"parquet", "csv"}.
+    max_concurrent_workflows : int
+        How many workflows of a single domain may run at the same time.
+    max_concurrent_domains : int
+        How many domains may be indexed at the same time.
+    tokens_per_minute : int | None default=None
+        The TPM budget shared by all domains, per model. Overrides the configs.
+    requests_per_minute : int | None default=None
+        The RPM budget shared by all domains, per model. Overrides the configs.
+    concurrent_requests : int | None default=None
+        The in-flight request limit shared by all domains, per model. Overrides the configs.
+    max_connections : int
+        The size of the shared HTTP connection pool.
+
+    Returns
+    -------
+    dict[str, list[PipelineRunResult]]
+        The pipeline run results of each domain
+    """
+    # the limiters are created once per model, so every config must agree on the budget
+    for config in configs.values():
+        _apply_llm_budget(
+            config, tokens_per_minute, requests_per_minute, concurrent_requests
+        )
+
+    semaphore = asyncio.Semaphore(max_concurrent_domains)
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        )
+    )
+    set_shared_http_client(http_client)
+
+    async def run(name: str, config: GraphRagConfig) -> list[PipelineRunResult]:
+        async with semaphore:
+            reporter = progress_reporter.child(name) if progress_reporter else None
+            try:
+                return await build_index(
+                    config=config,
+                    run_id=run_id,
+                    memory_profile=memory_profile,
+                    progress_reporter=reporter,
+                    emit=emit,
+                    max_concurrent_workflows=max_concurrent_workflows,
+                )
+            except Exception as e:  # noqa: BLE001
+                # one broken domain must not abort the others
+                return [PipelineRunResult("input", None, [e])]
+
+    try:
+        results = await asyncio.gather(
+            *(run(name, config) for name, config in configs.items())
+        )
+    finally:
+        set_shared_http_client(None)
+        await http_client.aclose()
+    return dict(zip(configs, results, strict=True))
+
+
+def _apply_llm_budget(
+    config: GraphRagConfig,
+    tokens_per_minute: int | None,
+    requests_per_minute: int | None,
+    concurrent_requests: int | None,
+) -> None:
+    llm_configs = [config, *(v for v in vars(config).values() if isinstance(v, LLMConfig))]
+    for llm_config in llm_configs:
+        if tokens_per_minute is not None:
+            llm_config.llm.tokens_per_minute = tokens_per_minute
+        if requests_per_minute is not None:
+            llm_config.llm.requests_per_minute = requests_per_minute
+        if concurrent_requests is not None:
+            llm_config.llm.concurrent_requests = concurrent_requests
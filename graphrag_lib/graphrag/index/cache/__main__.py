@@ -0,0 +1,46 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Compact a SQLite pipeline cache."""
+
+import argparse
+
+from .sqlite_pipeline_cache import SqlitePipelineCache
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog="python -m graphrag.index.cache",
+        description="Compact a SQLite pipeline cache, optionally importing a JSON file cache first",
+    )
+    parser.add_argument("path", help="The cache file, e.g. <root>/cache/cache.sqlite")
+    parser.add_argument(
+        "--import-dir",
+        help="A JSON file cache directory (cache.type: file) to import",
+        default=None,
+    )
+    parser.add_argument(
+        "--max-bytes",
+        help="Evict least recently used entries down to this size",
+        type=int,
+        default=None,
+    )
+    parser.add_argument(
+        "--compression",
+        help="Compress the imported values",
+        choices=["zstd"],
+        default=None,
+    )
+    args = parser.parse_args()
+
+    cache = SqlitePipelineCache(args.path, args.max_bytes, args.compression)
+    if args.import_dir:
+        print(f"imported {cache.import_json_cache(args.import_dir)} entries")  # noqa: T201
+    before = cache.stats()
+    cache.compact()
+    after = cache.stats()
+    cache.close()
+    print(  # noqa: T201
+        f"{after['entries']} entries, {after['bytes']} value bytes, "
+        f"file {before['file_bytes']} -> {after['file_bytes']} bytes"
+    )
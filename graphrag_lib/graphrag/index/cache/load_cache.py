@@ -5,12 +5,14 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
 from graphrag.config.enums import CacheType
 from graphrag.index.config.cache import (
     PipelineBlobCacheConfig,
     PipelineFileCacheConfig,
+    PipelineSqliteCacheConfig,
 )
 from graphrag.index.storage import BlobPipelineStorage, FilePipelineStorage
 
@@ -22,6 +24,7 @@ if TYPE_CHECKING:
 from .json_pipeline_cache import JsonPipelineCache
 from .memory_pipeline_cache import create_memory_cache
 from .noop_pipeline_cache import NoopPipelineCache
+from .sqlite_pipeline_cache import DEFAULT_CACHE_FILENAME, SqlitePipelineCache
 
 
 def load_cache(config: PipelineCacheConfig | None, root_dir: str | None):
@@ -38,6 +41,10 @@ def load_cache(config: PipelineCacheConfig | None, root_dir: str | None):
             config = cast(PipelineFileCacheConfig, config)
             storage = FilePipelineStorage(root_dir).child(config.base_dir)
             return JsonPipelineCache(storage)
+        case CacheType.sqlite:
+            config = cast(PipelineSqliteCacheConfig, config)
+            path = Path(root_dir or "") / (config.base_dir or "") / DEFAULT_CACHE_FILENAME
+            return SqlitePipelineCache(path, config.max_bytes, config.compression)
         case CacheType.blob:
             config = cast(PipelineBlobCacheConfig, config)
             storage = BlobPipelineStorage(
@@ -34,6 +34,34 @@ class PipelineCache(metaclass=ABCMeta):
             - value - The value to set.
         """
 
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Get the values of the given keys that are cached.
+
+        Args:
+            - keys - The keys to get the values for.
+
+        Returns
+        -------
+            - output - The cached values, keyed by key. Missing keys are left out.
+        """
+        values = {key: await self.get(key) for key in keys}
+        return {key: value for key, value in values.items() if value is not None}
+
+    async def set_many(
+        self, items: dict[str, Any], debug_data: dict | None = None
+    ) -> None:
+        """Set the values for the given keys.
+
+        Args:
+            - items - The values to set, keyed by key.
+            - debug_data - The debug data stored with every value.
+        """
+        for key, value in items.items():
+            await self.set(key, value, debug_data)
+
+    async def flush(self) -> None:
+        """Write the updates the cache has buffered, if any, to its storage."""
+
     @abstractmethod
     async def has(self, key: str) -> bool:
         """Return True if the given key exists in the cache.
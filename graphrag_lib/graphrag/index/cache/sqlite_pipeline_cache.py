@@ -0,0 +1,411 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing 'SqlitePipelineCache' model."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from .pipeline_cache import PipelineCache
+
+log = logging.getLogger(__name__)
+
+DEFAULT_CACHE_FILENAME = "cache.sqlite"
+
+_CODEC_RAW = 0
+_CODEC_ZSTD = 1
+# touches are buffered so that cache hits do not each open a write transaction
+_TOUCH_FLUSH_SIZE = 1000
+_TOUCH_FLUSH_SECONDS = 30.0
+# evict down to this fraction of max_bytes so that eviction does not run on every set
+_EVICT_TARGET = 0.9
+
+
+class _SqliteCacheDatabase:
+    """The single cache file shared by a root cache and all of its children."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_bytes: int | None = None,
+        compression: str | None = None,
+    ):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._compressor = None
+        self._decompressor = None
+        if compression is not None or _needs_zstd(self.path):
+            self._load_zstd(compression)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                codec INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cache_last_access ON cache(last_access)"
+        )
+        self._total_bytes = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM cache"
+        ).fetchone()[0]
+        self._touched: dict[str, float] = {}
+        self._touches_flushed_at = time.monotonic()
+
+    def _load_zstd(self, compression: str | None) -> None:
+        if compression not in (None, "zstd"):
+            msg = f"Unknown cache compression: {compression}"
+            raise ValueError(msg)
+        try:
+            import zstandard
+        except ImportError as e:
+            msg = "zstd cache compression requires the 'zstandard' package"
+            raise ImportError(msg) from e
+        if compression == "zstd":
+            self._compressor = zstandard.ZstdCompressor(level=3)
+        self._decompressor = zstandard.ZstdDecompressor()
+
+    def _encode(self, data: dict) -> tuple[bytes, int]:
+        raw = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        if self._compressor is not None:
+            return self._compressor.compress(raw), _CODEC_ZSTD
+        return raw, _CODEC_RAW
+
+    def _decode(self, value: bytes, codec: int) -> dict | None:
+        try:
+            if codec == _CODEC_ZSTD:
+                if self._decompressor is None:
+                    self._load_zstd(None)
+                value = self._decompressor.decompress(value)  # type: ignore[union-attr]
+            return json.loads(value)
+        except (UnicodeDecodeError, json.decoder.JSONDecodeError):
+            return None
+
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        if not keys:
+            return {}
+        found: dict[str, Any] = {}
+        corrupt: list[str] = []
+        with self._lock:
+            # stay below SQLITE_MAX_VARIABLE_NUMBER
+            for i in range(0, len(keys), 500):
+                chunk = keys[i : i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, value, codec FROM cache WHERE key IN ({placeholders})",  # noqa: S608
+                    chunk,
+                ).fetchall()
+                for key, value, codec in rows:
+                    data = self._decode(value, codec)
+                    if data is None:
+                        corrupt.append(key)
+                    else:
+                        found[key] = data.get("result")
+            now = time.time()
+            for key in found:
+                self._touched[key] = now
+            if (
+                len(self._touched) >= _TOUCH_FLUSH_SIZE
+                or time.monotonic() - self._touches_flushed_at >= _TOUCH_FLUSH_SECONDS
+            ):
+                self._flush_touches()
+        if corrupt:
+            self.delete_many(corrupt)
+        return found
+
+    def has(self, key: str) -> bool:
+        with self._lock:
+            return (
+                self._conn.execute(
+                    "SELECT 1 FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+                is not None
+            )
+
+    def set_many(self, items: Iterable[tuple[str, Any, dict | None]]) -> None:
+        now = time.time()
+        rows = []
+        for key, value, debug_data in items:
+            if value is None:
+                continue
+            encoded, codec = self._encode({"result": value, **(debug_data or {})})
+            rows.append((key, encoded, codec, len(encoded), now))
+        if not rows:
+            return
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                replaced = self._sizes([row[0] for row in rows])
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO cache(key, value, codec, size, last_access)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._total_bytes += sum(row[3] for row in rows) - replaced
+            if self.max_bytes is not None and self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def delete_many(self, keys: list[str]) -> None:
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                removed = self._sizes(keys)
+                self._conn.executemany(
+                    "DELETE FROM cache WHERE key = ?", [(key,) for key in keys]
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._total_bytes -= removed
+            for key in keys:
+                self._touched.pop(key, None)
+
+    def clear(self, prefix: str) -> None:
+        with self._lock:
+            self._touched.clear()
+            if prefix:
+                self._conn.execute(
+                    "DELETE FROM cache WHERE substr(key, 1, ?) = ?",
+                    (len(prefix), prefix),
+                )
+            else:
+                self._conn.execute("DELETE FROM cache")
+            self._total_bytes = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM cache"
+            ).fetchone()[0]
+
+    def compact(self) -> None:
+        with self._lock:
+            self._flush_touches()
+            if self.max_bytes is not None and self._total_bytes > self.max_bytes:
+                self._evict()
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self._conn.execute("VACUUM")
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+        return {
+            "entries": entries,
+            "bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+            "file_bytes": self.path.stat().st_size if self.path.exists() else 0,
+        }
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_touches()
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_touches()
+            self._conn.close()
+
+    def _sizes(self, keys: list[str]) -> int:
+        total = 0
+        for i in range(0, len(keys), 500):
+            chunk = keys[i : i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            total += self._conn.execute(
+                f"SELECT COALESCE(SUM(size), 0) FROM cache WHERE key IN ({placeholders})",  # noqa: S608
+                chunk,
+            ).fetchone()[0]
+        return total
+
+    def _flush_touches(self) -> None:
+        self._touches_flushed_at = time.monotonic()
+        if not self._touched:
+            return
+        # one transaction, the connection would otherwise commit every row
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.executemany(
+                "UPDATE cache SET last_access = ? WHERE key = ?",
+                [(ts, key) for key, ts in self._touched.items()],
+            )
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._touched.clear()
+
+    def _evict(self) -> None:
+        """Delete the least recently used entries until under the target size."""
+        self._flush_touches()
+        target = int(self.max_bytes * _EVICT_TARGET)  # type: ignore[operator]
+        to_free = self._total_bytes - target
+        victims: list[str] = []
+        freed = 0
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM cache ORDER BY last_access ASC"
+        ):
+            if freed >= to_free:
+                break
+            victims.append(key)
+            freed += size
+        self._conn.execute("BEGIN")
+        self._conn.executemany(
+            "DELETE FROM cache WHERE key = ?", [(key,) for key in victims]
+        )
+        self._conn.execute("COMMIT")
+        self._total_bytes -= freed
+        log.info(
+            "evicted %d cache entries (%d bytes) from %s", len(victims), freed, self.path
+        )
+
+
+def _needs_zstd(path: Path) -> bool:
+    if not path.exists():
+        return False
+    try:
+        with sqlite3.connect(path) as conn:
+            return (
+                conn.execute(
+                    "SELECT 1 FROM cache WHERE codec = ? LIMIT 1", (_CODEC_ZSTD,)
+                ).fetchone()
+                is not None
+            )
+    except sqlite3.OperationalError:
+        return False
+
+
+class SqlitePipelineCache(PipelineCache):
+    """Single-file SQLite pipeline cache with size-based LRU eviction."""
+
+    _db: _SqliteCacheDatabase
+    _prefix: str
+
+    def __init__(
+        self,
+        path: str | Path | _SqliteCacheDatabase,
+        max_bytes: int | None = None,
+        compression: str | None = None,
+        prefix: str = "",
+    ):
+        """Init method definition.
+
+        Args:
+            - path - The cache file, or the database of the parent cache.
+            - max_bytes - Evict the least recently used entries above this many (stored) bytes.
+            - compression - "zstd" to compress new values; requires the zstandard package.
+        """
+        self._db = (
+            path
+            if isinstance(path, _SqliteCacheDatabase)
+            else _SqliteCacheDatabase(path, max_bytes, compression)
+        )
+        self._prefix = prefix
+
+    # the sqlite calls block, so they run in worker threads to keep the event loop free
+
+    async def get(self, key: str) -> Any:
+        """Get method definition."""
+        key = self._prefix + key
+        found = await asyncio.to_thread(self._db.get_many, [key])
+        return found.get(key)
+
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Get the values of the given keys that are cached."""
+        found = await asyncio.to_thread(
+            self._db.get_many, [self._prefix + key for key in keys]
+        )
+        offset = len(self._prefix)
+        return {key[offset:]: value for key, value in found.items()}
+
+    async def set(self, key: str, value: Any, debug_data: dict | None = None) -> None:
+        """Set method definition."""
+        await asyncio.to_thread(
+            self._db.set_many, [(self._prefix + key, value, debug_data)]
+        )
+
+    async def set_many(
+        self, items: dict[str, Any], debug_data: dict | None = None
+    ) -> None:
+        """Set several values in one transaction."""
+        await asyncio.to_thread(
+            self._db.set_many,
+            [(self._prefix + key, value, debug_data) for key, value in items.items()],
+        )
+
+    async def has(self, key: str) -> bool:
+        """Has method definition."""
+        return await asyncio.to_thread(self._db.has, self._prefix + key)
+
+    async def delete(self, key: str) -> None:
+        """Delete method definition."""
+        await asyncio.to_thread(self._db.delete_many, [self._prefix + key])
+
+    async def clear(self) -> None:
+        """Clear method definition."""
+        await asyncio.to_thread(self._db.clear, self._prefix)
+
+    async def flush(self) -> None:
+        """Write the buffered LRU updates to the cache file."""
+        await asyncio.to_thread(self._db.flush)
+
+    def child(self, name: str) -> SqlitePipelineCache:
+        """Child method definition."""
+        return SqlitePipelineCache(self._db, prefix=f"{self._prefix}{name}/")
+
+    def compact(self) -> None:
+        """Apply pending LRU updates and eviction, then reclaim free space in the file."""
+        self._db.compact()
+
+    def stats(self) -> dict[str, Any]:
+        """Return the entry count and sizes of the cache file."""
+        return self._db.stats()
+
+    def close(self) -> None:
+        """Close the cache file."""
+        self._db.close()
+
+    def import_json_cache(self, cache_dir: str | Path) -> int:
+        """Import the files written by JsonPipelineCache under `cache_dir`."""
+        root = Path(cache_dir)
+        imported = 0
+        batch: list[tuple[str, Any, dict | None]] = []
+        for file in root.rglob("*"):
+            if not file.is_file() or file.resolve() == self._db.path.resolve():
+                continue
+            try:
+                data = json.loads(file.read_text(encoding="utf-8"))
+            except (UnicodeDecodeError, json.decoder.JSONDecodeError):
+                continue
+            if not isinstance(data, dict) or "result" not in data:
+                continue
+            key = self._prefix + file.relative_to(root).as_posix()
+            result = data.pop("result")
+            batch.append((key, result, data))
+            if len(batch) >= 1000:
+                self._db.set_many(batch)
+                imported += len(batch)
+                batch = []
+        self._db.set_many(batch)
+        return imported + len(batch)
+
@@ -18,7 +18,8 @@ from graphrag.config import (
     resolve_paths,
 )
 
-from .api import build_index
+from .api import DEFAULT_MAX_CONCURRENT_DOMAINS, build_index, build_indexes
+from .run.scheduler import DEFAULT_MAX_CONCURRENT_WORKFLOWS
 from .emit.types import TableEmitterType
 from .graph.extractors.claims.prompts import CLAIM_EXTRACTION_PROMPT
 from .graph.extractors.community_reports.prompts import COMMUNITY_REPORT_PROMPT
@@ -116,6 +117,7 @@ def index_cli(
     dryrun: bool,
     skip_validations: bool,
     output_dir: str | None,
+    max_concurrent_workflows: int = DEFAULT_MAX_CONCURRENT_WORKFLOWS,
 ):
     """Run the pipeline with the given config."""
     progress_reporter = load_progress_reporter(reporter)
@@ -169,6 +171,7 @@ def index_cli(
             memory_profile=memprofile,
             progress_reporter=progress_reporter,
             emit=emit,
+            max_concurrent_workflows=max_concurrent_workflows,
         )
     )
     encountered_errors = any(
@@ -186,6 +189,71 @@ def index_cli(
     sys.exit(1 if encountered_errors else 0)
 
 
+def batch_index_cli(
+    root_dirs: list[str],
+    verbose: bool,
+    memprofile: bool,
+    nocache: bool,
+    reporter: ReporterType,
+    emit: list[TableEmitterType],
+    skip_validations: bool,
+    max_concurrent_workflows: int = DEFAULT_MAX_CONCURRENT_WORKFLOWS,
+    max_concurrent_domains: int = DEFAULT_MAX_CONCURRENT_DOMAINS,
+    tokens_per_minute: int | None = None,
+    requests_per_minute: int | None = None,
+    concurrent_requests: int | None = None,
+):
+    """Index several roots in one process with a shared LLM budget."""
+    progress_reporter = load_progress_reporter(reporter)
+    info, error, success = _logger(progress_reporter)
+    run_id = time.strftime("%Y%m%d-%H%M%S")
+
+    configs = {}
+    for root_dir in dict.fromkeys(root_dirs):
+        root = Path(root_dir).resolve()
+        config = load_config(root)
+        resolve_paths(config, run_id)
+        if nocache:
+            config.cache.type = CacheType.none
+        if skip_validations:
+            validate_config_names(progress_reporter, config)
+        enable_logging_with_config(config, verbose)
+        configs[root.name] = config
+
+    info(f"Starting batch pipeline run for: {run_id}, roots={list(configs)}", True)
+    _register_signal_handlers(progress_reporter)
+
+    start = time.time()
+    outputs = asyncio.run(
+        build_indexes(
+            configs,
+            run_id=run_id,
+            memory_profile=memprofile,
+            progress_reporter=progress_reporter,
+            emit=emit,
+            max_concurrent_workflows=max_concurrent_workflows,
+            max_concurrent_domains=max_concurrent_domains,
+            tokens_per_minute=tokens_per_minute,
+            requests_per_minute=requests_per_minute,
+            concurrent_requests=concurrent_requests,
+        )
+    )
+    failed = [
+        name
+        for name, results in outputs.items()
+        if any(output.errors and len(output.errors) > 0 for output in results)
+    ]
+
+    progress_reporter.stop()
+    info(f"Indexed {len(outputs)} roots in {time.time() - start:.1f}s", True)
+    if failed:
+        error(f"Errors occurred while indexing {failed}, see logs for more details.", True)
+    else:
+        success("All roots indexed successfully.", True)
+
+    sys.exit(1 if failed else 0)
+
+
 def _initialize_project_at(path: str, reporter: ProgressReporter) -> None:
     """Initialize the project at the given path."""
     reporter.info(f"Initializing project at {path}")
@@ -10,6 +10,7 @@ from .cache import (
     PipelineFileCacheConfig,
     PipelineMemoryCacheConfig,
     PipelineNoneCacheConfig,
+    PipelineSqliteCacheConfig,
 )
 from .input import (
     PipelineCSVInputConfig,
@@ -58,6 +59,7 @@ __all__ = [
     "PipelineMemoryCacheConfig",
     "PipelineMemoryStorageConfig",
     "PipelineNoneCacheConfig",
+    "PipelineSqliteCacheConfig",
     "PipelineReportingConfig",
     "PipelineReportingConfigTypes",
     "PipelineStorageConfig",
@@ -74,8 +74,32 @@ class PipelineBlobCacheConfig(PipelineCacheConfig[Literal[CacheType.blob]]):
     """The storage account blob url for cache"""
 
 
+class PipelineSqliteCacheConfig(PipelineCacheConfig[Literal[CacheType.sqlite]]):
+    """Represent the SQLite cache configuration for the pipeline."""
+
+    type: Literal[CacheType.sqlite] = CacheType.sqlite
+    """The type of cache."""
+
+    base_dir: str | None = pydantic_Field(
+        description="The base directory for the cache file.", default=None
+    )
+    """The base directory for the cache file."""
+
+    max_bytes: int | None = pydantic_Field(
+        description="The size above which least recently used entries are evicted.",
+        default=None,
+    )
+    """The size above which least recently used entries are evicted."""
+
+    compression: str | None = pydantic_Field(
+        description="The compression for cached values (zstd).", default=None
+    )
+    """The compression for cached values (zstd)."""
+
+
 PipelineCacheConfigTypes = (
     PipelineFileCacheConfig
+    | PipelineSqliteCacheConfig
     | PipelineMemoryCacheConfig
     | PipelineBlobCacheConfig
     | PipelineNoneCacheConfig
@@ -27,6 +27,12 @@ class PipelineRunStats:
     workflows: dict[str, dict[str, float]] = field(default_factory=dict)
     """A dictionary of workflows."""
 
+    llm: dict[str, dict] = field(default_factory=dict)
+    """The process-wide LLM limiter counters per model/deployment."""
+
+    gleaning: dict[str, int] = field(default_factory=dict)
+    """The process-wide entity extraction gleaning counters."""
+
 
 @dc_dataclass
 class PipelineRunContext:
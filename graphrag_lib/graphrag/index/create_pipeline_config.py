@@ -24,6 +24,7 @@ from graphrag.index.config.cache import (
     PipelineFileCacheConfig,
     PipelineMemoryCacheConfig,
     PipelineNoneCacheConfig,
+    PipelineSqliteCacheConfig,
 )
 from graphrag.index.config.input import (
     PipelineCSVInputConfig,
@@ -538,6 +539,13 @@ def _get_cache_config(
         case CacheType.file:
             # relative to root dir
             return PipelineFileCacheConfig(base_dir=settings.cache.base_dir)
+        case CacheType.sqlite:
+            # relative to root dir
+            return PipelineSqliteCacheConfig(
+                base_dir=settings.cache.base_dir,
+                max_bytes=settings.cache.max_bytes,
+                compression=settings.cache.compression,
+            )
         case CacheType.none:
             return PipelineNoneCacheConfig()
         case CacheType.blob:
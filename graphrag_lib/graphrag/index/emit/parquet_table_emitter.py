@@ -3,6 +3,7 @@
 
 """ParquetTableEmitter module."""
 
+import asyncio
 import logging
 import traceback
 
@@ -37,7 +38,8 @@ class ParquetTableEmitter(TableEmitter):
         filename = f"{name}.parquet"
         log.info("emitting parquet table %s", filename)
         try:
-            await self._storage.set(filename, data.to_parquet())
+            # serialize off the event loop so concurrent workflows keep running
+            await self._storage.set(filename, await asyncio.to_thread(data.to_parquet))
         except ArrowTypeError as e:
             log.exception("Error while emitting parquet table")
             self._on_error(
@@ -8,10 +8,9 @@ import traceback
 from dataclasses import dataclass
 from typing import Any
 
-from graphrag_lib.graphrag.index.typing import ErrorHandlerFn
-from graphrag_lib.graphrag.index.utils import dict_has_keys_with_types
-from graphrag_lib.graphrag.llm import CompletionLLM
-
+from .....llm import CompletionLLM
+from ....typing import ErrorHandlerFn
+from ....utils import dict_has_keys_with_types
 from .prompts import COMMUNITY_REPORT_PROMPT
 
 log = logging.getLogger(__name__)
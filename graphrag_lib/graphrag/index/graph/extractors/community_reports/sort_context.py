@@ -51,10 +51,9 @@ def sort_context(
                     report_df[community_id_column] = report_df[
                         community_id_column
                     ].astype(int)
-                report_string = (
-                    #f"----Reports-----\n{report_df.to_csv(index=False, sep=',')}"
-                    f"----Reports-----\n{report_df.to_csv(index=False, sep=',', escapechar='\\\\')}"
-                )
+                #report_string = f"----Reports-----\n{report_df.to_csv(index=False, sep=',')}"
+                report_csv = report_df.to_csv(index=False, sep=",", escapechar="\\")
+                report_string = f"----Reports-----\n{report_csv}"
                 contexts.append(report_string)
 
         entities = [
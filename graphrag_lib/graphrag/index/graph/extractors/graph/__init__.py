@@ -5,14 +5,20 @@
 
 from .graph_extractor import (
     DEFAULT_ENTITY_TYPES,
+    GleaningStats,
     GraphExtractionResult,
     GraphExtractor,
+    get_gleaning_stats,
+    reset_gleaning_stats,
 )
 from .prompts import GRAPH_EXTRACTION_PROMPT
 
 __all__ = [
     "DEFAULT_ENTITY_TYPES",
     "GRAPH_EXTRACTION_PROMPT",
+    "GleaningStats",
     "GraphExtractionResult",
     "GraphExtractor",
+    "get_gleaning_stats",
+    "reset_gleaning_stats",
 ]
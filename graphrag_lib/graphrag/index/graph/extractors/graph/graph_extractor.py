@@ -1,13 +1,15 @@
 # Copyright (c) 2024 Microsoft Corporation.
 # Licensed under the MIT License
 
-"""A module containing 'GraphExtractionResult' and 'GraphExtractor' models."""
+"""A module containing 'GraphExtractionResult', 'GleaningStats' and 'GraphExtractor' models."""
 
+import asyncio
 import logging
 import re
 import traceback
 from collections.abc import Mapping
-from dataclasses import dataclass
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
 from typing import Any
 
 import networkx as nx
@@ -34,6 +36,35 @@ class GraphExtractionResult:
     source_docs: dict[Any, Any]
 
 
+@dataclass
+class GleaningStats:
+    """Counters of the gleaning (continuation) calls made by graph extraction."""
+
+    documents: int = 0
+    gleaning_calls: int = 0
+    loop_check_calls: int = 0
+    early_exits: int = 0
+    calls_saved: int = 0
+    """Gleaning and loop-check calls the early exit skipped, counted against the most max_gleanings allows."""
+
+
+# a context variable, so that pipelines running concurrently in one process, with the
+# tasks and threads they start, each count their own calls
+_gleaning_stats: ContextVar[GleaningStats] = ContextVar(
+    "gleaning_stats", default=GleaningStats()
+)
+
+
+def reset_gleaning_stats() -> None:
+    """Start counting the gleaning calls of the current pipeline run from zero."""
+    _gleaning_stats.set(GleaningStats())
+
+
+def get_gleaning_stats() -> dict[str, int]:
+    """Return the gleaning counters of the current pipeline run."""
+    return asdict(_gleaning_stats.get())
+
+
 class GraphExtractor:
     """Unipartite graph extractor class definition."""
 
@@ -50,6 +81,7 @@ class GraphExtractor:
     _summarization_prompt: str
     _loop_args: dict[str, Any]
     _max_gleanings: int
+    _gleaning_early_exit: bool
     _on_error: ErrorHandlerFn
 
     def __init__(
@@ -64,6 +96,7 @@ class GraphExtractor:
         join_descriptions=True,
         encoding_model: str | None = None,
         max_gleanings: int | None = None,
+        gleaning_early_exit: bool = False,
         on_error: ErrorHandlerFn | None = None,
     ):
         """Init method definition."""
@@ -83,6 +116,7 @@ class GraphExtractor:
             if max_gleanings is not None
             else defs.ENTITY_EXTRACTION_MAX_GLEANINGS
         )
+        self._gleaning_early_exit = gleaning_early_exit
         self._on_error = on_error or (lambda _e, _s, _d: None)
 
         # Construct the looping arguments
@@ -116,12 +150,10 @@ class GraphExtractor:
             ),
         }
 
-        for doc_index, text in enumerate(texts):
+        async def process(doc_index: int, text: str) -> str | None:
             try:
                 # Invoke the entity extraction
-                result = await self._process_document(text, prompt_variables)
-                source_doc_map[doc_index] = text
-                all_records[doc_index] = result
+                return await self._process_document(text, prompt_variables)
             except Exception as e:
                 logging.exception("error extracting graph")
                 self._on_error(
@@ -132,6 +164,16 @@ class GraphExtractor:
                         "text": text,
                     },
                 )
+                return None
+
+        # the documents run concurrently; the llm's shared limiters bound the requests
+        results = await asyncio.gather(
+            *(process(doc_index, text) for doc_index, text in enumerate(texts))
+        )
+        for doc_index, (text, result) in enumerate(zip(texts, results, strict=True)):
+            if result is not None:
+                source_doc_map[doc_index] = text
+                all_records[doc_index] = result
 
         output = await self._process_results(
             all_records,
@@ -155,6 +197,18 @@ class GraphExtractor:
             },
         )
         results = response.output or ""
+        stats = _gleaning_stats.get()
+        stats.documents += 1
+
+        seen_records = (
+            self._record_keys(results, prompt_variables)
+            if self._gleaning_early_exit
+            else set()
+        )
+        if self._gleaning_early_exit and self._max_gleanings > 0 and not seen_records:
+            # nothing was extracted, so there is nothing to glean more of
+            self._exit_gleaning_early(2 * self._max_gleanings - 1)
+            return results
 
         # Repeat to ensure we maximize entity count
         for i in range(self._max_gleanings):
@@ -163,12 +217,22 @@ class GraphExtractor:
                 name=f"extract-continuation-{i}",
                 history=response.history,
             )
+            stats.gleaning_calls += 1
             results += response.output or ""
 
             # if this is the final glean, don't bother updating the continuation flag
             if i >= self._max_gleanings - 1:
                 break
 
+            if self._gleaning_early_exit:
+                records = self._record_keys(response.output or "", prompt_variables)
+                if records <= seen_records:
+                    # skip this loop check and the gleanings that could follow it
+                    self._exit_gleaning_early(2 * (self._max_gleanings - i) - 2)
+                    break
+                seen_records |= records
+
+            stats.loop_check_calls += 1
             response = await self._llm(
                 LOOP_PROMPT,
                 name=f"extract-loopcheck-{i}",
@@ -180,6 +244,32 @@ class GraphExtractor:
 
         return results
 
+    def _exit_gleaning_early(self, calls_saved: int) -> None:
+        stats = _gleaning_stats.get()
+        stats.early_exits += 1
+        stats.calls_saved += calls_saved
+
+    def _record_keys(
+        self, extracted_data: str, prompt_variables: dict[str, str]
+    ) -> set[tuple[str, ...]]:
+        """Return the entity names and relationship endpoints found in an extraction output."""
+        tuple_delimiter = prompt_variables[self._tuple_delimiter_key]
+        keys: set[tuple[str, ...]] = set()
+        for record in extracted_data.split(prompt_variables[self._record_delimiter_key]):
+            record = record.replace(prompt_variables[self._completion_delimiter_key], "")
+            record_attributes = re.sub(r"^\(|\)$", "", record.strip()).split(
+                tuple_delimiter
+            )
+            if record_attributes[0] == '"entity"' and len(record_attributes) >= 4:
+                keys.add(("entity", clean_str(record_attributes[1].upper())))
+            elif record_attributes[0] == '"relationship"' and len(record_attributes) >= 5:
+                keys.add((
+                    "relationship",
+                    clean_str(record_attributes[1].upper()),
+                    clean_str(record_attributes[2].upper()),
+                ))
+        return keys
+
     async def _process_results(
         self,
         results: dict[int, str],
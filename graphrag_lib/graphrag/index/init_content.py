@@ -68,8 +68,10 @@ input:
   file_pattern: ".*\\\\.txt$"
 
 cache:
-  type: {defs.CACHE_TYPE.value} # or blob
+  type: {defs.CACHE_TYPE.value} # or blob, sqlite
   base_dir: "{defs.CACHE_BASE_DIR}"
+  # max_bytes: 2000000000 # sqlite only: evict least recently used entries above this size
+  # compression: zstd # sqlite only: requires the zstandard package
   # connection_string: <azure_blob_storage_connection_string>
   # container_name: <azure_blob_storage_container_name>
 
@@ -94,6 +96,7 @@ entity_extraction:
   prompt: "prompts/entity_extraction.txt"
   entity_types: [{",".join(defs.ENTITY_EXTRACTION_ENTITY_TYPES)}]
   max_gleanings: {defs.ENTITY_EXTRACTION_MAX_GLEANINGS}
+  # gleaning_early_exit: {str(defs.ENTITY_EXTRACTION_GLEANING_EARLY_EXIT).lower()} # stop gleaning once a pass finds nothing new
 
 summarize_descriptions:
   ## llm: override the global llm settings for this task
@@ -5,7 +5,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import TYPE_CHECKING, Any
 
@@ -14,15 +13,14 @@ from graphrag.llm import (
     CompletionLLM,
     EmbeddingLLM,
     LLMCache,
-    LLMLimiter,
     MockCompletionLLM,
     OpenAIConfiguration,
     create_openai_chat_llm,
     create_openai_client,
     create_openai_completion_llm,
     create_openai_embedding_llm,
-    create_tpm_rpm_limiters,
 )
+from graphrag.llm.limiting import ModelLimiters, get_model_limiters
 
 if TYPE_CHECKING:
     from datashaper import VerbCallbacks
@@ -32,9 +30,6 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
-_semaphores: dict[str, asyncio.Semaphore] = {}
-_rate_limiters: dict[str, LLMLimiter] = {}
-
 
 def load_llm(
     name: str,
@@ -249,10 +244,14 @@ def _create_openai_chat_llm(
 ) -> CompletionLLM:
     """Create an openAI chat llm."""
     client = create_openai_client(configuration=configuration, azure=azure)
-    limiter = _create_limiter(configuration)
-    semaphore = _create_semaphore(configuration)
+    limiters = _get_limiters(configuration)
     return create_openai_chat_llm(
-        client, configuration, cache, limiter, semaphore, on_error=on_error
+        client,
+        configuration,
+        cache,
+        limiters.rate_limiter,
+        on_error=on_error,
+        concurrency_limiter=limiters.concurrency_limiter,
     )
 
 
@@ -264,10 +263,14 @@ def _create_openai_completion_llm(
 ) -> CompletionLLM:
     """Create an openAI completion llm."""
     client = create_openai_client(configuration=configuration, azure=azure)
-    limiter = _create_limiter(configuration)
-    semaphore = _create_semaphore(configuration)
+    limiters = _get_limiters(configuration)
     return create_openai_completion_llm(
-        client, configuration, cache, limiter, semaphore, on_error=on_error
+        client,
+        configuration,
+        cache,
+        limiters.rate_limiter,
+        on_error=on_error,
+        concurrency_limiter=limiters.concurrency_limiter,
     )
 
 
@@ -279,34 +282,21 @@ def _create_openai_embeddings_llm(
 ) -> EmbeddingLLM:
     """Create an openAI embeddings llm."""
     client = create_openai_client(configuration=configuration, azure=azure)
-    limiter = _create_limiter(configuration)
-    semaphore = _create_semaphore(configuration)
+    limiters = _get_limiters(configuration)
     return create_openai_embedding_llm(
-        client, configuration, cache, limiter, semaphore, on_error=on_error
+        client,
+        configuration,
+        cache,
+        limiters.rate_limiter,
+        on_error=on_error,
+        concurrency_limiter=limiters.concurrency_limiter,
     )
 
 
-def _create_limiter(configuration: OpenAIConfiguration) -> LLMLimiter:
-    limit_name = configuration.model or configuration.deployment_name or "default"
-    if limit_name not in _rate_limiters:
-        tpm = configuration.tokens_per_minute
-        rpm = configuration.requests_per_minute
-        log.info("create TPM/RPM limiter for %s: TPM=%s, RPM=%s", limit_name, tpm, rpm)
-        _rate_limiters[limit_name] = create_tpm_rpm_limiters(configuration)
-    return _rate_limiters[limit_name]
-
-
-def _create_semaphore(configuration: OpenAIConfiguration) -> asyncio.Semaphore | None:
-    limit_name = configuration.model or configuration.deployment_name or "default"
-    concurrency = configuration.concurrent_requests
-
-    # bypass the semaphore if concurrency is zero
-    if not concurrency:
-        log.info("no concurrency limiter for %s", limit_name)
-        return None
-
-    if limit_name not in _semaphores:
-        log.info("create concurrency limiter for %s: %s", limit_name, concurrency)
-        _semaphores[limit_name] = asyncio.Semaphore(concurrency)
-
-    return _semaphores[limit_name]
+def _get_limiters(configuration: OpenAIConfiguration) -> ModelLimiters:
+    # one TPM/RPM budget and adaptive concurrency limit per deployment, shared by
+    # every chat, extraction and embedding LLM of the process
+    limit_name = configuration.deployment_name or configuration.model or "default"
+    return get_model_limiters(
+        limit_name, configuration, configuration.concurrent_requests
+    )
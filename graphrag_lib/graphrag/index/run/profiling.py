@@ -3,9 +3,11 @@
 
 """Profiling functions for the GraphRAG run module."""
 
+import asyncio
 import json
 import logging
 import time
+import weakref
 from dataclasses import asdict
 
 from datashaper import MemoryProfile, Workflow, WorkflowRunResult
@@ -15,6 +17,11 @@ from graphrag.index.storage.typing import PipelineStorage
 
 log = logging.getLogger(__name__)
 
+# workflows may finish concurrently; keep their stats.json writes from interleaving
+_dump_stats_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = (
+    weakref.WeakKeyDictionary()
+)
+
 
 async def _save_profiler_stats(
     storage: PipelineStorage, workflow_name: str, profile: MemoryProfile
@@ -43,9 +50,12 @@ async def _save_profiler_stats(
 
 async def _dump_stats(stats: PipelineRunStats, storage: PipelineStorage) -> None:
     """Dump the stats to the storage."""
-    await storage.set(
-        "stats.json", json.dumps(asdict(stats), indent=4, ensure_ascii=False)
-    )
+    loop = asyncio.get_running_loop()
+    lock = _dump_stats_locks.setdefault(loop, asyncio.Lock())
+    async with lock:
+        await storage.set(
+            "stats.json", json.dumps(asdict(stats), indent=4, ensure_ascii=False)
+        )
 
 
 async def _write_workflow_stats(
@@ -3,7 +3,7 @@
 
 """Different methods to run the pipeline."""
 
-import gc
+import asyncio
 import logging
 import time
 import traceback
@@ -20,6 +20,10 @@ from graphrag.index.config import (
     PipelineWorkflowStep,
 )
 from graphrag.index.emit import TableEmitterType, create_table_emitters
+from graphrag.index.graph.extractors.graph import (
+    get_gleaning_stats,
+    reset_gleaning_stats,
+)
 from graphrag.index.load_pipeline_config import load_pipeline_config
 from graphrag.index.progress import NullProgressReporter, ProgressReporter
 from graphrag.index.reporting import (
@@ -31,6 +35,14 @@ from graphrag.index.run.postprocess import (
     _run_post_process_steps,
 )
 from graphrag.index.run.profiling import _dump_stats
+from graphrag.index.run.scheduler import (
+    DEFAULT_MAX_CONCURRENT_WORKFLOWS,
+    WorkflowScheduler,
+)
+from graphrag.index.run.table_store import (
+    DEFAULT_TABLE_STORE_MAX_BYTES,
+    RunTableStore,
+)
 from graphrag.index.run.utils import (
     _apply_substitutions,
     _create_input,
@@ -44,9 +56,11 @@ from graphrag.index.run.workflow import (
 )
 from graphrag.index.storage import PipelineStorage
 from graphrag.index.typing import PipelineRunResult
+from graphrag.llm.limiting import get_limiter_stats
 
 # Register all verbs
 from graphrag.index.update.dataframes import get_delta_docs, update_dataframe_outputs
+from graphrag.index.update.workflows import get_delta_workflows
 from graphrag.index.verbs import *  # noqa
 from graphrag.index.workflows import (
     VerbDefinitions,
@@ -74,6 +88,8 @@ async def run_pipeline_with_config(
     run_id: str | None = None,
     is_resume_run: bool = False,
     is_update_run: bool = False,
+    max_concurrent_workflows: int = DEFAULT_MAX_CONCURRENT_WORKFLOWS,
+    table_store_max_bytes: int = DEFAULT_TABLE_STORE_MAX_BYTES,
     **_kwargs: dict,
 ) -> AsyncIterable[PipelineRunResult]:
     """Run a pipeline with the given config.
@@ -91,6 +107,8 @@ async def run_pipeline_with_config(
         - emit - The table emitters to use for the pipeline.
         - memory_profile - Whether or not to profile the memory.
         - run_id - The run id to start or resume from.
+        - max_concurrent_workflows - How many independent workflows may run at the same time.
+        - table_store_max_bytes - How much memory the workflow outputs handed to dependent workflows may use before they are spilled to storage.
     """
     if isinstance(config_or_path, str):
         log.info("Running pipeline with config %s", config_or_path)
@@ -123,13 +141,16 @@ async def run_pipeline_with_config(
 
     if is_update_run:
         delta_dataset = await get_delta_docs(dataset, storage)
+        if delta_dataset.new_inputs.empty:
+            log.info("No new documents, the index is up to date")
+            return
 
         delta_storage = storage.child("delta")
 
         # Run the pipeline on the new documents
         tables_dict = {}
         async for table in run_pipeline(
-            workflows=workflows,
+            workflows=get_delta_workflows(workflows),
             dataset=delta_dataset.new_inputs,
             storage=delta_storage,
             cache=cache,
@@ -141,10 +162,24 @@ async def run_pipeline_with_config(
             progress_reporter=progress_reporter,
             emit=emit,
             is_resume_run=False,
+            max_concurrent_workflows=max_concurrent_workflows,
+            table_store_max_bytes=table_store_max_bytes,
         ):
+            if table.errors:
+                # do not merge the outputs of a failed delta run into the index
+                yield table
+                return
             tables_dict[table.workflow] = table.result
 
-        await update_dataframe_outputs(tables_dict, storage)
+        await update_dataframe_outputs(
+            tables_dict,
+            storage,
+            workflows=workflows,
+            cache=cache,
+            callbacks=_create_callback_chain(callbacks, progress_reporter),
+            additional_verbs=additional_verbs,
+            additional_workflows=additional_workflows,
+        )
 
     else:
         async for table in run_pipeline(
@@ -160,6 +195,8 @@ async def run_pipeline_with_config(
             progress_reporter=progress_reporter,
             emit=emit,
             is_resume_run=is_resume_run,
+            max_concurrent_workflows=max_concurrent_workflows,
+            table_store_max_bytes=table_store_max_bytes,
         ):
             yield table
 
@@ -177,6 +214,8 @@ async def run_pipeline(
     emit: list[TableEmitterType] | None = None,
     memory_profile: bool = False,
     is_resume_run: bool = False,
+    max_concurrent_workflows: int = DEFAULT_MAX_CONCURRENT_WORKFLOWS,
+    table_store_max_bytes: int = DEFAULT_TABLE_STORE_MAX_BYTES,
     **_kwargs: dict,
 ) -> AsyncIterable[PipelineRunResult]:
     """Run the pipeline.
@@ -195,10 +234,13 @@ async def run_pipeline(
         - additional_verbs - The custom verbs to use for the pipeline
         - additional_workflows - The custom workflows to use for the pipeline
         - debug - Whether or not to run in debug mode
+        - max_concurrent_workflows - How many workflows whose dependencies are met may run at the same time
+        - table_store_max_bytes - The memory cap for outputs kept in memory for dependent workflows; above it the least recently needed ones are re-read from storage
     Returns:
         - output - An iterable of workflow results as they complete running, as well as any errors that occur
     """
     start_time = time.time()
+    reset_gleaning_stats()
 
     context = _create_run_context(storage=storage, cache=cache, stats=None)
 
@@ -211,7 +253,7 @@ async def run_pipeline(
     emitters = create_table_emitters(
         emit,
         context.storage,
-        lambda e, s, d: cast(WodrkflowCallbacks, callbacks).on_error(
+        lambda e, s, d: cast(WorkflowCallbacks, callbacks).on_error(
             "Error emitting table", e, s, d
         ),
     )
@@ -239,32 +281,44 @@ async def run_pipeline(
 
     log.info("Final # of rows loaded: %s", len(dataset))
     context.stats.num_documents = len(dataset)
-    last_workflow = "input"
+    scheduler = WorkflowScheduler(
+        workflows_to_run, workflow_dependencies, max_concurrent_workflows
+    )
+    table_store = RunTableStore(
+        emitters, context.storage, workflow_dependencies, table_store_max_bytes
+    )
+
+    async def process(workflow):
+        return await _process_workflow(
+            workflow,
+            context,
+            callbacks,
+            emitters,
+            workflow_dependencies,
+            dataset,
+            start_time,
+            is_resume_run,
+            table_store,
+        )
 
     try:
         await _dump_stats(context.stats, context.storage)
 
-        for workflow_to_run in workflows_to_run:
-            # Try to flush out any intermediate dataframes
-            gc.collect()
-
-            last_workflow = workflow_to_run.workflow.name
-            result = await _process_workflow(
-                workflow_to_run.workflow,
-                context,
-                callbacks,
-                emitters,
-                workflow_dependencies,
-                dataset,
-                start_time,
-                is_resume_run,
-            )
-            if result:
-                yield result
+        async for result in scheduler.run(process, context.stats):
+            yield result
 
+        await table_store.flush()
+        await context.cache.flush()
         context.stats.total_runtime = time.time() - start_time
+        context.stats.llm = get_limiter_stats()
+        context.stats.gleaning = get_gleaning_stats()
         await _dump_stats(context.stats, context.storage)
     except Exception as e:
+        last_workflow = scheduler.current_workflow
+        # keep whatever was produced so a resume run can pick it up
+        await asyncio.gather(
+            table_store.flush(), context.cache.flush(), return_exceptions=True
+        )
         log.exception("error running workflow %s", last_workflow)
         cast(WorkflowCallbacks, callbacks).on_error(
             "Error running pipeline!", e, traceback.format_exc()
@@ -0,0 +1,144 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Run-scoped in-memory handoff of workflow output tables."""
+
+import asyncio
+import logging
+import time
+
+import networkx as nx
+import pandas as pd
+
+from graphrag.index.emit import ParquetTableEmitter
+from graphrag.index.emit.table_emitter import TableEmitter
+from graphrag.index.storage.typing import PipelineStorage
+from graphrag.index.utils import serialize_graphs
+from graphrag.utils.storage import _load_table_from_storage
+
+log = logging.getLogger(__name__)
+
+DEFAULT_TABLE_STORE_MAX_BYTES = 4 * 1024**3
+# rough footprint of one node or edge with its attribute dict; memory_usage does
+# not look inside the networkx graphs that graph tables hold
+_GRAPH_ITEM_BYTES = 1024
+
+
+class RunTableStore:
+    """Hand workflow outputs to downstream workflows in memory.
+
+    Each output is persisted through the emitters in the background while it stays
+    in memory for its consumers. When the resident tables exceed ``max_bytes``,
+    tables are dropped from memory (after their parquet copy is written) in this
+    order: tables no remaining workflow needs, then the least recently needed.
+    Dropped tables are read back from storage if they are needed again.
+    """
+
+    def __init__(
+        self,
+        emitters: list[TableEmitter],
+        storage: PipelineStorage,
+        dependencies: dict[str, list[str]],
+        max_bytes: int = DEFAULT_TABLE_STORE_MAX_BYTES,
+    ):
+        self._emitters = emitters
+        self._storage = storage
+        self._max_bytes = max_bytes
+        # spilled tables are read back from parquet, so only spill if it is emitted
+        self._can_spill = any(isinstance(e, ParquetTableEmitter) for e in emitters)
+        self._tables: dict[str, pd.DataFrame] = {}
+        self._sizes: dict[str, int] = {}
+        self._last_needed: dict[str, float] = {}
+        self._persist_tasks: dict[str, asyncio.Task] = {}
+        self._remaining_consumers: dict[str, int] = {}
+        for deps in dependencies.values():
+            for dep in deps:
+                self._remaining_consumers[dep] = (
+                    self._remaining_consumers.get(dep, 0) + 1
+                )
+
+    @property
+    def resident_bytes(self) -> int:
+        """The approximate size of the tables currently held in memory."""
+        return sum(self._sizes.values())
+
+    async def put(self, name: str, table: pd.DataFrame) -> None:
+        """Keep a workflow output in memory and start persisting it in the background."""
+        self._tables[name] = table
+        self._sizes[name] = _table_bytes(table)
+        self._last_needed[name] = time.monotonic()
+        self._persist_tasks[name] = asyncio.create_task(self._persist(name, table))
+        await self._enforce_limit()
+
+    async def get(self, name: str) -> pd.DataFrame:
+        """Return a copy of a table for a consuming workflow, loading it from storage if needed."""
+        remaining = self._remaining_consumers.get(name, 0) - 1
+        self._remaining_consumers[name] = max(remaining, 0)
+        table = self._tables.get(name)
+        if table is None:
+            log.info("table %s is not resident, reading it from storage", name)
+            return await _load_table_from_storage(f"{name}.parquet", self._storage)
+
+        self._last_needed[name] = time.monotonic()
+        # consumers may modify their input in place; keep the resident/emitted copy intact
+        result = table.copy()
+        if remaining <= 0:
+            await self._release(name)
+        return result
+
+    async def flush(self) -> None:
+        """Wait until every table has been persisted."""
+        if self._persist_tasks:
+            await asyncio.gather(*self._persist_tasks.values())
+
+    async def _persist(self, name: str, table: pd.DataFrame) -> None:
+        # consumers get the graphs themselves; only the written copy is graphml
+        table = await asyncio.to_thread(serialize_graphs, table)
+        for emitter in self._emitters:
+            await emitter.emit(name, table)
+
+    async def _release(self, name: str) -> None:
+        """Drop a table from memory once its persisted copy is complete."""
+        task = self._persist_tasks.get(name)
+        if task is not None:
+            await task
+        if self._tables.pop(name, None) is not None:
+            self._sizes.pop(name, None)
+            self._last_needed.pop(name, None)
+
+    async def _enforce_limit(self) -> None:
+        if not self._can_spill:
+            if self.resident_bytes > self._max_bytes:
+                log.warning(
+                    "resident tables use %d bytes (limit %d) but parquet is not emitted; not spilling",
+                    self.resident_bytes,
+                    self._max_bytes,
+                )
+            return
+        while self.resident_bytes > self._max_bytes and self._tables:
+            victim = min(
+                self._tables,
+                key=lambda n: (
+                    self._remaining_consumers.get(n, 0) > 0,
+                    self._last_needed[n],
+                ),
+            )
+            log.info(
+                "spilling table %s (%d bytes) to stay under %d bytes",
+                victim,
+                self._sizes[victim],
+                self._max_bytes,
+            )
+            await self._release(victim)
+
+
+def _table_bytes(table: pd.DataFrame) -> int:
+    size = int(table.memory_usage(deep=True).sum())
+    for column in table.columns:
+        if table[column].dtype == object:
+            size += sum(
+                (value.number_of_nodes() + value.number_of_edges()) * _GRAPH_ITEM_BYTES
+                for value in table[column]
+                if isinstance(value, nx.Graph)
+            )
+    return size
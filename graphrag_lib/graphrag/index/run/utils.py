@@ -16,6 +16,7 @@ from graphrag.index.cache.memory_pipeline_cache import InMemoryCache
 from graphrag.index.cache.pipeline_cache import PipelineCache
 from graphrag.index.config.cache import (
     PipelineBlobCacheConfig,
+    PipelineSqliteCacheConfig,
     PipelineFileCacheConfig,
 )
 from graphrag.index.config.input import PipelineInputConfigTypes
@@ -83,7 +84,10 @@ def _apply_substitutions(config: PipelineConfig, run_id: str) -> PipelineConfig:
             substitutions
         )
     if (
-        isinstance(config.cache, PipelineFileCacheConfig | PipelineBlobCacheConfig)
+        isinstance(
+            config.cache,
+            PipelineFileCacheConfig | PipelineBlobCacheConfig | PipelineSqliteCacheConfig,
+        )
         and config.cache.base_dir
     ):
         config.cache.base_dir = Template(config.cache.base_dir).substitute(
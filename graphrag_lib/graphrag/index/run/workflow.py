@@ -22,8 +22,10 @@ from graphrag.index.reporting.progress_workflow_callbacks import (
     ProgressWorkflowCallbacks,
 )
 from graphrag.index.run.profiling import _write_workflow_stats
+from graphrag.index.run.table_store import RunTableStore
 from graphrag.index.storage.typing import PipelineStorage
 from graphrag.index.typing import PipelineRunResult
+from graphrag.index.utils import serialize_graphs
 from graphrag.utils.storage import _load_table_from_storage
 
 log = logging.getLogger(__name__)
@@ -34,6 +36,7 @@ async def _inject_workflow_data_dependencies(
     workflow_dependencies: dict[str, list[str]],
     dataset: pd.DataFrame,
     storage: PipelineStorage,
+    table_store: RunTableStore | None = None,
 ) -> None:
     """Inject the data dependencies into the workflow."""
     workflow.add_table(DEFAULT_INPUT_NAME, dataset)
@@ -41,17 +44,28 @@ async def _inject_workflow_data_dependencies(
     log.info("dependencies for %s: %s", workflow.name, deps)
     for id in deps:
         workflow_id = f"workflow:{id}"
-        table = await _load_table_from_storage(f"{id}.parquet", storage)
+        table = (
+            await table_store.get(id)
+            if table_store is not None
+            else await _load_table_from_storage(f"{id}.parquet", storage)
+        )
         workflow.add_table(workflow_id, table)
 
 
 async def _emit_workflow_output(
-    workflow: Workflow, emitters: list[TableEmitter]
+    workflow: Workflow,
+    emitters: list[TableEmitter],
+    table_store: RunTableStore | None = None,
 ) -> pd.DataFrame:
     """Emit the workflow output."""
     output = cast(pd.DataFrame, workflow.output())
+    if table_store is not None:
+        # dependents read it from memory; the emitters write it in the background
+        await table_store.put(workflow.name, output)
+        return output
+    persisted = serialize_graphs(output)
     for emitter in emitters:
-        await emitter.emit(workflow.name, output)
+        await emitter.emit(workflow.name, persisted)
     return output
 
 
@@ -76,6 +90,7 @@ async def _process_workflow(
     dataset: pd.DataFrame,
     start_time: float,
     is_resume_run: bool,
+    table_store: RunTableStore | None = None,
 ):
     workflow_name = workflow.name
     if is_resume_run and await context.storage.has(f"{workflow_name}.parquet"):
@@ -84,7 +99,7 @@ async def _process_workflow(
 
     context.stats.workflows[workflow_name] = {"overall": 0.0}
     await _inject_workflow_data_dependencies(
-        workflow, workflow_dependencies, dataset, context.storage
+        workflow, workflow_dependencies, dataset, context.storage, table_store
     )
 
     workflow_start_time = time.time()
@@ -99,6 +114,6 @@ async def _process_workflow(
     )
 
     # Save the output from the workflow
-    output = await _emit_workflow_output(workflow, emitters)
+    output = await _emit_workflow_output(workflow, emitters, table_store)
     workflow.dispose()
     return PipelineRunResult(workflow_name, output, None)
@@ -122,6 +122,16 @@ class TokenTextSplitter(TextSplitter):
 
     def split_text(self, text: str | list[str]) -> list[str]:
         """Split text method."""
+        return [split for split, _ in self.split_text_with_token_counts(text)]
+
+    def split_text_with_token_counts(
+        self, text: str | list[str]
+    ) -> list[tuple[str, int]]:
+        """Split text and return each split with its number of tokens.
+
+        The text is encoded once; the splits and their token counts are both taken
+        from that encoding.
+        """
         if cast(bool, pd.isna(text)) or text == "":
             return []
         if isinstance(text, list):
@@ -130,14 +140,17 @@ class TokenTextSplitter(TextSplitter):
             msg = f"Attempting to split a non-string value, actual is {type(text)}"
             raise TypeError(msg)
 
-        tokenizer = Tokenizer(
-            chunk_overlap=self._chunk_overlap,
-            tokens_per_chunk=self._chunk_size,
-            decode=self._tokenizer.decode,
-            encode=lambda text: self.encode(text),
-        )
-
-        return split_text_on_tokens(text=text, tokenizer=tokenizer)
+        input_ids = self.encode(text)
+        if len(input_ids) <= self._chunk_size:
+            return [(text, len(input_ids))] if input_ids else []
+        step = self._chunk_size - self._chunk_overlap
+        return [
+            (self._tokenizer.decode(chunk_ids), len(chunk_ids))
+            for chunk_ids in (
+                input_ids[start : start + self._chunk_size]
+                for start in range(0, len(input_ids), step)
+            )
+        ]
 
 
 class TextListSplitterType(str, Enum):
@@ -0,0 +1,276 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Node and community operations for Incremental Indexing."""
+
+from collections import defaultdict
+
+import pandas as pd
+
+
+def _update_nodes(
+    old_nodes: pd.DataFrame,
+    delta_nodes: pd.DataFrame,
+    entities: pd.DataFrame,
+    relationships: pd.DataFrame,
+    changed_names: set[str],
+    new_names: list[str],
+    degrees: dict[str, int],
+) -> tuple[pd.DataFrame, set[str]]:
+    """Update the final nodes with the merged entities and relationships.
+
+    The existing communities are kept. Nodes that were not clustered before (new
+    nodes, and old nodes outside of the clustered component that gained edges) are
+    placed, level by level, in the community their neighbors are most strongly
+    connected to, within the community chosen at the level above. Nodes without a
+    clustered neighbor stay unclustered, as they would be when clustering the largest
+    connected component.
+
+    Parameters
+    ----------
+    old_nodes : pd.DataFrame
+        The existing final nodes.
+    delta_nodes : pd.DataFrame
+        The final nodes of the delta run, used as template for the new nodes.
+    entities : pd.DataFrame
+        The merged entities.
+    relationships : pd.DataFrame
+        The merged relationships.
+    changed_names : set[str]
+        The names of the existing entities that were updated by the delta.
+    new_names : list[str]
+        The names of the entities added by the delta.
+    degrees : dict[str, int]
+        The new degree of each node whose degree changed.
+
+    Returns
+    -------
+    pd.DataFrame
+        The updated nodes. Rows of untouched nodes are kept as they are.
+    set[str]
+        The titles of the nodes that were placed in a community.
+    """
+    nodes = old_nodes.copy()
+    levels = sorted(nodes["level"].unique().tolist())
+    entity_by_name = entities.drop_duplicates("name").set_index("name")
+
+    if degrees:
+        degree_rows = nodes["title"].isin(degrees)
+        for column in ["degree", "size"]:
+            if column in nodes.columns:
+                nodes.loc[degree_rows, column] = nodes.loc[degree_rows, "title"].map(
+                    degrees
+                )
+
+    changed_rows = nodes["title"].isin(changed_names)
+    if changed_rows.any():
+        changed_titles = nodes.loc[changed_rows, "title"]
+        nodes.loc[changed_rows, "description"] = changed_titles.map(
+            entity_by_name["description"]
+        )
+        nodes.loc[changed_rows, "source_id"] = changed_titles.map(
+            lambda title: ",".join(entity_by_name.at[title, "text_unit_ids"])
+        )
+
+    community_of: dict[int, dict[str, str]] = {level: {} for level in levels}
+    clustered = nodes.loc[nodes["community"].notna()]
+    for level, title, community in zip(
+        clustered["level"], clustered["title"], clustered["community"], strict=True
+    ):
+        community_of[level][title] = community
+    parents = _community_parents(community_of, levels)
+
+    old_titles = set(old_nodes["title"])
+    unclustered_old = [
+        title
+        for title in degrees
+        if title in old_titles and levels and title not in community_of[levels[0]]
+    ]
+    placements = _place_nodes(
+        [*new_names, *unclustered_old], relationships, community_of, parents, levels
+    )
+
+    if placements:
+        keys = list(zip(nodes["level"], nodes["title"], strict=True))
+        nodes["community"] = [
+            placements.get(key, community)
+            for key, community in zip(keys, nodes["community"], strict=True)
+        ]
+
+    template = delta_nodes.drop_duplicates("title").set_index("title")
+    new_rows = []
+    for title in new_names:
+        if title not in template.index or title not in entity_by_name.index:
+            continue
+        row = template.loc[title].to_dict()
+        entity = entity_by_name.loc[title]
+        degree = degrees.get(title, 0)
+        for level in levels:
+            new_rows.append({
+                **row,
+                "title": title,
+                "level": level,
+                "community": placements.get((level, title)),
+                "degree": degree,
+                **({"size": degree} if "size" in nodes.columns else {}),
+                "human_readable_id": entity["human_readable_id"],
+                "id": entity["id"],
+                "top_level_node_id": entity["id"],
+            })
+
+    if new_rows:
+        nodes = pd.concat(
+            [nodes, pd.DataFrame(new_rows).reindex(columns=nodes.columns)],
+            ignore_index=True,
+        )
+    placed = {title for _, title in placements}
+    return nodes, placed
+
+
+def _community_parents(
+    community_of: dict[int, dict[str, str]], levels: list[int]
+) -> dict[str, str]:
+    """Map each community to the community it is part of at the level above."""
+    parents = {}
+    for parent_level, level in zip(levels, levels[1:], strict=False):
+        for title, community in community_of[level].items():
+            parent = community_of[parent_level].get(title)
+            if parent is not None:
+                parents[community] = parent
+    return parents
+
+
+def _place_nodes(
+    titles: list[str],
+    relationships: pd.DataFrame,
+    community_of: dict[int, dict[str, str]],
+    parents: dict[str, str],
+    levels: list[int],
+) -> dict[tuple[int, str], str]:
+    """Place unclustered nodes in the communities of their neighbors.
+
+    Nodes are placed in rounds, so that a node that is only connected to other new
+    nodes follows them into their community. `community_of` is updated in place.
+    """
+    pending = set(titles)
+    neighbors: dict[str, dict[str, float]] = defaultdict(lambda: defaultdict(float))
+    for source, target, weight in zip(
+        relationships["source"],
+        relationships["target"],
+        relationships["weight"],
+        strict=True,
+    ):
+        if source in pending:
+            neighbors[source][target] += weight
+        if target in pending:
+            neighbors[target][source] += weight
+
+    placements: dict[tuple[int, str], str] = {}
+    placed_in_round = True
+    while pending and placed_in_round:
+        placed_in_round = False
+        for title in [title for title in titles if title in pending]:
+            path = _vote(neighbors[title], community_of, parents, levels)
+            if not path:
+                continue
+            for level, community in path:
+                community_of[level][title] = community
+                placements[(level, title)] = community
+            pending.discard(title)
+            placed_in_round = True
+    return placements
+
+
+def _vote(
+    neighbor_weights: dict[str, float],
+    community_of: dict[int, dict[str, str]],
+    parents: dict[str, str],
+    levels: list[int],
+) -> list[tuple[int, str]]:
+    """Pick the community with the largest edge weight to the node at each level."""
+    path: list[tuple[int, str]] = []
+    chosen = None
+    for level in levels:
+        votes: dict[str, float] = defaultdict(float)
+        for neighbor, weight in neighbor_weights.items():
+            community = community_of[level].get(neighbor)
+            if community is None:
+                continue
+            if chosen is None or parents.get(community) == chosen:
+                votes[community] += weight
+        if not votes:
+            break
+        chosen = min(votes, key=lambda community: (-votes[community], str(community)))
+        path.append((level, chosen))
+    return path
+
+
+def _get_affected_communities(nodes: pd.DataFrame, titles: set[str]) -> list[str]:
+    """Get the communities, at every level, that contain any of the given nodes."""
+    affected = nodes.loc[nodes["title"].isin(titles) & nodes["community"].notna()]
+    return affected["community"].astype(str).unique().tolist()
+
+
+def _update_communities(
+    old_communities: pd.DataFrame,
+    nodes: pd.DataFrame,
+    relationships: pd.DataFrame,
+    community_ids: list[str],
+) -> pd.DataFrame:
+    """Recompute the relationships and text units of the given communities.
+
+    Parameters
+    ----------
+    old_communities : pd.DataFrame
+        The existing final communities.
+    nodes : pd.DataFrame
+        The updated final nodes.
+    relationships : pd.DataFrame
+        The merged final relationships.
+    community_ids : list[str]
+        The communities to recompute. All other rows are kept as they are.
+
+    Returns
+    -------
+    pd.DataFrame
+        The updated communities.
+    """
+    if not community_ids:
+        return old_communities
+
+    community_nodes = nodes.loc[
+        nodes["community"].notna() & nodes["community"].astype(str).isin(community_ids),
+        ["title", "community", "level", "source_id"],
+    ]
+    edges = relationships.loc[:, ["id", "source", "target"]]
+    clusters = pd.concat(
+        [
+            community_nodes.merge(edges, left_on="title", right_on="source"),
+            community_nodes.merge(edges, left_on="title", right_on="target"),
+        ],
+        ignore_index=True,
+    )
+    clusters["community"] = clusters["community"].astype(str)
+    aggregated = (
+        clusters.groupby(["community", "level"], sort=False)
+        .agg(relationship_ids=("id", "unique"), text_unit_ids=("source_id", "unique"))
+        .reset_index()
+        .set_index("community")
+    )
+
+    communities = old_communities.copy()
+    ids = communities["id"].astype(str).tolist()
+    for column in ["relationship_ids", "text_unit_ids"]:
+        communities[column] = [
+            aggregated.at[id, column] if id in aggregated.index else value
+            for id, value in zip(ids, communities[column], strict=True)
+        ]
+
+    added = aggregated.loc[~aggregated.index.isin(ids)].reset_index()
+    if added.empty:
+        return communities
+    added = added.rename(columns={"community": "id"})
+    added["title"] = "Community " + added["id"]
+    return pd.concat(
+        [communities, added.reindex(columns=communities.columns)], ignore_index=True
+    )
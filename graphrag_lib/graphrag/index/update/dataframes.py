@@ -3,15 +3,37 @@
 
 """Dataframe operations and utils for Incremental Indexing."""
 
+import logging
 import os
+from collections import Counter
 from dataclasses import dataclass
+from typing import Any
+from uuid import uuid4
 
 import numpy as np
 import pandas as pd
+from datashaper import NoopVerbCallbacks, NoopWorkflowCallbacks, WorkflowCallbacks
 
+from graphrag.index.cache import InMemoryCache, PipelineCache
+from graphrag.index.config import PipelineWorkflowReference
 from graphrag.index.storage.typing import PipelineStorage
+from graphrag.index.verbs.text.embed.text_embed import text_embed_df
+from graphrag.index.workflows import VerbDefinitions, WorkflowDefinitions
 from graphrag.utils.storage import _load_table_from_storage
 
+from .communities import (
+    _get_affected_communities,
+    _update_communities,
+    _update_nodes,
+)
+from .workflows import (
+    COMMUNITY_REPORTS_WORKFLOW,
+    disable_vector_store_overwrite,
+    update_community_reports,
+)
+
+log = logging.getLogger(__name__)
+
 mergeable_outputs = [
     "create_final_documents",
     "create_final_entities",
@@ -69,11 +91,24 @@ async def get_delta_docs(
     return InputDelta(new_docs, deleted_docs)
 
 
+
+
 async def update_dataframe_outputs(
     dataframe_dict: dict[str, pd.DataFrame],
     storage: PipelineStorage,
+    workflows: list[PipelineWorkflowReference] | None = None,
+    cache: PipelineCache | None = None,
+    callbacks: WorkflowCallbacks | None = None,
+    additional_verbs: VerbDefinitions | None = None,
+    additional_workflows: WorkflowDefinitions | None = None,
 ) -> None:
-    """Update the mergeable outputs.
+    """Merge the outputs of a delta run into the outputs of the index.
+
+    Entities and relationships are merged by name and by (source, target). Rows of the
+    existing outputs that the delta does not touch are written back unchanged; only
+    new and merged rows are embedded. New nodes are placed in the existing
+    communities, and only the reports of the communities that contain a new or
+    changed entity or relationship are regenerated.
 
     Parameters
     ----------
@@ -81,21 +116,139 @@ async def update_dataframe_outputs(
         The dictionary of dataframes.
     storage : PipelineStorage
         The storage used to store the dataframes.
+    workflows : list[PipelineWorkflowReference] | None
+        The workflows of the index, used for the embedding and report settings.
+    cache : PipelineCache | None
+        The cache used for the embeddings and the reports.
+    callbacks : WorkflowCallbacks | None
+        The callbacks of the run.
     """
+    references = {reference.name: reference for reference in workflows or []}
+
+    def workflow_config(name: str) -> dict:
+        reference = references.get(name)
+        return disable_vector_store_overwrite(
+            reference.config or {} if reference is not None else {}
+        )
+
     await _concat_dataframes("create_base_text_units", dataframe_dict, storage)
     await _concat_dataframes("create_final_documents", dataframe_dict, storage)
 
-    old_entities = await _load_table_from_storage(
-        "create_final_entities.parquet", storage
+    old_nodes = await _load_table_from_storage("create_final_nodes.parquet", storage)
+    entities, entity_id_mapping, changed_names, new_names = _merge_entities(
+        await _load_table_from_storage("create_final_entities.parquet", storage),
+        dataframe_dict["create_final_entities"],
+    )
+    relationships, relationship_id_mapping, updated_relationship_ids, degrees = (
+        _merge_relationships(
+            await _load_table_from_storage(
+                "create_final_relationships.parquet", storage
+            ),
+            dataframe_dict["create_final_relationships"],
+            dict(zip(old_nodes["title"], old_nodes["degree"], strict=True)),
+        )
+    )
+    log.info(
+        "update merged %d new and %d changed entities, %d new or changed relationships",
+        len(new_names),
+        len(changed_names),
+        len(updated_relationship_ids),
+    )
+
+    entities = await _embed_entities(
+        entities,
+        changed_names,
+        set(new_names),
+        workflow_config("create_final_entities"),
+        cache,
+    )
+    relationships = await _embed_relationships(
+        relationships,
+        updated_relationship_ids,
+        workflow_config("create_final_relationships"),
+        cache,
     )
-    delta_entities = dataframe_dict["create_final_entities"]
+    await _write_table("create_final_entities", entities, storage)
+    await _write_table("create_final_relationships", relationships, storage)
+
+    nodes, placed_names = _update_nodes(
+        old_nodes,
+        dataframe_dict["create_final_nodes"],
+        entities,
+        relationships,
+        changed_names,
+        new_names,
+        degrees,
+    )
+    await _write_table("create_final_nodes", nodes, storage)
 
-    merged_entities_df, _ = _group_and_resolve_entities(old_entities, delta_entities)
-    # Save the updated entities back to storage
-    # TODO: Using _new in the mean time, to compare outputs without overwriting the original
-    await storage.set(
-        "create_final_entities_new.parquet", merged_entities_df.to_parquet()
+    updated_relationships = relationships.loc[
+        relationships["id"].isin(updated_relationship_ids)
+    ]
+    community_ids = _get_affected_communities(
+        nodes,
+        {
+            *changed_names,
+            *new_names,
+            *placed_names,
+            *degrees,
+            *updated_relationships["source"],
+            *updated_relationships["target"],
+        },
     )
+    log.info("update affects %d communities", len(community_ids))
+    if community_ids:
+        communities = _update_communities(
+            await _load_table_from_storage("create_final_communities.parquet", storage),
+            nodes,
+            relationships,
+            community_ids,
+        )
+        await _write_table("create_final_communities", communities, storage)
+
+    text_units = _merge_text_units(
+        await _load_table_from_storage("create_final_text_units.parquet", storage),
+        dataframe_dict["create_final_text_units"],
+        entity_id_mapping,
+        relationship_id_mapping,
+    )
+    await _write_table("create_final_text_units", text_units, storage)
+
+    covariates = None
+    if "create_final_covariates" in dataframe_dict:
+        covariates = _concat_covariates(
+            await _load_table_from_storage("create_final_covariates.parquet", storage),
+            dataframe_dict["create_final_covariates"],
+        )
+        await _write_table("create_final_covariates", covariates, storage)
+
+    reports_reference = references.get(COMMUNITY_REPORTS_WORKFLOW)
+    if (
+        community_ids
+        and reports_reference is not None
+        and await storage.has(f"{COMMUNITY_REPORTS_WORKFLOW}.parquet")
+    ):
+        reports = await update_community_reports(
+            reports_reference,
+            nodes,
+            relationships,
+            covariates,
+            await _load_table_from_storage(
+                f"{COMMUNITY_REPORTS_WORKFLOW}.parquet", storage
+            ),
+            community_ids,
+            storage,
+            cache,
+            callbacks or NoopWorkflowCallbacks(),
+            additional_verbs,
+            additional_workflows,
+        )
+        await _write_table(COMMUNITY_REPORTS_WORKFLOW, reports, storage)
+
+
+async def _write_table(name: str, table: pd.DataFrame, storage: PipelineStorage):
+    """Write an updated output table over the existing one."""
+    await storage.set(f"{name}.parquet", table.to_parquet())
 
 
 async def _concat_dataframes(name, dataframe_dict, storage):
@@ -114,79 +267,314 @@ async def _concat_dataframes(name, dataframe_dict, storage):
     delta_df = dataframe_dict[name]
 
     # Merge the final documents
-    final_df = pd.concat([old_df, delta_df], copy=False)
+    final_df = pd.concat([old_df, delta_df], ignore_index=True, copy=False)
+
+    await _write_table(name, final_df, storage)
 
-    # TODO: Using _new in the mean time, to compare outputs without overwriting the original
-    await storage.set(f"{name}_new.parquet", final_df.to_parquet())
 
+def _merge_entities(
+    old_entities: pd.DataFrame, delta_entities: pd.DataFrame
+) -> tuple[pd.DataFrame, dict[str, str], set[str], list[str]]:
+    """Merge the delta entities into the existing entities by name.
+
+    Parameters
+    ----------
+    old_entities : pd.DataFrame
+        The existing final entities.
+    delta_entities : pd.DataFrame
+        The final entities of the delta run.
 
-def _group_and_resolve_entities(
-    df_a: pd.DataFrame, df_b: pd.DataFrame
-) -> tuple[pd.DataFrame, dict]:
-    """Group and resolve entities.
+    Returns
+    -------
+    pd.DataFrame
+        The merged entities. Existing rows keep their position and id, entities that
+        also occur in the delta get both descriptions and text units. New entities
+        are appended with new ids and the next human readable ids.
+    dict
+        The id mapping for all delta entities. In the form of {delta.id: merged.id}.
+    set[str]
+        The names of the existing entities that were changed.
+    list[str]
+        The names of the new entities.
+    """
+    position_of: dict[str, int] = {}
+    for position, name in enumerate(old_entities["name"]):
+        position_of.setdefault(name, position)
+
+    entities = old_entities.copy()
+    ids = entities["id"].tolist()
+    descriptions = entities["description"].tolist()
+    text_unit_ids = entities["text_unit_ids"].tolist()
+    id_mapping: dict[str, str] = {}
+    changed_names: set[str] = set()
+    new_rows = []
+    for row in delta_entities.to_dict("records"):
+        position = position_of.get(row["name"])
+        if position is None:
+            # ids are seeded per run, so the delta run can repeat existing ids
+            id_mapping[row["id"]] = row["id"] = str(uuid4())
+            new_rows.append(row)
+            continue
+        id_mapping[row["id"]] = ids[position]
+        descriptions[position] = os.linesep.join([
+            str(descriptions[position]),
+            str(row["description"]),
+        ])
+        text_unit_ids[position] = _union(text_unit_ids[position], row["text_unit_ids"])
+        changed_names.add(row["name"])
+    entities["description"] = descriptions
+    entities["text_unit_ids"] = text_unit_ids
+
+    new_names = [row["name"] for row in new_rows]
+    if new_rows:
+        added = pd.DataFrame(new_rows).reindex(columns=entities.columns)
+        start = int(entities["human_readable_id"].max()) + 1 if len(entities) else 0
+        added["human_readable_id"] = range(start, start + len(added))
+        entities = pd.concat([entities, added], ignore_index=True)
+    return entities, id_mapping, changed_names, new_names
+
+
+def _merge_relationships(
+    old_relationships: pd.DataFrame,
+    delta_relationships: pd.DataFrame,
+    node_degrees: dict[str, int],
+) -> tuple[pd.DataFrame, dict[str, str], set[str], dict[str, int]]:
+    """Merge the delta relationships into the existing relationships.
+
+    Relationships are matched on their (unordered) source and target.
 
     Parameters
     ----------
-    df_a : pd.DataFrame
-        The first dataframe.
-    df_b : pd.DataFrame
-        The second dataframe.
+    old_relationships : pd.DataFrame
+        The existing final relationships.
+    delta_relationships : pd.DataFrame
+        The final relationships of the delta run.
+    node_degrees : dict[str, int]
+        The degree of each existing node.
 
     Returns
     -------
     pd.DataFrame
-        The resolved dataframe.
+        The merged relationships. Matched relationships get both descriptions, the
+        summed weight and both text units; new relationships are appended. The
+        degrees and rank are updated for the relationships of nodes that gained edges.
     dict
-        The id mapping for existing entities. In the form of {df_b.id: df_a.id}.
+        The id mapping for all delta relationships. In the form of {delta.id: merged.id}.
+    set[str]
+        The ids of the new and changed relationships.
+    dict[str, int]
+        The new degree of each node that gained edges.
     """
-    # If a name exists in A and B, make a dictionary for {B.id : A.id}
-    merged = df_b[["id", "name"]].merge(
-        df_a[["id", "name"]],
-        on="name",
-        suffixes=("_B", "_A"),
-        copy=False,
+    position_of: dict[tuple[str, str], int] = {}
+    for position, (source, target) in enumerate(
+        zip(old_relationships["source"], old_relationships["target"], strict=True)
+    ):
+        position_of.setdefault(_edge_key(source, target), position)
+
+    relationships = old_relationships.copy()
+    ids = relationships["id"].tolist()
+    descriptions = relationships["description"].tolist()
+    weights = relationships["weight"].tolist()
+    text_unit_ids = relationships["text_unit_ids"].tolist()
+    id_mapping: dict[str, str] = {}
+    updated_ids: set[str] = set()
+    degree_gain: Counter[str] = Counter()
+    new_rows = []
+    for row in delta_relationships.to_dict("records"):
+        position = position_of.get(_edge_key(row["source"], row["target"]))
+        if position is None:
+            id_mapping[row["id"]] = row["id"] = str(uuid4())
+            new_rows.append(row)
+            updated_ids.add(row["id"])
+            degree_gain[row["source"]] += 1
+            degree_gain[row["target"]] += 1
+            continue
+        id_mapping[row["id"]] = ids[position]
+        descriptions[position] = os.linesep.join([
+            str(descriptions[position]),
+            str(row["description"]),
+        ])
+        weights[position] += row["weight"]
+        text_unit_ids[position] = _union(text_unit_ids[position], row["text_unit_ids"])
+        updated_ids.add(ids[position])
+    relationships["description"] = descriptions
+    relationships["weight"] = weights
+    relationships["text_unit_ids"] = text_unit_ids
+
+    if new_rows:
+        added = pd.DataFrame(new_rows).reindex(columns=relationships.columns)
+        start = (
+            int(relationships["human_readable_id"].astype(int).max()) + 1
+            if len(relationships)
+            else 0
+        )
+        added["human_readable_id"] = [
+            str(start + i) for i in range(len(added))
+        ]
+        relationships = pd.concat([relationships, added], ignore_index=True)
+
+    degrees = {
+        title: node_degrees.get(title, 0) + gain for title, gain in degree_gain.items()
+    }
+    rerank = (
+        relationships["source"].isin(degrees) | relationships["target"].isin(degrees)
+    ).to_numpy()
+    if rerank.any():
+
+        def degree_of(title: str) -> int:
+            return degrees.get(title, node_degrees.get(title, 0))
+
+        source_degrees = relationships["source_degree"].tolist()
+        target_degrees = relationships["target_degree"].tolist()
+        for position in np.flatnonzero(rerank):
+            source_degrees[position] = degree_of(relationships["source"].iat[position])
+            target_degrees[position] = degree_of(relationships["target"].iat[position])
+        relationships["source_degree"] = np.asarray(source_degrees, dtype=np.int64)
+        relationships["target_degree"] = np.asarray(target_degrees, dtype=np.int64)
+        relationships["rank"] = (
+            relationships["source_degree"] + relationships["target_degree"]
+        )
+    return relationships, id_mapping, updated_ids, degrees
+
+
+def _merge_text_units(
+    old_text_units: pd.DataFrame,
+    delta_text_units: pd.DataFrame,
+    entity_id_mapping: dict[str, str],
+    relationship_id_mapping: dict[str, str],
+) -> pd.DataFrame:
+    """Append the delta text units, pointing them to the merged entity and relationship ids."""
+    delta_text_units = delta_text_units.copy()
+    for column, mapping in [
+        ("entity_ids", entity_id_mapping),
+        ("relationship_ids", relationship_id_mapping),
+    ]:
+        if column in delta_text_units.columns:
+            delta_text_units[column] = [
+                [mapping.get(id, id) for id in ids] if _is_list(ids) else ids
+                for ids in delta_text_units[column]
+            ]
+    return pd.concat([old_text_units, delta_text_units], ignore_index=True)
+
+
+def _concat_covariates(
+    old_covariates: pd.DataFrame, delta_covariates: pd.DataFrame
+) -> pd.DataFrame:
+    """Append the delta covariates, continuing the human readable ids."""
+    delta_covariates = delta_covariates.copy()
+    start = (
+        int(old_covariates["human_readable_id"].astype(int).max())
+        if len(old_covariates)
+        else 0
+    )
+    delta_covariates["human_readable_id"] = [
+        str(start + i + 1) for i in range(len(delta_covariates))
+    ]
+    return pd.concat([old_covariates, delta_covariates], ignore_index=True)
+
+
+async def _embed_entities(
+    entities: pd.DataFrame,
+    changed_names: set[str],
+    new_names: set[str],
+    config: dict,
+    cache: PipelineCache | None,
+) -> pd.DataFrame:
+    """Embed the new entities and the changed descriptions, as create_final_entities does."""
+    base_text_embed = config.get("text_embed", {})
+    if not config.get("skip_name_embedding", False):
+        entities = await _embed_rows(
+            entities,
+            entities["name"].isin(new_names).to_numpy(),
+            "name",
+            "name_embedding",
+            config.get("entity_name_embed", base_text_embed),
+            "entity_name",
+            cache,
+        )
+    if not config.get("skip_description_embedding", False):
+        entities = entities.assign(
+            name_description=entities["name"] + ":" + entities["description"]
+        )
+        entities = await _embed_rows(
+            entities,
+            entities["name"].isin(changed_names | new_names).to_numpy(),
+            "name_description",
+            "description_embedding",
+            config.get("entity_name_description_embed", base_text_embed),
+            "entity_name_description",
+            cache,
+        )
+        entities = entities.drop(columns="name_description")
+    return entities
+
+
+async def _embed_relationships(
+    relationships: pd.DataFrame,
+    updated_ids: set[str],
+    config: dict,
+    cache: PipelineCache | None,
+) -> pd.DataFrame:
+    """Embed the new and changed relationship descriptions."""
+    if config.get("skip_description_embedding", False):
+        return relationships
+    return await _embed_rows(
+        relationships,
+        relationships["id"].isin(updated_ids).to_numpy(),
+        "description",
+        "description_embedding",
+        config.get("relationship_description_embed", config.get("text_embed", {})),
+        "relationship_description",
+        cache,
     )
-    id_mapping = dict(zip(merged["id_B"], merged["id_A"], strict=True))
-
-    # Concat A and B
-    combined = pd.concat([df_a, df_b], copy=False)
-
-    # Group by name and resolve conflicts
-    aggregated = (
-        combined.groupby("name")
-        .agg({
-            "id": "first",
-            "type": "first",
-            "human_readable_id": "first",
-            "graph_embedding": "first",
-            "description": lambda x: os.linesep.join(x.astype(str)),  # Ensure str
-            # Concatenate nd.array into a single list
-            "text_unit_ids": lambda x: ",".join(str(i) for j in x.tolist() for i in j),
-            # Keep only descriptions where the original value wasn't modified
-            "description_embedding": lambda x: x.iloc[0] if len(x) == 1 else np.nan,
-        })
-        .reset_index()
+
+
+async def _embed_rows(
+    table: pd.DataFrame,
+    rows: np.ndarray,
+    column: str,
+    to: str,
+    text_embed: dict,
+    embedding_name: str,
+    cache: PipelineCache | None,
+) -> pd.DataFrame:
+    """Embed the selected rows of a table, keeping the embeddings of all other rows."""
+    positions = np.flatnonzero(rows)
+    if len(positions) == 0:
+        return table
+    embedded = await text_embed_df(
+        table.iloc[positions].copy(),
+        NoopVerbCallbacks(),
+        cache or InMemoryCache(),
+        column=column,
+        strategy=text_embed["strategy"],
+        to=to,
+        embedding_name=embedding_name,
     )
+    # with a vector store the embeddings may only be stored there
+    if to not in embedded.columns or to not in table.columns:
+        return table
+    values = table[to].tolist()
+    for position, vector in zip(positions, embedded[to], strict=True):
+        values[position] = vector
+    table = table.copy()
+    table[to] = values
+    return table
 
-    # Force the result into a DataFrame
-    resolved: pd.DataFrame = pd.DataFrame(aggregated)
 
-    # Recreate humand readable id with an autonumeric
-    resolved["human_readable_id"] = range(len(resolved))
+def _edge_key(source: str, target: str) -> tuple[str, str]:
+    return (source, target) if source <= target else (target, source)
 
-    # Modify column order to keep consistency
-    resolved = resolved.loc[
-        :,
-        [
-            "id",
-            "name",
-            "description",
-            "type",
-            "human_readable_id",
-            "graph_embedding",
-            "text_unit_ids",
-            "description_embedding",
-        ],
-    ]
 
-    return resolved, id_mapping
+def _is_list(value: Any) -> bool:
+    return isinstance(value, list | np.ndarray)
+
+
+def _union(old: Any, new: Any) -> list:
+    """Concatenate two lists of ids, dropping the duplicates."""
+    return list(
+        dict.fromkeys([
+            *(old if _is_list(old) else []),
+            *(new if _is_list(new) else []),
+        ])
+    )
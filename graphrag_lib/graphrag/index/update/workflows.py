@@ -0,0 +1,178 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Workflow operations for Incremental Indexing."""
+
+from typing import Any, cast
+
+import pandas as pd
+from datashaper import WorkflowCallbacks
+
+from graphrag.index.cache import InMemoryCache, PipelineCache
+from graphrag.index.config import PipelineWorkflowReference
+from graphrag.index.context import PipelineRunContext, PipelineRunStats
+from graphrag.index.storage.typing import PipelineStorage
+from graphrag.index.workflows import VerbDefinitions, WorkflowDefinitions
+from graphrag.index.workflows.load import create_workflow
+
+COMMUNITY_REPORTS_WORKFLOW = "create_final_community_reports"
+
+
+def get_delta_workflows(
+    workflows: list[PipelineWorkflowReference],
+) -> list[PipelineWorkflowReference]:
+    """Get the workflows to run on the new documents of an update run.
+
+    The community reports are skipped, they are regenerated after the merge for the
+    affected communities only. Entity and relationship description embeddings are
+    skipped as well, since merged entities and relationships get new descriptions.
+    Vector stores are appended to instead of overwritten.
+
+    Parameters
+    ----------
+    workflows : list[PipelineWorkflowReference]
+        The workflows of the index.
+
+    Returns
+    -------
+    list[PipelineWorkflowReference]
+        The workflows for the delta run.
+    """
+    delta_workflows = []
+    for reference in workflows:
+        if reference.name == COMMUNITY_REPORTS_WORKFLOW:
+            continue
+        config = disable_vector_store_overwrite(reference.config or {})
+        if reference.name == "create_final_entities":
+            config = {
+                **config,
+                "skip_name_embedding": True,
+                "skip_description_embedding": True,
+            }
+        elif reference.name == "create_final_relationships":
+            config = {**config, "skip_description_embedding": True}
+        delta_workflows.append(reference.model_copy(update={"config": config}))
+    return delta_workflows
+
+
+def disable_vector_store_overwrite(config: Any) -> Any:
+    """Return a copy of a workflow config whose vector stores are appended to.
+
+    Parameters
+    ----------
+    config : Any
+        The workflow config, or a value inside of it.
+
+    Returns
+    -------
+    Any
+        The config with `overwrite` disabled for every vector store.
+    """
+    if isinstance(config, list):
+        return [disable_vector_store_overwrite(value) for value in config]
+    if not isinstance(config, dict):
+        return config
+    result = {key: disable_vector_store_overwrite(value) for key, value in config.items()}
+    vector_store = result.get("vector_store")
+    if isinstance(vector_store, dict):
+        # embedding specific settings override the vector store settings
+        result["vector_store"] = {
+            **{
+                key: {**value, "overwrite": False} if isinstance(value, dict) else value
+                for key, value in vector_store.items()
+            },
+            "overwrite": False,
+        }
+    return result
+
+
+async def update_community_reports(
+    reference: PipelineWorkflowReference,
+    nodes: pd.DataFrame,
+    relationships: pd.DataFrame,
+    covariates: pd.DataFrame | None,
+    previous_reports: pd.DataFrame,
+    community_ids: list[str],
+    storage: PipelineStorage,
+    cache: PipelineCache | None,
+    callbacks: WorkflowCallbacks,
+    additional_verbs: VerbDefinitions | None = None,
+    additional_workflows: WorkflowDefinitions | None = None,
+) -> pd.DataFrame:
+    """Regenerate the reports of the given communities.
+
+    Parameters
+    ----------
+    reference : PipelineWorkflowReference
+        The community reports workflow of the index.
+    nodes : pd.DataFrame
+        The updated final nodes.
+    relationships : pd.DataFrame
+        The merged final relationships.
+    covariates : pd.DataFrame | None
+        The merged final covariates, if claims are extracted.
+    previous_reports : pd.DataFrame
+        The existing final community reports.
+    community_ids : list[str]
+        The communities whose reports are regenerated.
+    storage : PipelineStorage
+        The storage of the index.
+    cache : PipelineCache | None
+        The cache used for the LLM calls.
+    callbacks : WorkflowCallbacks
+        The callbacks of the run.
+
+    Returns
+    -------
+    pd.DataFrame
+        The community reports, with the regenerated reports in place of the old ones
+        and the reports of new communities appended.
+    """
+    if not community_ids:
+        return previous_reports
+
+    config = {
+        **disable_vector_store_overwrite(reference.config or {}),
+        "update_community_ids": community_ids,
+    }
+    workflow = create_workflow(
+        COMMUNITY_REPORTS_WORKFLOW,
+        reference.steps,
+        config,
+        additional_verbs,
+        additional_workflows,
+    )
+    workflow.add_table("workflow:create_final_nodes", nodes)
+    workflow.add_table("workflow:create_final_relationships", relationships)
+    if covariates is not None:
+        workflow.add_table("workflow:create_final_covariates", covariates)
+    workflow.add_table("previous_community_reports", previous_reports)
+
+    context = PipelineRunContext(
+        stats=PipelineRunStats(),
+        storage=storage,
+        cache=cache or InMemoryCache(),
+    )
+    await workflow.run(context, callbacks)
+    regenerated = cast(pd.DataFrame, workflow.output())
+    workflow.dispose()
+    if regenerated.empty:
+        return previous_reports
+
+    regenerated = regenerated.reindex(columns=previous_reports.columns)
+    regenerated_by_community = regenerated.set_index(
+        regenerated["community"].astype(str)
+    )
+    communities = previous_reports["community"].astype(str)
+    replaced = communities.isin(regenerated_by_community.index)
+
+    reports = previous_reports.copy()
+    for column in reports.columns:
+        reports[column] = [
+            regenerated_by_community.at[community, column] if is_replaced else value
+            for community, is_replaced, value in zip(
+                communities, replaced, reports[column], strict=True
+            )
+        ]
+    added = regenerated.loc[~regenerated_by_community.index.isin(communities)]
+    return pd.concat([reports, added], ignore_index=True)
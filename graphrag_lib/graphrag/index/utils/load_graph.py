@@ -1,11 +1,48 @@
 # Copyright (c) 2024 Microsoft Corporation.
 # Licensed under the MIT License
 
-"""Networkx load_graph utility definition."""
+"""Networkx load_graph, graph_to_graphml and serialize_graphs utility definitions."""
 
 import networkx as nx
+import pandas as pd
 
 
-def load_graph(graphml: str | nx.Graph) -> nx.Graph:
-    """Load a graph from a graphml file or a networkx graph."""
-    return nx.parse_graphml(graphml) if isinstance(graphml, str) else graphml
+def load_graph(graphml: str | nx.Graph, copy: bool = False) -> nx.Graph:
+    """Load a graph from a graphml file or a networkx graph.
+
+    Graphs are handed between verbs and workflows by reference; pass `copy=True`
+    to get a graph that may be modified without changing the input.
+    """
+    if isinstance(graphml, str):
+        return nx.parse_graphml(graphml)
+    return graphml.copy() if copy else graphml
+
+
+def graph_to_graphml(graph: str | nx.Graph) -> str:
+    """Serialize a networkx graph to a graphml string."""
+    if isinstance(graph, str):
+        return graph
+    return "\n".join(nx.generate_graphml(graph))
+
+
+def serialize_graphs(table: pd.DataFrame) -> pd.DataFrame:
+    """Return the table with its networkx graph values replaced by graphml strings.
+
+    Graph columns stay in memory as networkx graphs while the pipeline runs; they are
+    only turned into graphml when a table is written out.
+    """
+    graph_columns = [
+        column
+        for column in table.columns
+        if table[column].dtype == object
+        and any(isinstance(value, nx.Graph) for value in table[column].dropna().head(1))
+    ]
+    if not graph_columns:
+        return table
+    table = table.copy()
+    for column in graph_columns:
+        table[column] = [
+            graph_to_graphml(value) if isinstance(value, nx.Graph) else value
+            for value in table[column]
+        ]
+    return table
@@ -3,7 +3,6 @@
 
 """A module containing run_gi,  run_extract_entities and _create_text_splitter methods to run graph intelligence."""
 
-import networkx as nx
 from datashaper import VerbCallbacks
 
 import graphrag.config.defaults as defs
@@ -63,6 +62,9 @@ async def run_extract_entities(
     extraction_prompt = args.get("extraction_prompt", None)
     encoding_model = args.get("encoding_name", None)
     max_gleanings = args.get("max_gleanings", defs.ENTITY_EXTRACTION_MAX_GLEANINGS)
+    gleaning_early_exit = args.get(
+        "gleaning_early_exit", defs.ENTITY_EXTRACTION_GLEANING_EARLY_EXIT
+    )
 
     # note: We're not using UnipartiteGraphChain.from_params
     # because we want to pass "timeout" to the llm_kwargs
@@ -75,6 +77,7 @@ async def run_extract_entities(
         prompt=extraction_prompt,
         encoding_model=encoding_model,
         max_gleanings=max_gleanings,
+        gleaning_early_exit=gleaning_early_exit,
         on_error=lambda e, s, d: (
             reporter.error("Entity Extraction Error", e, s, d) if reporter else None
         ),
@@ -115,8 +118,7 @@ async def run_extract_entities(
         if item is not None
     ]
 
-    graph_data = "".join(nx.generate_graphml(graph))
-    return EntityExtractionResult(entities, graph_data)
+    return EntityExtractionResult(entities, graph)
 
 
 def _create_text_splitter(
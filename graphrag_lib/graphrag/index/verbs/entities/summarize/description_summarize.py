@@ -66,8 +66,8 @@ async def summarize_descriptions(
     {
         "verb": "",
         "args": {
-            "column": "the_document_text_column_to_extract_descriptions_from", /* Required: This will be a graphml graph in string form which represents the entities and their relationships */
-            "to": "the_column_to_output_the_summarized_descriptions_to", /* Required: This will be a graphml graph in string form which represents the entities and their relationships after being summarized */
+            "column": "the_document_text_column_to_extract_descriptions_from", /* Required: This will be a networkx graph (or a graphml string) which represents the entities and their relationships */
+            "to": "the_column_to_output_the_summarized_descriptions_to", /* Required: This will be a networkx graph which represents the entities and their relationships after being summarized */
             "strategy": {...} <strategy_config>, see strategies section below
         }
     }
@@ -119,7 +119,10 @@ async def summarize_descriptions(
     strategy_config = {**strategy}
 
     async def get_resolved_entities(row, semaphore: asyncio.Semaphore):
-        graph: nx.Graph = load_graph(cast(str | nx.Graph, getattr(row, column)))
+        # the input graph may be shared with other workflows, so summarize a copy
+        graph: nx.Graph = load_graph(
+            cast(str | nx.Graph, getattr(row, column)), copy=True
+        )
 
         ticker_length = len(graph.nodes) + len(graph.edges)
 
@@ -153,9 +156,7 @@ async def summarize_descriptions(
             elif isinstance(graph_item, tuple) and graph_item in graph.edges():
                 graph.edges[graph_item]["description"] = result.description
 
-        return DescriptionSummarizeRow(
-            graph="\n".join(nx.generate_graphml(graph)),
-        )
+        return DescriptionSummarizeRow(graph=graph)
 
     async def do_summarize_descriptions(
         graph_item: str | tuple[str, str],
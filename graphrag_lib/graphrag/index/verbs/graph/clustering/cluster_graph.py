@@ -30,13 +30,13 @@ def cluster_graph(
     **_kwargs,
 ) -> TableContainer:
     """
-    Apply a hierarchical clustering algorithm to a graph. The graph is expected to be in graphml format. The verb outputs a new column containing the clustered graph, and a new column containing the level of the graph.
+    Apply a hierarchical clustering algorithm to a graph. The graph is expected to be a networkx graph or a graphml string. The verb outputs a new column containing the clustered networkx graph, and a new column containing the level of the graph.
 
     ## Usage
     ```yaml
     verb: cluster_graph
     args:
-        column: entity_graph # The name of the column containing the graph, should be a graphml graph
+        column: entity_graph # The name of the column containing the graph, should be a networkx graph or a graphml string
         to: clustered_graph # The name of the column to output the clustered graph to
         level_to: level # The name of the column to output the level to
         strategy: <strategy config> # See strategies section below
@@ -58,7 +58,9 @@ def cluster_graph(
     ```
     """
     output_df = cast(pd.DataFrame, input.get_input())
-    results = output_df[column].apply(lambda graph: run_layout(strategy, graph))
+    # load each graph once; the clustering and every level below work from it
+    graphs = [load_graph(cast(str | nx.Graph, graph)) for graph in output_df[column]]
+    results = [run_layout(strategy, graph) for graph in graphs]
 
     community_map_to = "communities"
     output_df[community_map_to] = results
@@ -75,26 +77,24 @@ def cluster_graph(
     seed = strategy.get("seed", Random().randint(0, 0xFFFFFFFF))  # noqa S311
 
     # Go through each of the rows
-    graph_level_pairs_column: list[list[tuple[int, str]]] = []
-    for _, row in progress_iterable(
-        output_df.iterrows(), callbacks.progress, num_total
+    graph_level_pairs_column: list[list[tuple[int, nx.Graph]]] = []
+    for graph, (_, row) in zip(
+        graphs,
+        progress_iterable(output_df.iterrows(), callbacks.progress, num_total),
+        strict=True,
     ):
         levels = row[level_to]
-        graph_level_pairs: list[tuple[int, str]] = []
+        graph_level_pairs: list[tuple[int, nx.Graph]] = []
 
         # For each of the levels, get the graph and add it to the list
         for level in levels:
-            graph = "\n".join(
-                nx.generate_graphml(
-                    apply_clustering(
-                        cast(str, row[column]),
-                        cast(Communities, row[community_map_to]),
-                        level,
-                        seed=seed,
-                    )
-                )
+            clustered = apply_clustering(
+                graph,
+                cast(Communities, row[community_map_to]),
+                level,
+                seed=seed,
             )
-            graph_level_pairs.append((level, graph))
+            graph_level_pairs.append((level, clustered))
         graph_level_pairs_column.append(graph_level_pairs)
     output_df[to] = graph_level_pairs_column
 
@@ -113,13 +113,15 @@ def cluster_graph(
     return TableContainer(table=output_df)
 
 
-# TODO: This should support str | nx.Graph as a graphml param
 def apply_clustering(
-    graphml: str, communities: Communities, level: int = 0, seed: int | None = None
+    graphml_or_graph: str | nx.Graph,
+    communities: Communities,
+    level: int = 0,
+    seed: int | None = None,
 ) -> nx.Graph:
-    """Apply clustering to a graphml string."""
+    """Apply clustering to a copy of a graph or a graphml string."""
     random = Random(seed)  # noqa S311
-    graph = nx.parse_graphml(graphml)
+    graph = load_graph(graphml_or_graph, copy=True)
     for community_level, community_id, nodes in communities:
         if level == community_level:
             for node in nodes:
@@ -38,13 +38,13 @@ def layout_graph(
     **_kwargs: dict,
 ) -> TableContainer:
     """
-    Apply a layout algorithm to a graph. The graph is expected to be in graphml format. The verb outputs a new column containing the laid out graph.
+    Apply a layout algorithm to a graph. The graph is expected to be a networkx graph or a graphml string. The verb outputs a new column containing the laid out graph.
 
     ## Usage
     ```yaml
     verb: layout_graph
     args:
-        graph_column: clustered_graph # The name of the column containing the graph, should be a graphml graph
+        graph_column: clustered_graph # The name of the column containing the graph, should be a networkx graph or a graphml string
         embeddings_column: embeddings # The name of the column containing the embeddings
         to: node_positions # The name of the column to output the node positions to
         graph_to: positioned_graph # The name of the column to output the positioned graph to
@@ -146,11 +146,12 @@ def _run_layout(
 
 def _apply_layout_to_graph(
     graphml_or_graph: str | nx.Graph, layout: GraphLayout
-) -> str:
-    graph = load_graph(graphml_or_graph)
+) -> nx.Graph:
+    # the input graph may be shared with other workflows, so position a copy
+    graph = load_graph(graphml_or_graph, copy=True)
     for node_position in layout:
         if node_position.label in graph.nodes:
             graph.nodes[node_position.label]["x"] = node_position.x
             graph.nodes[node_position.label]["y"] = node_position.y
             graph.nodes[node_position.label]["size"] = node_position.size
-    return "\n".join(nx.generate_graphml(graph))
+    return graph
@@ -35,7 +35,7 @@ def merge_graphs(
     **_kwargs,
 ) -> TableContainer:
     """
-    Merge multiple graphs together. The graphs are expected to be in graphml format. The verb outputs a new column containing the merged graph.
+    Merge multiple graphs together. The graphs are expected to be networkx graphs or graphml strings. The verb outputs a new column containing the merged networkx graph.
 
     > Note: This will merge all rows into a single graph.
 
@@ -43,7 +43,7 @@ def merge_graphs(
     ```yaml
     verb: merge_graph
     args:
-        column: clustered_graph # The name of the column containing the graph, should be a graphml graph
+        column: clustered_graph # The name of the column containing the graph, should be a networkx graph or a graphml string
         to: merged_graph # The name of the column to output the merged graph to
         nodes: <node operations> # See node operations section below
         edges: <edge operations> # See edge operations section below
@@ -101,7 +101,7 @@ def merge_graphs(
         merge_nodes(mega_graph, graph, node_ops)
         merge_edges(mega_graph, graph, edge_ops)
 
-    output[to] = ["\n".join(nx.generate_graphml(mega_graph))]
+    output[to] = [mega_graph]
 
     return TableContainer(table=output)
 
@@ -26,7 +26,10 @@ from graphrag.index.graph.extractors.community_reports import (
     get_levels,
     prep_community_report_context,
 )
-from graphrag.index.utils.ds_util import get_required_input_table
+from graphrag.index.utils.ds_util import (
+    get_named_input_table,
+    get_required_input_table,
+)
 
 from .strategies.typing import CommunityReport, CommunityReportsStrategy
 
@@ -51,24 +54,39 @@ async def create_community_reports(
     strategy: dict,
     async_mode: AsyncType = AsyncType.AsyncIO,
     num_threads: int = 4,
+    community_ids: list[str] | None = None,
     **_kwargs,
 ) -> TableContainer:
-    """Generate entities for each row, and optionally a graph of those entities."""
+    """Generate entities for each row, and optionally a graph of those entities.
+
+    When `community_ids` is given, only the reports of those communities are generated
+    and returned. The reports of the other communities are read from the optional
+    `previous_reports` input, so that they can still stand in for the local context of
+    a parent community that is regenerated.
+    """
     log.debug("create_community_reports strategy=%s", strategy)
     local_contexts = cast(pd.DataFrame, input.get_input())
     nodes_ctr = get_required_input_table(input, "nodes")
     nodes = cast(pd.DataFrame, nodes_ctr.table)
     community_hierarchy_ctr = get_required_input_table(input, "community_hierarchy")
     community_hierarchy = cast(pd.DataFrame, community_hierarchy_ctr.table)
+    previous_reports = _get_previous_reports(input, community_ids)
+
+    num_reports = len(local_contexts)
+    if community_ids is not None:
+        community_ids = [str(community) for community in community_ids]
+        num_reports = int(
+            local_contexts[schemas.NODE_COMMUNITY].astype(str).isin(community_ids).sum()
+        )
 
     levels = get_levels(nodes)
     reports: list[CommunityReport | None] = []
-    tick = progress_ticker(callbacks.progress, len(local_contexts))
+    tick = progress_ticker(callbacks.progress, num_reports)
     runner = load_strategy(strategy["type"])
 
     for level in levels:
         level_contexts = prep_community_report_context(
-            pd.DataFrame(reports),
+            pd.DataFrame([*previous_reports, *reports]),
             local_context_df=local_contexts,
             community_hierarchy_df=community_hierarchy,
             level=level,
@@ -76,6 +94,10 @@ async def create_community_reports(
                 "max_input_tokens", defaults.COMMUNITY_REPORT_MAX_INPUT_LENGTH
             ),
         )
+        if community_ids is not None:
+            level_contexts = level_contexts.loc[
+                level_contexts[schemas.NODE_COMMUNITY].astype(str).isin(community_ids)
+            ]
 
         async def run_generate(record):
             result = await _generate_report(
@@ -102,6 +124,21 @@ async def create_community_reports(
     return TableContainer(table=pd.DataFrame(reports))
 
 
+def _get_previous_reports(
+    input: VerbInput, community_ids: list[str] | None
+) -> list[dict]:
+    """Get the existing reports of the communities that are not regenerated."""
+    previous_ctr = get_named_input_table(input, "previous_reports")
+    if previous_ctr is None or community_ids is None:
+        return []
+    previous = cast(pd.DataFrame, previous_ctr.table)
+    regenerated = {str(community) for community in community_ids}
+    kept = previous.loc[~previous[schemas.NODE_COMMUNITY].astype(str).isin(regenerated)]
+    return kept.loc[
+        :, [schemas.NODE_COMMUNITY, schemas.COMMUNITY_LEVEL, schemas.FULL_CONTENT]
+    ].to_dict("records")
+
+
 async def _generate_report(
     runner: CommunityReportsStrategy,
     cache: PipelineCache,
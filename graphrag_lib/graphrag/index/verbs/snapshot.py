@@ -6,6 +6,7 @@
 from datashaper import TableContainer, VerbInput, verb
 
 from graphrag.index.storage import PipelineStorage
+from graphrag.index.utils import serialize_graphs
 
 
 @verb(name="snapshot")
@@ -18,13 +19,14 @@ async def snapshot(
 ) -> TableContainer:
     """Take a entire snapshot of the tabular data."""
     data = input.get_input()
+    snapshot_data = serialize_graphs(data)
 
     for fmt in formats:
         if fmt == "parquet":
-            await storage.set(name + ".parquet", data.to_parquet())
+            await storage.set(name + ".parquet", snapshot_data.to_parquet())
         elif fmt == "json":
             await storage.set(
-                name + ".json", data.to_json(orient="records", lines=True)
+                name + ".json", snapshot_data.to_json(orient="records", lines=True)
             )
 
     return TableContainer(table=data)
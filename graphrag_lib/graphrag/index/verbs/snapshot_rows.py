@@ -7,9 +7,11 @@ import json
 from dataclasses import dataclass
 from typing import Any
 
+import networkx as nx
 from datashaper import TableContainer, VerbInput, verb
 
 from graphrag.index.storage import PipelineStorage
+from graphrag.index.utils import graph_to_graphml
 
 
 @dataclass
@@ -59,7 +61,11 @@ async def snapshot_rows(
                 if column is None:
                     msg = "column must be specified for text format"
                     raise ValueError(msg)
-                await storage.set(f"{row_name}.{extension}", str(row[column]))
+                value = row[column]
+                await storage.set(
+                    f"{row_name}.{extension}",
+                    graph_to_graphml(value) if isinstance(value, nx.Graph) else str(value),
+                )
 
     return TableContainer(table=data)
 
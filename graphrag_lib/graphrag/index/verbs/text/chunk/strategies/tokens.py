@@ -1,11 +1,13 @@
 # Copyright (c) 2024 Microsoft Corporation.
 # Licensed under the MIT License
 
-"""A module containing run and split_text_on_tokens methods definition."""
+"""A module containing run, run_batch and split_text_on_tokens methods definition."""
 
+import os
 from collections.abc import Iterable
 from typing import Any
 
+import numpy as np
 import tiktoken
 from datashaper import ProgressTicker
 
@@ -18,29 +20,91 @@ def run(
     input: list[str], args: dict[str, Any], tick: ProgressTicker
 ) -> Iterable[TextChunk]:
     """Chunks text into multiple parts. A pipeline verb."""
+    return run_batch([input], args, tick)[0]
+
+
+def run_batch(
+    inputs: list[list[str]], args: dict[str, Any], tick: ProgressTicker
+) -> list[list[TextChunk]]:
+    """Chunk several groups of documents, encoding every document exactly once.
+
+    All documents of all groups are encoded in one parallel `encode_batch` call
+    (tiktoken releases the GIL while encoding, so the threads run on all cores).
+    The chunks of a group are then cut from the token offsets of its documents, so
+    neither the chunk boundaries nor the token counts need the text to be encoded again.
+    """
     tokens_per_chunk = args.get("chunk_size", defs.CHUNK_SIZE)
     chunk_overlap = args.get("chunk_overlap", defs.CHUNK_OVERLAP)
     encoding_name = args.get("encoding_name", defs.ENCODING_MODEL)
+    num_threads = args.get("num_threads") or os.cpu_count() or 1
+    if tokens_per_chunk <= chunk_overlap:
+        msg = f"chunk_size ({tokens_per_chunk}) must be larger than chunk_overlap ({chunk_overlap})"
+        raise ValueError(msg)
     enc = tiktoken.get_encoding(encoding_name)
 
-    def encode(text: str) -> list[int]:
-        if not isinstance(text, str):
-            text = f"{text}"
-        return enc.encode(text)
-
-    def decode(tokens: list[int]) -> str:
-        return enc.decode(tokens)
-
-    return split_text_on_tokens(
-        input,
-        Tokenizer(
-            chunk_overlap=chunk_overlap,
-            tokens_per_chunk=tokens_per_chunk,
-            encode=encode,
-            decode=decode,
-        ),
-        tick,
+    texts = [
+        text if isinstance(text, str) else f"{text}"
+        for group in inputs
+        for text in group
+    ]
+    encoded = enc.encode_batch(texts, num_threads=num_threads)
+    tick(len(texts))
+
+    results: list[list[TextChunk]] = []
+    spans: list[np.ndarray] = []
+    cursor = 0
+    for group in inputs:
+        doc_tokens = encoded[cursor : cursor + len(group)]
+        cursor += len(group)
+        chunks, token_ids = _chunk_encoded_group(
+            doc_tokens, tokens_per_chunk, chunk_overlap
+        )
+        results.append(chunks)
+        spans.extend(token_ids)
+
+    # decode every chunk in one call as well; the chunks were created with empty text
+    decoded = enc.decode_batch(
+        [span.tolist() for span in spans], num_threads=num_threads
     )
+    chunk_texts = iter(decoded)
+    for chunks in results:
+        for chunk in chunks:
+            chunk.text_chunk = next(chunk_texts)
+    return results
+
+
+def _chunk_encoded_group(
+    doc_tokens: list[list[int]], tokens_per_chunk: int, chunk_overlap: int
+) -> tuple[list[TextChunk], list[np.ndarray]]:
+    """Slide the chunk window over the concatenated tokens of one group of documents."""
+    lengths = np.fromiter((len(ids) for ids in doc_tokens), dtype=np.int64)
+    doc_ends = np.cumsum(lengths)
+    doc_starts = doc_ends - lengths
+    total = int(doc_ends[-1]) if len(doc_ends) > 0 else 0
+    all_ids = (
+        np.concatenate([np.asarray(ids, dtype=np.uint32) for ids in doc_tokens])
+        if total > 0
+        else np.empty(0, dtype=np.uint32)
+    )
+    # documents without tokens can never be the source of a chunk
+    non_empty = np.flatnonzero(lengths > 0)
+    starts, ends = doc_starts[non_empty], doc_ends[non_empty]
+
+    chunks: list[TextChunk] = []
+    token_ids: list[np.ndarray] = []
+    for start in range(0, total, tokens_per_chunk - chunk_overlap):
+        end = min(start + tokens_per_chunk, total)
+        first = np.searchsorted(ends, start, side="right")
+        last = np.searchsorted(starts, end, side="left")
+        chunks.append(
+            TextChunk(
+                text_chunk="",
+                source_doc_indices=non_empty[first:last].tolist(),
+                n_tokens=end - start,
+            )
+        )
+        token_ids.append(all_ids[start:end])
+    return chunks, token_ids
 
 
 # Adapted from - https://github.com/langchain-ai/langchain/blob/77b359edf5df0d37ef0d539f678cf64f5557cb54/libs/langchain/langchain/text_splitter.py#L471
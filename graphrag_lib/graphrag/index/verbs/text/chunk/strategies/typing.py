@@ -1,7 +1,7 @@
 # Copyright (c) 2024 Microsoft Corporation.
 # Licensed under the MIT License
 
-"""A module containing ChunkStrategy definition."""
+"""A module containing ChunkStrategy and ChunkBatchStrategy definitions."""
 
 from collections.abc import Callable, Iterable
 from typing import Any
@@ -15,3 +15,8 @@ from graphrag.index.verbs.text.chunk.typing import TextChunk
 ChunkStrategy = Callable[
     [list[str], dict[str, Any], ProgressTicker], Iterable[TextChunk]
 ]
+
+# Given the document texts of several rows, return the chunks of each row
+ChunkBatchStrategy = Callable[
+    [list[list[str]], dict[str, Any], ProgressTicker], list[list[TextChunk]]
+]
@@ -1,8 +1,9 @@
 # Copyright (c) 2024 Microsoft Corporation.
 # Licensed under the MIT License
 
-"""A module containing _get_num_total, chunk, run_strategy and load_strategy methods definitions."""
+"""A module containing _get_num_total, chunk, run_strategy, load_strategy and load_batch_strategy methods definitions."""
 
+from collections.abc import Iterable
 from enum import Enum
 from typing import Any, cast
 
@@ -16,8 +17,9 @@ from datashaper import (
     verb,
 )
 
+from .strategies.typing import ChunkBatchStrategy as ChunkBatchStrategy
 from .strategies.typing import ChunkStrategy as ChunkStrategy
-from .typing import ChunkInput
+from .typing import ChunkInput, TextChunk
 
 
 def _get_num_total(output: pd.DataFrame, column: str) -> int:
@@ -105,18 +107,30 @@ def chunk_df(
         strategy = {}
     strategy_name = strategy.get("type", ChunkStrategyType.tokens)
     strategy_config = {**strategy}
-    strategy_exec = load_strategy(strategy_name)
 
     num_total = _get_num_total(output, column)
     tick = progress_ticker(callbacks.progress, num_total)
 
-    output[to] = output.apply(
-        cast(
-            Any,
-            lambda x: run_strategy(strategy_exec, x[column], strategy_config, tick),
-        ),
-        axis=1,
-    )
+    batch_exec = load_batch_strategy(strategy_name)
+    if batch_exec is not None:
+        # every row is encoded in one call, so each document is tokenized only once
+        rows = output[column].tolist()
+        strategy_results = batch_exec(
+            [_get_texts(input) for input in rows],
+            {**strategy_config},
+            tick,
+        )
+        output[to] = [
+            _map_strategy_results(input, results)
+            for input, results in zip(rows, strategy_results, strict=True)
+        ]
+        return output
+
+    strategy_exec = load_strategy(strategy_name)
+    output[to] = [
+        run_strategy(strategy_exec, input, strategy_config, tick)
+        for input in output[column]
+    ]
     return output
 
 
@@ -127,20 +141,23 @@ def run_strategy(
     tick: ProgressTicker,
 ) -> list[str | tuple[list[str] | None, str, int]]:
     """Run strategy method definition."""
-    if isinstance(input, str):
-        return [item.text_chunk for item in strategy([input], {**strategy_args}, tick)]
+    strategy_results = strategy(_get_texts(input), {**strategy_args}, tick)
+    return _map_strategy_results(input, strategy_results)
 
+
+def _get_texts(input: ChunkInput) -> list[str]:
+    if isinstance(input, str):
+        return [input]
     # We can work with both just a list of text content
     # or a list of tuples of (document_id, text content)
-    # text_to_chunk = '''
-    texts = []
-    for item in input:
-        if isinstance(item, str):
-            texts.append(item)
-        else:
-            texts.append(item[1])
+    return [item if isinstance(item, str) else item[1] for item in input]
+
 
-    strategy_results = strategy(texts, {**strategy_args}, tick)
+def _map_strategy_results(
+    input: ChunkInput, strategy_results: Iterable[TextChunk]
+) -> list[str | tuple[list[str] | None, str, int]]:
+    if isinstance(input, str):
+        return [item.text_chunk for item in strategy_results]
 
     results = []
     for strategy_result in strategy_results:
@@ -175,3 +192,14 @@ def load_strategy(strategy: ChunkStrategyType) -> ChunkStrategy:
         case _:
             msg = f"Unknown strategy: {strategy}"
             raise ValueError(msg)
+
+
+def load_batch_strategy(strategy: ChunkStrategyType) -> ChunkBatchStrategy | None:
+    """Load the strategy that chunks all rows at once, if the strategy has one."""
+    match strategy:
+        case ChunkStrategyType.tokens:
+            from .strategies.tokens import run_batch as run_tokens_batch
+
+            return run_tokens_batch
+        case _:
+            return None
@@ -41,12 +41,12 @@ async def run(
     semaphore: asyncio.Semaphore = asyncio.Semaphore(args.get("num_threads", 4))
 
     # Break up the input texts. The sizes here indicate how many snippets are in each input text
-    texts, input_sizes = _prepare_embed_texts(input, splitter)
+    texts, token_counts, input_sizes = _prepare_embed_texts(input, splitter)
     text_batches = _create_text_batches(
         texts,
+        token_counts,
         batch_size,
         batch_max_tokens,
-        splitter,
     )
     log.info(
         "embedding %d inputs via %d snippets using %d batches. max_batch_size=%d, max_tokens=%d",
@@ -94,35 +94,43 @@ async def _execute(
     chunks: list[list[str]],
     tick: ProgressTicker,
     semaphore: asyncio.Semaphore,
-) -> list[list[float]]:
-    async def embed(chunk: list[str]):
+) -> np.ndarray:
+    """Embed the chunks into one contiguous float32 matrix, one row per snippet."""
+    starts = np.cumsum([0, *(len(chunk) for chunk in chunks)])
+    result: np.ndarray | None = None
+
+    async def embed(start: int, chunk: list[str]):
+        nonlocal result
         async with semaphore:
             chunk_embeddings = await llm(chunk)
-            result = np.array(chunk_embeddings.output)
-            tick(1)
-        return result
-
-    futures = [embed(chunk) for chunk in chunks]
-    results = await asyncio.gather(*futures)
-    # merge results in a single list of lists (reduce the collect dimension)
-    return [item for sublist in results for item in sublist]
+        # copy each batch into the matrix as it completes so that the per-batch
+        # python float lists can be freed right away
+        vectors = np.asarray(chunk_embeddings.output, dtype=np.float32)
+        if result is None:
+            result = np.empty((starts[-1], vectors.shape[1]), dtype=np.float32)
+        result[start : start + len(chunk)] = vectors
+        tick(1)
+
+    await asyncio.gather(
+        *(embed(start, chunk) for start, chunk in zip(starts, chunks, strict=False))
+    )
+    return result if result is not None else np.empty((0, 0), dtype=np.float32)
 
 
 def _create_text_batches(
     texts: list[str],
+    token_counts: list[int],
     max_batch_size: int,
     max_batch_tokens: int,
-    splitter: TokenTextSplitter,
 ) -> list[list[str]]:
-    """Create batches of texts to embed."""
+    """Create batches of texts to embed, using the token counts found while splitting."""
     # https://learn.microsoft.com/en-us/azure/ai-services/openai/reference
     # According to this embeddings reference, Azure limits us to 16 concurrent embeddings and 8191 tokens per request
     result = []
     current_batch = []
     current_batch_tokens = 0
 
-    for text in texts:
-        token_count = splitter.num_tokens(text)
+    for text, token_count in zip(texts, token_counts, strict=True):
         if (
             len(current_batch) >= max_batch_size
             or current_batch_tokens + token_count > max_batch_tokens
@@ -142,40 +150,45 @@ def _create_text_batches(
 
 def _prepare_embed_texts(
     input: list[str], splitter: TokenTextSplitter
-) -> tuple[list[str], list[int]]:
+) -> tuple[list[str], list[int], list[int]]:
     sizes: list[int] = []
     snippets: list[str] = []
+    token_counts: list[int] = []
 
     for text in input:
         # Split the input text and filter out any empty content
-        split_texts = splitter.split_text(text)
+        split_texts = splitter.split_text_with_token_counts(text)
         if split_texts is None:
+            # keep one entry per input so the embeddings line up with the rows
+            sizes.append(0)
             continue
-        split_texts = [text for text in split_texts if len(text) > 0]
+        split_texts = [split for split in split_texts if len(split[0]) > 0]
 
         sizes.append(len(split_texts))
-        snippets.extend(split_texts)
+        snippets.extend(split for split, _ in split_texts)
+        token_counts.extend(count for _, count in split_texts)
 
-    return snippets, sizes
+    return snippets, token_counts, sizes
 
 
 def _reconstitute_embeddings(
-    raw_embeddings: list[list[float]], sizes: list[int]
-) -> list[list[float] | None]:
-    """Reconstitute the embeddings into the original input texts."""
-    embeddings: list[list[float] | None] = []
+    raw_embeddings: np.ndarray, sizes: list[int]
+) -> list[np.ndarray | None]:
+    """Reconstitute the embeddings into the original input texts.
+
+    Single-snippet inputs get a view into `raw_embeddings`; multi-snippet inputs get
+    the normalized average of their snippets.
+    """
+    embeddings: list[np.ndarray | None] = []
     cursor = 0
     for size in sizes:
         if size == 0:
             embeddings.append(None)
         elif size == 1:
-            embedding = raw_embeddings[cursor]
-            embeddings.append(embedding)
+            embeddings.append(raw_embeddings[cursor])
             cursor += 1
         else:
-            chunk = raw_embeddings[cursor : cursor + size]
-            average = np.average(chunk, axis=0)
-            normalized = average / np.linalg.norm(average)
-            embeddings.append(normalized.tolist())
+            average = raw_embeddings[cursor : cursor + size].mean(axis=0)
+            embeddings.append(average / np.linalg.norm(average))
             cursor += size
     return embeddings
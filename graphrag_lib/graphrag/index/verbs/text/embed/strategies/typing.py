@@ -6,6 +6,7 @@
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 
+import numpy as np
 from datashaper import VerbCallbacks
 
 from graphrag.index.cache import PipelineCache
@@ -15,7 +16,8 @@ from graphrag.index.cache import PipelineCache
 class TextEmbeddingResult:
     """Text embedding result class definition."""
 
-    embeddings: list[list[float] | None] | None
+    embeddings: list[np.ndarray | list[float] | None] | None
+    """One embedding per input; strategies may return float32 arrays instead of lists."""
 
 
 TextEmbeddingStrategy = Callable[
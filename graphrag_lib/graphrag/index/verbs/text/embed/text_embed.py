@@ -3,6 +3,8 @@
 
 """A module containing text_embed, load_strategy and create_row_from_embedding_data methods definition."""
 
+import asyncio
+import collections
 import logging
 from enum import Enum
 from typing import Any, cast
@@ -25,6 +27,8 @@ log = logging.getLogger(__name__)
 # Per Azure OpenAI Limits
 # https://learn.microsoft.com/en-us/azure/ai-services/openai/reference
 DEFAULT_EMBEDDING_BATCH_SIZE = 500
+# windows embedded ahead of the one being written to the vector store
+VECTOR_STORE_PREFETCH_WINDOWS = 2
 
 
 class TextEmbedStrategyType(str, Enum):
@@ -184,51 +188,50 @@ async def _text_embed_with_vector_store(
         msg = f"Column {id_column} not found in input dataframe with columns {output_df.columns}"
         raise ValueError(msg)
 
-    total_rows = 0
-    for row in output_df[column]:
-        if isinstance(row, list):
-            total_rows += len(row)
-        else:
-            total_rows += 1
-
-    i = 0
-    starting_index = 0
-
-    all_results = []
-
-    while insert_batch_size * i < input.shape[0]:
-        batch = input.iloc[insert_batch_size * i : insert_batch_size * (i + 1)]
-        texts: list[str] = batch[column].to_numpy().tolist()
-        titles: list[str] = batch[title_column].to_numpy().tolist()
-        ids: list[str] = batch[id_column].to_numpy().tolist()
-        result = await strategy_exec(
-            texts,
-            callbacks,
-            cache,
-            strategy_args,
-        )
-        if store_in_table and result.embeddings:
-            embeddings = [
-                embedding for embedding in result.embeddings if embedding is not None
-            ]
-            all_results.extend(embeddings)
-
-        vectors = result.embeddings or []
-        documents: list[VectorStoreDocument] = []
-        for id, text, title, vector in zip(ids, texts, titles, vectors, strict=True):
-            if type(vector) is np.ndarray:
-                vector = vector.tolist()
-            document = VectorStoreDocument(
+    async def embed_window(window: pd.DataFrame):
+        texts: list[str] = window[column].to_numpy().tolist()
+        result = await strategy_exec(texts, callbacks, cache, strategy_args)
+        return window, result.embeddings or [None] * len(texts)
+
+    def write_window(window: pd.DataFrame, vectors: list, first: bool) -> None:
+        documents = [
+            VectorStoreDocument(
                 id=id,
                 text=text,
-                vector=vector,
+                vector=vector.tolist() if type(vector) is np.ndarray else vector,
                 attributes={"title": title},
             )
-            documents.append(document)
-
-        vector_store.load_documents(documents, overwrite and i == 0)
-        starting_index += len(documents)
-        i += 1
+            for id, text, title, vector in zip(
+                window[id_column], window[column], window[title_column], vectors, strict=True
+            )
+        ]
+        vector_store.load_documents(documents, overwrite and first)
+
+    # Embed the next windows while the finished one is written to the vector store in
+    # a worker thread, so only a bounded number of windows is held in memory at any time.
+    all_results: list = []
+    pending: collections.deque[asyncio.Task] = collections.deque()
+    num_written = 0
+
+    async def write_next() -> None:
+        nonlocal num_written
+        window, vectors = await pending.popleft()
+        await asyncio.to_thread(write_window, window, vectors, num_written == 0)
+        num_written += 1
+        if store_in_table:
+            all_results.extend(vectors)
+
+    try:
+        for window_start in range(0, input.shape[0], insert_batch_size):
+            window = input.iloc[window_start : window_start + insert_batch_size]
+            pending.append(asyncio.create_task(embed_window(window)))
+            if len(pending) > VECTOR_STORE_PREFETCH_WINDOWS:
+                await write_next()
+        while pending:
+            await write_next()
+    finally:
+        for task in pending:
+            task.cancel()
 
     if store_in_table:
         output_df[to] = all_results
@@ -36,6 +36,8 @@ def build_steps(
     skip_title_embedding = config.get("skip_title_embedding", False)
     skip_summary_embedding = config.get("skip_summary_embedding", False)
     skip_full_content_embedding = config.get("skip_full_content_embedding", False)
+    # set by an update run: only these reports are regenerated
+    update_community_ids = config.get("update_community_ids")
 
     return [
         #
@@ -93,11 +95,21 @@ def build_steps(
             "verb": "create_community_reports",
             "args": {
                 **create_community_reports_config,
+                **(
+                    {"community_ids": update_community_ids}
+                    if update_community_ids is not None
+                    else {}
+                ),
             },
             "input": {
                 "source": "local_contexts",
                 "community_hierarchy": "community_hierarchy",
                 "nodes": "nodes",
+                **(
+                    {"previous_reports": "previous_community_reports"}
+                    if update_community_ids is not None
+                    else {}
+                ),
             },
         },
         {
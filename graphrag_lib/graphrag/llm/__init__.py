@@ -6,11 +6,13 @@
 from .base import BaseLLM, CachingLLM, RateLimitingLLM
 from .errors import RetriesExhaustedError
 from .limiting import (
+    AdaptiveConcurrencyLimiter,
     CompositeLLMLimiter,
     LLMLimiter,
     NoopLLMLimiter,
     TpmRpmLLMLimiter,
     create_tpm_rpm_limiters,
+    get_limiter_stats,
 )
 from .mock import MockChatLLM, MockCompletionLLM
 from .openai import (
@@ -46,6 +48,7 @@ from .types import (
 __all__ = [
     # LLM Types
     "LLM",
+    "AdaptiveConcurrencyLimiter",
     "BaseLLM",
     "CachingLLM",
     "CompletionInput",
@@ -88,4 +91,5 @@ __all__ = [
     "create_openai_embedding_llm",
     # Limiters
     "create_tpm_rpm_limiters",
+    "get_limiter_stats",
 ]
@@ -5,6 +5,7 @@
 
 import asyncio
 import logging
+import time
 from collections.abc import Callable
 from typing import Any, Generic, TypeVar
 
@@ -17,7 +18,7 @@ from tenacity import (
 from typing_extensions import Unpack
 
 from graphrag.llm.errors import RetriesExhaustedError
-from graphrag.llm.limiting import LLMLimiter
+from graphrag.llm.limiting import AdaptiveConcurrencyLimiter, LLMLimiter
 from graphrag.llm.types import (
     LLM,
     LLMConfig,
@@ -42,6 +43,7 @@ class RateLimitingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
     _delegate: LLM[TIn, TOut]
     _rate_limiter: LLMLimiter | None
     _semaphore: asyncio.Semaphore | None
+    _concurrency_limiter: AdaptiveConcurrencyLimiter | None
     _count_tokens: Callable[[str], int]
     _config: LLMConfig
     _operation: str
@@ -61,10 +63,12 @@ class RateLimitingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
         semaphore: asyncio.Semaphore | None = None,
         count_tokens: Callable[[str], int] | None = None,
         get_sleep_time: Callable[[BaseException], float] | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
     ):
         self._delegate = delegate
         self._rate_limiter = rate_limiter
         self._semaphore = semaphore
+        self._concurrency_limiter = concurrency_limiter
         self._config = config
         self._operation = operation
         self._retryable_errors = retryable_errors
@@ -113,6 +117,7 @@ class RateLimitingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
     ) -> LLMOutput[TOut]:
         """Execute the LLM with semaphore & rate limiting."""
         name = kwargs.get("name", "Process")
+        concurrency = self._concurrency_limiter
         attempt_number = 0
         call_times: list[float] = []
         input_tokens = self.count_request_tokens(input)
@@ -147,7 +152,13 @@ class RateLimitingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
             except BaseException as e:
                 if isinstance(e, tuple(self._rate_limit_errors)):
                     sleep_time = self._extract_sleep_recommendation(e)
-                    await sleep_for(sleep_time)
+                    if concurrency is not None:
+                        # the shared limiter backs off every caller of this model at once
+                        concurrency.on_rate_limited(
+                            sleep_time if follow_recommendation else 0.0
+                        )
+                    else:
+                        await sleep_for(sleep_time)
                 raise
             finally:
                 call_end = asyncio.get_event_loop().time()
@@ -157,11 +168,20 @@ class RateLimitingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
             nonlocal attempt_number
             async for attempt in retryer:
                 with attempt:
+                    queued_since = time.monotonic()
                     if self._rate_limiter and input_tokens > 0:
                         await self._rate_limiter.acquire(input_tokens)
-                    start = asyncio.get_event_loop().time()
-                    attempt_number += 1
-                    return await do_attempt(), start
+                    if concurrency is None:
+                        start = asyncio.get_event_loop().time()
+                        attempt_number += 1
+                        return await do_attempt(), start
+                    # hold a slot per attempt, not across the retry backoff
+                    async with concurrency.slot(queued_since):
+                        start = asyncio.get_event_loop().time()
+                        attempt_number += 1
+                        result = await do_attempt()
+                    concurrency.on_success()
+                    return result, start
 
             log.error("Retries exhausted for %s", name)
             raise RetriesExhaustedError(name, max_retries)
@@ -179,6 +199,8 @@ class RateLimitingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
         output_tokens = self.count_response_tokens(result.output)
         if self._rate_limiter and output_tokens > 0:
             await self._rate_limiter.acquire(output_tokens)
+        if concurrency is not None:
+            concurrency.record_tokens(max(input_tokens, 0) + output_tokens)
 
         invocation_result = LLMInvocationResult(
             result=result,
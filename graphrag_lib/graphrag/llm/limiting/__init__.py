@@ -3,16 +3,22 @@
 
 """LLM limiters module."""
 
+from .adaptive_concurrency import AdaptiveConcurrencyLimiter
 from .composite_limiter import CompositeLLMLimiter
 from .create_limiters import create_tpm_rpm_limiters
 from .llm_limiter import LLMLimiter
 from .noop_llm_limiter import NoopLLMLimiter
+from .registry import ModelLimiters, get_limiter_stats, get_model_limiters
 from .tpm_rpm_limiter import TpmRpmLLMLimiter
 
 __all__ = [
+    "AdaptiveConcurrencyLimiter",
     "CompositeLLMLimiter",
     "LLMLimiter",
+    "ModelLimiters",
     "NoopLLMLimiter",
     "TpmRpmLLMLimiter",
     "create_tpm_rpm_limiters",
+    "get_limiter_stats",
+    "get_model_limiters",
 ]
@@ -0,0 +1,157 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""AIMD adaptive concurrency limiter."""
+
+import asyncio
+import collections
+import logging
+import sys
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+log = logging.getLogger(__name__)
+
+_TOKEN_WINDOW_SECONDS = 60.0
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limit in-flight requests with additive-increase/multiplicative-decrease.
+
+    The limit starts at ``max_concurrency``, drops by ``decrease_factor`` (at most
+    once per backoff window) when the service answers with a rate limit error, and
+    grows back by one slot per ``limit`` successful requests. A ``retry-after``
+    recommendation pauses every caller until it has elapsed instead of each request
+    sleeping on its own.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int | None,
+        min_concurrency: int = 1,
+        decrease_factor: float = 0.5,
+    ):
+        self._max = max_concurrency
+        self._min = min(min_concurrency, max_concurrency or min_concurrency)
+        self._decrease_factor = decrease_factor
+        self._limit = float(max_concurrency or sys.maxsize)
+        self._in_flight = 0
+        self._waiters: collections.deque[asyncio.Future] = collections.deque()
+        self._paused_until = 0.0
+        self._wake_handle: asyncio.TimerHandle | None = None
+        self._next_decrease = 0.0
+
+        self._requests = 0
+        self._rate_limited = 0
+        self._queue_wait_total = 0.0
+        self._queue_wait_max = 0.0
+        self._tokens: collections.deque[tuple[float, int]] = collections.deque()
+        self._tokens_in_window = 0
+
+    @property
+    def limit(self) -> int:
+        """The current number of requests allowed in flight."""
+        return max(self._min, int(self._limit))
+
+    @asynccontextmanager
+    async def slot(self, queued_since: float | None = None) -> AsyncIterator[None]:
+        """Hold one in-flight request slot; the wait is counted from `queued_since`."""
+        queued_since = time.monotonic() if queued_since is None else queued_since
+        await self._acquire()
+        wait = time.monotonic() - queued_since
+        self._requests += 1
+        self._queue_wait_total += wait
+        self._queue_wait_max = max(self._queue_wait_max, wait)
+        try:
+            yield
+        finally:
+            self._release()
+
+    def on_success(self) -> None:
+        """Grow the limit after a successful request."""
+        if self._max is not None and self._limit < self._max:
+            self._limit = min(float(self._max), self._limit + 1 / self._limit)
+            self._wake()
+
+    def on_rate_limited(self, retry_after: float = 0.0) -> None:
+        """Shrink the limit and pause new requests for `retry_after` seconds."""
+        now = time.monotonic()
+        self._rate_limited += 1
+        if self._max is not None and now >= self._next_decrease:
+            self._limit = max(float(self._min), self._limit * self._decrease_factor)
+            # one decrease per backoff window; the other 429s of that burst are the same signal
+            self._next_decrease = now + max(retry_after, 1.0)
+            log.warning("rate limited, concurrency limit lowered to %d", self.limit)
+        if retry_after > 0:
+            self._paused_until = max(self._paused_until, now + retry_after)
+
+    def record_tokens(self, num_tokens: int) -> None:
+        """Count tokens sent and received, for the tokens-per-minute counter."""
+        if num_tokens > 0:
+            self._tokens.append((time.monotonic(), num_tokens))
+            self._tokens_in_window += num_tokens
+
+    def stats(self) -> dict[str, Any]:
+        """Return the counters of this limiter."""
+        cutoff = time.monotonic() - _TOKEN_WINDOW_SECONDS
+        while self._tokens and self._tokens[0][0] < cutoff:
+            self._tokens_in_window -= self._tokens.popleft()[1]
+        return {
+            "concurrency_limit": self.limit if self._max is not None else None,
+            "in_flight": self._in_flight,
+            "queued": len(self._waiters),
+            "requests": self._requests,
+            "rate_limited": self._rate_limited,
+            "queue_wait_total": self._queue_wait_total,
+            "queue_wait_max": self._queue_wait_max,
+            "queue_wait_avg": self._queue_wait_total / self._requests
+            if self._requests
+            else 0.0,
+            "tokens_per_minute": self._tokens_in_window,
+        }
+
+    async def _acquire(self) -> None:
+        while True:
+            delay = self._paused_until - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            if self._in_flight < self.limit and not self._waiters:
+                self._in_flight += 1
+                return
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                # _wake hands the slot over, so there is nothing left to check
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    self._release()
+                else:
+                    self._waiters.remove(waiter)
+                raise
+            return
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        delay = self._paused_until - time.monotonic()
+        if delay > 0:
+            if self._waiters and self._wake_handle is None:
+                self._wake_handle = asyncio.get_running_loop().call_later(
+                    delay, self._wake_after_pause
+                )
+            return
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+    def _wake_after_pause(self) -> None:
+        self._wake_handle = None
+        self._wake()
@@ -0,0 +1,54 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Process-wide limiters, one set per model/deployment."""
+
+import logging
+from typing import Any, NamedTuple
+
+from graphrag.llm.types import LLMConfig
+
+from .adaptive_concurrency import AdaptiveConcurrencyLimiter
+from .create_limiters import create_tpm_rpm_limiters
+from .llm_limiter import LLMLimiter
+
+log = logging.getLogger(__name__)
+
+
+class ModelLimiters(NamedTuple):
+    """The limiters shared by every LLM that calls the same model/deployment."""
+
+    rate_limiter: LLMLimiter
+    concurrency_limiter: AdaptiveConcurrencyLimiter
+
+
+_model_limiters: dict[str, ModelLimiters] = {}
+
+
+def get_model_limiters(
+    name: str, configuration: LLMConfig, concurrent_requests: int | None
+) -> ModelLimiters:
+    """Return the limiters for a model, creating them from the first configuration seen."""
+    limiters = _model_limiters.get(name)
+    if limiters is None:
+        log.info(
+            "create limiters for %s: TPM=%s, RPM=%s, concurrency=%s",
+            name,
+            configuration.tokens_per_minute,
+            configuration.requests_per_minute,
+            concurrent_requests or "unbounded",
+        )
+        limiters = ModelLimiters(
+            create_tpm_rpm_limiters(configuration),
+            AdaptiveConcurrencyLimiter(concurrent_requests or None),
+        )
+        _model_limiters[name] = limiters
+    return limiters
+
+
+def get_limiter_stats() -> dict[str, dict[str, Any]]:
+    """Return queue wait, in-flight and tokens-per-minute counters per model."""
+    return {
+        name: limiters.concurrency_limiter.stats()
+        for name, limiters in _model_limiters.items()
+    }
@@ -3,7 +3,7 @@
 
 """OpenAI LLM implementations."""
 
-from .create_openai_client import create_openai_client
+from .create_openai_client import create_openai_client, set_shared_http_client
 from .factories import (
     create_openai_chat_llm,
     create_openai_completion_llm,
@@ -25,4 +25,5 @@ __all__ = [
     "create_openai_client",
     "create_openai_completion_llm",
     "create_openai_embedding_llm",
+    "set_shared_http_client",
 ]
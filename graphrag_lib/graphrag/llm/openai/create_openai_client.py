@@ -6,6 +6,7 @@
 import logging
 from functools import cache
 
+import httpx
 from azure.identity import DefaultAzureCredential, get_bearer_token_provider
 from openai import AsyncAzureOpenAI, AsyncOpenAI
 
@@ -16,6 +17,15 @@ log = logging.getLogger(__name__)
 
 API_BASE_REQUIRED_FOR_AZURE = "api_base is required for Azure OpenAI client"
 
+_shared_http_client: httpx.AsyncClient | None = None
+
+
+def set_shared_http_client(http_client: httpx.AsyncClient | None) -> None:
+    """Make every OpenAI client created from now on use one connection pool."""
+    global _shared_http_client  # noqa: PLW0603
+    _shared_http_client = http_client
+    create_openai_client.cache_clear()
+
 
 @cache
 def create_openai_client(
@@ -52,6 +62,7 @@ def create_openai_client(
             # Timeout/Retry Configuration - Use Tenacity for Retries, so disable them here
             timeout=configuration.request_timeout or 180.0,
             max_retries=0,
+            http_client=_shared_http_client,
         )
 
     log.info("Creating OpenAI client base_url=%s", configuration.api_base)
@@ -62,4 +73,5 @@ def create_openai_client(
         # Timeout/Retry Configuration - Use Tenacity for Retries, so disable them here
         timeout=configuration.request_timeout or 180.0,
         max_retries=0,
+        http_client=_shared_http_client,
     )
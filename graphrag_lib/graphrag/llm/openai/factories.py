@@ -6,7 +6,7 @@
 import asyncio
 
 from graphrag.llm.base import CachingLLM, RateLimitingLLM
-from graphrag.llm.limiting import LLMLimiter
+from graphrag.llm.limiting import AdaptiveConcurrencyLimiter, LLMLimiter
 from graphrag.llm.types import (
     LLM,
     CompletionLLM,
@@ -44,13 +44,16 @@ def create_openai_chat_llm(
     on_error: ErrorHandlerFn | None = None,
     on_cache_hit: OnCacheActionFn | None = None,
     on_cache_miss: OnCacheActionFn | None = None,
+    concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
 ) -> CompletionLLM:
     """Create an OpenAI chat LLM."""
     operation = "chat"
     result = OpenAIChatLLM(client, config)
     result.on_error(on_error)
-    if limiter is not None or semaphore is not None:
-        result = _rate_limited(result, config, operation, limiter, semaphore, on_invoke)
+    if limiter is not None or semaphore is not None or concurrency_limiter is not None:
+        result = _rate_limited(
+            result, config, operation, limiter, semaphore, on_invoke, concurrency_limiter
+        )
     if cache is not None:
         result = _cached(result, config, operation, cache, on_cache_hit, on_cache_miss)
     result = OpenAIHistoryTrackingLLM(result)
@@ -68,13 +71,16 @@ def create_openai_completion_llm(
     on_error: ErrorHandlerFn | None = None,
     on_cache_hit: OnCacheActionFn | None = None,
     on_cache_miss: OnCacheActionFn | None = None,
+    concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
 ) -> CompletionLLM:
     """Create an OpenAI completion LLM."""
     operation = "completion"
     result = OpenAICompletionLLM(client, config)
     result.on_error(on_error)
-    if limiter is not None or semaphore is not None:
-        result = _rate_limited(result, config, operation, limiter, semaphore, on_invoke)
+    if limiter is not None or semaphore is not None or concurrency_limiter is not None:
+        result = _rate_limited(
+            result, config, operation, limiter, semaphore, on_invoke, concurrency_limiter
+        )
     if cache is not None:
         result = _cached(result, config, operation, cache, on_cache_hit, on_cache_miss)
     return OpenAITokenReplacingLLM(result)
@@ -90,13 +96,16 @@ def create_openai_embedding_llm(
     on_error: ErrorHandlerFn | None = None,
     on_cache_hit: OnCacheActionFn | None = None,
     on_cache_miss: OnCacheActionFn | None = None,
+    concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
 ) -> EmbeddingLLM:
     """Create an OpenAI embeddings LLM."""
     operation = "embedding"
     result = OpenAIEmbeddingsLLM(client, config)
     result.on_error(on_error)
-    if limiter is not None or semaphore is not None:
-        result = _rate_limited(result, config, operation, limiter, semaphore, on_invoke)
+    if limiter is not None or semaphore is not None or concurrency_limiter is not None:
+        result = _rate_limited(
+            result, config, operation, limiter, semaphore, on_invoke, concurrency_limiter
+        )
     if cache is not None:
         result = _cached(result, config, operation, cache, on_cache_hit, on_cache_miss)
     return result
@@ -109,6 +118,7 @@ def _rate_limited(
     limiter: LLMLimiter | None,
     semaphore: asyncio.Semaphore | None,
     on_invoke: LLMInvocationFn | None,
+    concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
 ):
     result = RateLimitingLLM(
         delegate,
@@ -120,6 +130,7 @@ def _rate_limited(
         semaphore,
         get_token_counter(config),
         get_sleep_time_from_error,
+        concurrency_limiter,
     )
     result.on_invoke(on_invoke)
     return result
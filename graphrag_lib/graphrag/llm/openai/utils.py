@@ -150,6 +150,16 @@ def try_parse_json_object(input: str) -> tuple[str, dict]:
 def get_sleep_time_from_error(e: Any) -> float:
     """Extract the sleep time value from a RateLimitError. This is usually only available in Azure."""
     sleep_time = 0.0
+    if isinstance(e, RateLimitError):
+        # prefer the retry-after headers, which both OpenAI and Azure send on 429s
+        headers = e.response.headers
+        try:
+            if "retry-after-ms" in headers:
+                return float(headers["retry-after-ms"]) / 1000
+            if "retry-after" in headers:
+                return float(headers["retry-after"])
+        except ValueError:
+            pass
     if isinstance(e, RateLimitError) and _please_retry_after in str(e):
         # could be second or seconds
         sleep_time = int(str(e).split(_please_retry_after)[1].split(" second")[0])
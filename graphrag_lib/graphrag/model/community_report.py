@@ -3,7 +3,7 @@
 
 """A package containing the 'CommunityReport' model."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 from .named import Named
@@ -34,6 +34,11 @@ class CommunityReport(Named):
     attributes: dict[str, Any] | None = None
     """A dictionary of additional attributes associated with the report (optional)."""
 
+    context_tokens: tuple[int, int] | None = field(
+        default=None, repr=False, compare=False
+    )
+    """The hash and token count of the static columns of the report's context table row (optional). Set by `TokenCounter.count_row`."""
+
     @classmethod
     def from_dict(
         cls,
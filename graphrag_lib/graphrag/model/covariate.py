@@ -3,7 +3,7 @@
 
 """A package containing the 'Covariate' model."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 from .identified import Identified
@@ -35,6 +35,11 @@ class Covariate(Identified):
 
     attributes: dict[str, Any] | None = None
 
+    context_tokens: tuple[int, int] | None = field(
+        default=None, repr=False, compare=False
+    )
+    """The hash and token count of the static columns of the covariate's context table row (optional). Set by `TokenCounter.count_row`."""
+
     @classmethod
     def from_dict(
         cls,
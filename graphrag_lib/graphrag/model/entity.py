@@ -3,7 +3,7 @@
 
 """A package containing the 'Entity' model."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 from .named import Named
@@ -43,6 +43,11 @@ class Entity(Named):
     attributes: dict[str, Any] | None = None
     """Additional attributes associated with the entity (optional), e.g. start time, end time, etc. To be included in the search prompt."""
 
+    context_tokens: tuple[int, int] | None = field(
+        default=None, repr=False, compare=False
+    )
+    """The hash and token count of the static columns of the entity's context table row (optional). Set by `TokenCounter.count_row`."""
+
     @classmethod
     def from_dict(
         cls,
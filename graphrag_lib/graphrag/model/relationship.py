@@ -3,7 +3,7 @@
 
 """A package containing the 'Relationship' model."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 from .identified import Identified
@@ -37,6 +37,11 @@ class Relationship(Identified):
     attributes: dict[str, Any] | None = None
     """Additional attributes associated with the relationship (optional). To be included in the search prompt"""
 
+    context_tokens: tuple[int, int] | None = field(
+        default=None, repr=False, compare=False
+    )
+    """The hash and token count of the static columns of the relationship's context table row (optional). Set by `TokenCounter.count_row`."""
+
     @classmethod
     def from_dict(
         cls,
@@ -3,7 +3,7 @@
 
 """A package containing the 'TextUnit' model."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 from .identified import Identified
@@ -37,6 +37,11 @@ class TextUnit(Identified):
     attributes: dict[str, Any] | None = None
     """A dictionary of additional attributes associated with the text unit (optional)."""
 
+    context_tokens: tuple[int, int] | None = field(
+        default=None, repr=False, compare=False
+    )
+    """The hash and token count of the static columns of the text unit's context table row (optional). Set by `TokenCounter.count_row`."""
+
     @classmethod
     def from_dict(
         cls,
@@ -12,15 +12,19 @@ Contains the following functions:
  - global_search_streaming: Perform a global search and stream results back.
  - local_search: Perform a local search.
  - local_search_streaming: Perform a local search and stream results back.
+ - stream_local_search: Stream results back from a prebuilt local search engine.
 
 WARNING: This API is under development and may undergo changes in future releases.
 Backwards compatibility is not guaranteed at this time.
 """
 
+import hashlib
+import threading
 from collections.abc import AsyncGenerator
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 from pydantic import validate_call
 
@@ -28,10 +32,12 @@ from graphrag.config import GraphRagConfig
 from graphrag.index.progress.types import PrintProgressReporter
 from graphrag.model.entity import Entity
 # from graphrag.query.structured_search.base import SearchResult  # noqa: TCH001
-from .structured_search.base import SearchResult  # noqa: TCH001
-from graphrag.vector_stores.lancedb import LanceDBVectorStore
-from graphrag.vector_stores.typing import VectorStoreFactory, VectorStoreType
+from .structured_search.base import BaseSearch, SearchResult  # noqa: TCH001
 
+from ..vector_stores import BaseVectorStore
+from ..vector_stores.lancedb import LanceDBVectorStore
+from ..vector_stores.numpy_store import NumpyVectorStore
+from ..vector_stores.typing import VectorStoreFactory, VectorStoreType
 from .factories import get_global_search_engine, get_local_search_engine
 from .indexer_adapters import (
     read_indexer_covariates,
@@ -241,6 +247,7 @@ async def local_search(
         entities=_entities,
         vector_store_type=vector_store_type,
         config_args=vector_store_args,
+        root_dir=config.root_dir,
     )
     reporter.info(f"Description Embedding Store: {description_embedding_store}")
 
@@ -325,6 +332,7 @@ async def local_search_streaming(
         entities=_entities,
         vector_store_type=vector_store_type,
         config_args=vector_store_args,
+        root_dir=config.root_dir,
     )
 
     _covariates = read_indexer_covariates(covariates) if covariates is not None else []
@@ -340,6 +348,26 @@ async def local_search_streaming(
         response_type=response_type,
         system_prompt=system_prompt,
     )
+    async for stream_chunk in stream_local_search(
+        search_engine=search_engine,
+        query=query,
+        context_info_flag=context_info_flag,
+        language=language,
+    ):
+        yield stream_chunk
+
+
+async def stream_local_search(
+    search_engine: BaseSearch,
+    query: str,
+    context_info_flag: bool,
+    language: str,
+) -> AsyncGenerator:
+    """Stream a local search response from an already built search engine.
+
+    Used with the engines cached by the index registry so a request does not
+    rebuild the index state; yields the same chunks as local_search_streaming.
+    """
     reporter.info(f"Query: {query}")
     search_result = search_engine.astream_search(query=query, language=language)
     reporter.info(f"Search result: {search_result}")
@@ -391,8 +419,16 @@ def _get_embedding_description_store(
     entities: list[Entity],
     vector_store_type: str = VectorStoreType.LanceDB,
     config_args: dict | None = None,
+    root_dir: str | None = None,
 ):
-    """Get the embedding description store."""
+    """Get the embedding description store.
+
+    With the default ``overwrite: true`` a LanceDB table or NumPy collection is only
+    (re)written when it is missing or was built from different entities; otherwise
+    the existing one is opened read-only. Opened stores are shared across requests.
+    The table is named after the index root, so indexes sharing a ``db_uri`` keep
+    their own table and fingerprint.
+    """
     if not config_args:
         config_args = {}
 
@@ -400,6 +436,34 @@ def _get_embedding_description_store(
         "query_collection_name", "entity_description_embeddings"
     )
     config_args.update({"collection_name": collection_name})
+
+    if config_args.get("overwrite", True) and vector_store_type in (
+        VectorStoreType.LanceDB,
+        VectorStoreType.Numpy,
+    ):
+        if root_dir is not None:
+            collection_name = _root_collection_name(collection_name, root_dir)
+        fingerprint = _entities_fingerprint(entities)
+        db_uri = config_args.get("db_uri", "./lancedb")
+        # one entry per table, a changed index replaces the store of its old entities
+        cache_key = (str(Path(db_uri).resolve()), collection_name, vector_store_type)
+        open_or_build = (
+            _open_or_build_numpy_store
+            if vector_store_type == VectorStoreType.Numpy
+            else _open_or_build_lancedb_store
+        )
+        with _description_store_lock:
+            cached = _description_stores.get(cache_key)
+            if cached is not None and cached[0] == fingerprint:
+                return cached[1]
+            description_embedding_store = open_or_build(
+                entities=entities,
+                config_args={**config_args, "collection_name": collection_name},
+                fingerprint=fingerprint,
+            )
+            _description_stores[cache_key] = (fingerprint, description_embedding_store)
+        return description_embedding_store
+
     description_embedding_store = VectorStoreFactory.get_vector_store(
         vector_store_type=vector_store_type, kwargs=config_args
     )
@@ -434,6 +498,91 @@ def _get_embedding_description_store(
     return description_embedding_store
 
 
+_description_stores: dict[tuple[str, str, str], tuple[str, BaseVectorStore]] = {}
+_description_store_lock = threading.Lock()
+
+
+def _open_or_build_lancedb_store(
+    entities: list[Entity],
+    config_args: dict,
+    fingerprint: str,
+) -> LanceDBVectorStore:
+    """Open the entity description table, rebuilding it only when it is missing or stale."""
+    collection_name = config_args["collection_name"]
+    db_uri = config_args.get("db_uri", "./lancedb")
+    description_embedding_store = LanceDBVectorStore(collection_name=collection_name)
+    description_embedding_store.connect(db_uri=db_uri)
+
+    fingerprint_path = Path(db_uri) / f"{collection_name}.fingerprint"
+    stored_fingerprint = (
+        fingerprint_path.read_text(encoding="utf-8").strip()
+        if fingerprint_path.exists()
+        else None
+    )
+    table_exists = (
+        collection_name in description_embedding_store.db_connection.table_names()
+    )
+
+    if table_exists and stored_fingerprint == fingerprint:
+        reporter.info(f"Opening existing description embedding table {collection_name}")
+        description_embedding_store.document_collection = (
+            description_embedding_store.db_connection.open_table(collection_name)
+        )
+        return description_embedding_store
+
+    reporter.info(f"Building description embedding table {collection_name}")
+    store_entity_semantic_embeddings(
+        entities=entities, vectorstore=description_embedding_store
+    )
+    fingerprint_path.parent.mkdir(parents=True, exist_ok=True)
+    fingerprint_path.write_text(fingerprint, encoding="utf-8")
+    return description_embedding_store
+
+
+def _open_or_build_numpy_store(
+    entities: list[Entity],
+    config_args: dict,
+    fingerprint: str,
+) -> NumpyVectorStore:
+    """Map the entity description collection, rebuilding it only when it is missing or stale."""
+    collection_name = config_args["collection_name"]
+    description_embedding_store = NumpyVectorStore(collection_name=collection_name)
+    description_embedding_store.connect(db_uri=config_args.get("db_uri", "./lancedb"))
+
+    fingerprint_path = description_embedding_store.fingerprint_path
+    stored_fingerprint = (
+        fingerprint_path.read_text(encoding="utf-8").strip()
+        if fingerprint_path.exists()
+        else None
+    )
+    if stored_fingerprint == fingerprint:
+        reporter.info(f"Opening existing description embedding collection {collection_name}")
+        return description_embedding_store
+
+    reporter.info(f"Building description embedding collection {collection_name}")
+    store_entity_semantic_embeddings(
+        entities=entities, vectorstore=description_embedding_store
+    )
+    fingerprint_path.write_text(fingerprint, encoding="utf-8")
+    return description_embedding_store
+
+
+def _root_collection_name(collection_name: str, root_dir: str) -> str:
+    """Suffix a collection name with a hash of the index root directory."""
+    root = str(Path(root_dir).resolve())
+    return f"{collection_name}_{hashlib.sha256(root.encode()).hexdigest()[:12]}"
+
+
+def _entities_fingerprint(entities: list[Entity]) -> str:
+    """Hash the entity ids, titles, descriptions and embeddings stored in the table."""
+    digest = hashlib.sha256()
+    for entity in entities:
+        digest.update(f"{entity.id}\x1f{entity.title}\x1f{entity.description}\x1e".encode())
+        if entity.description_embedding is not None:
+            digest.update(np.asarray(entity.description_embedding, dtype=np.float64).tobytes())
+    return digest.hexdigest()
+
+
 def _reformat_context_data(context_data: dict) -> dict:
     """
     Reformats context_data for all query responses.
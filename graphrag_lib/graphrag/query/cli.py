@@ -15,6 +15,7 @@ from graphrag.index.progress import PrintProgressReporter
 from graphrag.utils.storage import _create_storage, _load_table_from_storage
 
 from . import api
+from .index_registry import get_index_registry
 
 from flask import Flask, Response, stream_with_context
 
@@ -164,22 +165,16 @@ async def run_local_search(
     Loads index files required for local search and calls the Query API.
     """
 
-    root = Path(root_dir).resolve()
-    config = load_config(root, config_filepath)
-    
-    config.storage.base_dir = data_dir or config.storage.base_dir
-    dataframe_dict = await _resolve_parquet_files(
+    # config, parquet tables and model objects are loaded once per root and
+    # reused across requests; they are reloaded when a parquet file changes
+    domain_index = await get_index_registry().get(
         root_dir=root_dir,
-        config=config,
-        parquet_list=[
-            "create_final_nodes.parquet",
-            "create_final_community_reports.parquet",
-            "create_final_text_units.parquet",
-            "create_final_relationships.parquet",
-            "create_final_entities.parquet",
-        ],
-        optional_list=["create_final_covariates.parquet"],
+        config_filepath=config_filepath,
+        data_dir=data_dir,
+        community_level=community_level,
     )
+    config = domain_index.config
+    dataframe_dict = domain_index.dataframes
 
     final_nodes: pd.DataFrame = dataframe_dict["create_final_nodes"]
     final_community_reports: pd.DataFrame = dataframe_dict[
@@ -223,23 +218,18 @@ async def run_local_search(
         # return asyncio.run(run_streaming_search())
         # # return asyncio.wait([run_streaming_search()])
 
+        search_engine = domain_index.get_local_search_engine(
+            response_type=response_type,
+            system_prompt=system_prompt,
+        )
+
         async def generate_streaming_response():
             context_data = None
             get_context_data = True
-            async for stream_chunk in api.local_search_streaming(
-                config=config,
-                root_dir=root_dir,
-                nodes=final_nodes,
-                entities=final_entities,
-                community_reports=final_community_reports,
-                text_units=final_text_units,
-                relationships=final_relationships,
-                covariates=final_covariates,
-                community_level=community_level,
-                response_type=response_type,
+            async for stream_chunk in api.stream_local_search(
+                search_engine=search_engine,
                 query=query,
                 context_info_flag=context_info_flag,
-                system_prompt=system_prompt,
                 language=language
             ):
                 if get_context_data:
@@ -308,7 +298,7 @@ async def _resolve_parquet_files(
             #     _load_table_from_storage(name=optional_file, storage=storage_obj)
             # )
             # df_value = _load_table_from_storage(name=optional_file, storage=storage_obj)
-            df_value = await _load_table_from_storage(name=parquet_file, storage=storage_obj)
+            df_value = await _load_table_from_storage(name=optional_file, storage=storage_obj)
             dataframe_dict[df_key] = df_value
         else:
             dataframe_dict[df_key] = None
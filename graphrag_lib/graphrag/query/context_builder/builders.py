@@ -33,3 +33,14 @@ class LocalContextBuilder(ABC):
         **kwargs,
     ) -> tuple[str | list[str], dict[str, pd.DataFrame]]:
         """Build the context for the local search mode."""
+
+    async def abuild_context(
+        self,
+        query: str,
+        conversation_history: ConversationHistory | None = None,
+        **kwargs,
+    ) -> tuple[str | list[str], dict[str, pd.DataFrame]]:
+        """Build the context for the local search mode asynchronously."""
+        return self.build_context(
+            query=query, conversation_history=conversation_history, **kwargs
+        )
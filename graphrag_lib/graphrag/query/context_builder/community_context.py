@@ -11,7 +11,7 @@ import pandas as pd
 import tiktoken
 
 from graphrag.model import CommunityReport, Entity
-from graphrag.query.llm.text_utils import num_tokens
+from ..llm.text_utils import TokenCounter
 
 log = logging.getLogger(__name__)
 
@@ -37,6 +37,7 @@ def build_community_context(
     single_batch: bool = True,
     context_name: str = "Reports",
     random_state: int = 86,
+    token_counter: TokenCounter | None = None,
 ) -> tuple[str | list[str], dict[str, pd.DataFrame]]:
     """
     Prepare community report data table as context data for system prompt.
@@ -45,6 +46,7 @@ def build_community_context(
 
     The calculated weight is added as an attribute to the community reports and added to the context data table.
     """
+    count_tokens = token_counter or TokenCounter(token_encoder)
 
     def _is_included(report: CommunityReport) -> bool:
         return report.rank is not None and report.rank >= min_community_rank
@@ -124,7 +126,7 @@ def build_community_context(
         batch_text = (
             f"-----{context_name}-----" + "\n" + column_delimiter.join(header) + "\n"
         )
-        batch_tokens = num_tokens(batch_text, token_encoder)
+        batch_tokens = count_tokens(batch_text)
         batch_records = []
 
     def _cut_batch() -> None:
@@ -151,7 +153,7 @@ def build_community_context(
 
     for report in selected_reports:
         new_context_text, new_context = _report_context_text(report, attributes)
-        new_tokens = num_tokens(new_context_text, token_encoder)
+        new_tokens = count_tokens.count_row(report, new_context, column_delimiter)
 
         if batch_tokens + new_tokens > max_tokens:
             # add the current batch to the context data and start a new batch if we are in multi-batch mode
@@ -3,13 +3,16 @@
 
 """Orchestration Context Builders."""
 
+from collections.abc import Sequence
 from enum import Enum
 
 from graphrag.model import Entity, Relationship
-from graphrag.query.input.retrieval.entities import (
+from ..input.retrieval.entities import (
+    EntityIndex,
     get_entity_by_key,
     get_entity_by_name,
 )
+from ..input.retrieval.relationships import RelationshipIndex
 from graphrag.query.llm.base import BaseTextEmbedding
 from graphrag.vector_stores import BaseVectorStore
 
@@ -36,27 +39,39 @@ def map_query_to_entities(
     query: str,
     text_embedding_vectorstore: BaseVectorStore,
     text_embedder: BaseTextEmbedding,
-    all_entities: list[Entity],
+    all_entities: Sequence[Entity],
     embedding_vectorstore_key: str = EntityVectorStoreKey.ID,
     include_entity_names: list[str] | None = None,
     exclude_entity_names: list[str] | None = None,
     k: int = 10,
     oversample_scaler: int = 2,
+    query_embedding: list[float] | None = None,
 ) -> list[Entity]:
-    """Extract entities that match a given query using semantic similarity of text embeddings of query and entity descriptions."""
+    """Extract entities that match a given query using semantic similarity of text embeddings of query and entity descriptions.
+
+    The query is embedded with `text_embedder` unless its `query_embedding` is given.
+    """
     if include_entity_names is None:
         include_entity_names = []
     if exclude_entity_names is None:
         exclude_entity_names = []
+    all_entities = _as_entity_index(all_entities)
     matched_entities = []
     if query != "":
         # get entities with highest semantic similarity to query
         # oversample to account for excluded entities
-        search_results = text_embedding_vectorstore.similarity_search_by_text(
-            text=query,
-            text_embedder=lambda t: text_embedder.embed(t),
-            k=k * oversample_scaler,
-        )
+        if query_embedding is None:
+            search_results = text_embedding_vectorstore.similarity_search_by_text(
+                text=query,
+                text_embedder=lambda t: text_embedder.embed(t),
+                k=k * oversample_scaler,
+            )
+        elif query_embedding:
+            search_results = text_embedding_vectorstore.similarity_search_by_vector(
+                query_embedding=query_embedding, k=k * oversample_scaler
+            )
+        else:
+            search_results = []
         for result in search_results:
             matched = get_entity_by_key(
                 entities=all_entities,
@@ -66,8 +81,9 @@ def map_query_to_entities(
             if matched:
                 matched_entities.append(matched)
     else:
-        all_entities.sort(key=lambda x: x.rank if x.rank else 0, reverse=True)
-        matched_entities = all_entities[:k]
+        matched_entities = sorted(
+            all_entities, key=lambda x: x.rank if x.rank else 0, reverse=True
+        )[:k]
 
     # filter out excluded entities
     if exclude_entity_names:
@@ -87,7 +103,7 @@ def map_query_to_entities(
 def find_nearest_neighbors_by_graph_embeddings(
     entity_id: str,
     graph_embedding_vectorstore: BaseVectorStore,
-    all_entities: list[Entity],
+    all_entities: Sequence[Entity],
     exclude_entity_names: list[str] | None = None,
     embedding_vectorstore_key: str = EntityVectorStoreKey.ID,
     k: int = 10,
@@ -96,6 +112,7 @@ def find_nearest_neighbors_by_graph_embeddings(
     """Retrieve related entities by graph embeddings."""
     if exclude_entity_names is None:
         exclude_entity_names = []
+    all_entities = _as_entity_index(all_entities)
     # find nearest neighbors of this entity using graph embedding
     query_entity = get_entity_by_key(
         entities=all_entities, key=embedding_vectorstore_key, value=entity_id
@@ -132,28 +149,29 @@ def find_nearest_neighbors_by_graph_embeddings(
 
 def find_nearest_neighbors_by_entity_rank(
     entity_name: str,
-    all_entities: list[Entity],
-    all_relationships: list[Relationship],
+    all_entities: Sequence[Entity],
+    all_relationships: Sequence[Relationship],
     exclude_entity_names: list[str] | None = None,
     k: int | None = 10,
 ) -> list[Entity]:
     """Retrieve entities that have direct connections with the target entity, sorted by entity rank."""
     if exclude_entity_names is None:
         exclude_entity_names = []
-    entity_relationships = [
-        rel
-        for rel in all_relationships
-        if rel.source == entity_name or rel.target == entity_name
-    ]
+    if not isinstance(all_relationships, RelationshipIndex):
+        all_relationships = RelationshipIndex(all_relationships)
+    entity_relationships = all_relationships.get_adjacent([entity_name])
     source_entity_names = {rel.source for rel in entity_relationships}
     target_entity_names = {rel.target for rel in entity_relationships}
     related_entity_names = (source_entity_names.union(target_entity_names)).difference(
         set(exclude_entity_names)
     )
-    top_relations = [
-        entity for entity in all_entities if entity.title in related_entity_names
-    ]
+    top_relations = _as_entity_index(all_entities).get_by_names(related_entity_names)
     top_relations.sort(key=lambda x: x.rank if x.rank else 0, reverse=True)
     if k:
         return top_relations[:k]
     return top_relations
+
+
+def _as_entity_index(entities: Sequence[Entity]) -> EntityIndex:
+    """Use the given entity index, or index a plain list of entities."""
+    return entities if isinstance(entities, EntityIndex) else EntityIndex(entities)
@@ -4,25 +4,29 @@
 """Local Context Builder."""
 
 from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, replace
 from typing import Any, cast
 
 import pandas as pd
 import tiktoken
 
 from graphrag.model import Covariate, Entity, Relationship
-from graphrag.query.input.retrieval.covariates import (
+from ..input.retrieval.covariates import (
+    CovariateIndex,
     get_candidate_covariates,
     to_covariate_dataframe,
 )
-from graphrag.query.input.retrieval.entities import to_entity_dataframe
-from graphrag.query.input.retrieval.relationships import (
+from ..input.retrieval.entities import to_entity_dataframe
+from ..input.retrieval.relationships import (
+    RelationshipIndex,
     get_candidate_relationships,
     get_entities_from_relationships,
     get_in_network_relationships,
     get_out_network_relationships,
     to_relationship_dataframe,
 )
-from graphrag.query.llm.text_utils import num_tokens
+from ..llm.text_utils import TokenCounter
 
 
 def build_entity_context(
@@ -33,126 +37,62 @@ def build_entity_context(
     rank_description: str = "number of relationships",
     column_delimiter: str = "|",
     context_name="Entities",
+    token_counter: TokenCounter | None = None,
 ) -> tuple[str, pd.DataFrame]:
     """Prepare entity data table as context data for system prompt."""
-    if len(selected_entities) == 0:
-        return "", pd.DataFrame()
-
-    # add headers
-    current_context_text = f"-----{context_name}-----" + "\n"
-    header = ["id", "entity", "description"]
-    if include_entity_rank:
-        header.append(rank_description)
-    attribute_cols = (
-        list(selected_entities[0].attributes.keys())
-        if selected_entities[0].attributes
-        else []
+    table = _fit_entity_table(
+        selected_entities=selected_entities,
+        count_tokens=token_counter or TokenCounter(token_encoder),
+        max_tokens=max_tokens,
+        include_entity_rank=include_entity_rank,
+        rank_description=rank_description,
+        column_delimiter=column_delimiter,
+        context_name=context_name,
     )
-    header.extend(attribute_cols)
-    current_context_text += column_delimiter.join(header) + "\n"
-    current_tokens = num_tokens(current_context_text, token_encoder)
-
-    all_context_records = [header]
-    for entity in selected_entities:
-        new_context = [
-            entity.short_id if entity.short_id else "",
-            entity.title,
-            entity.description if entity.description else "",
-        ]
-        if include_entity_rank:
-            new_context.append(str(entity.rank))
-        for field in attribute_cols:
-            field_value = (
-                str(entity.attributes.get(field))
-                if entity.attributes and entity.attributes.get(field)
-                else ""
-            )
-            new_context.append(field_value)
-        new_context_text = column_delimiter.join(new_context) + "\n"
-        new_tokens = num_tokens(new_context_text, token_encoder)
-        if current_tokens + new_tokens > max_tokens:
-            break
-        current_context_text += new_context_text
-        all_context_records.append(new_context)
-        current_tokens += new_tokens
-
-    if len(all_context_records) > 1:
-        record_df = pd.DataFrame(
-            all_context_records[1:], columns=cast(Any, all_context_records[0])
-        )
-    else:
-        record_df = pd.DataFrame()
-
-    return current_context_text, record_df
+    return table.text, table.to_record_df()
 
 
 def build_covariates_context(
     selected_entities: list[Entity],
-    covariates: list[Covariate],
+    covariates: Sequence[Covariate],
     token_encoder: tiktoken.Encoding | None = None,
     max_tokens: int = 8000,
     column_delimiter: str = "|",
     context_name: str = "Covariates",
+    token_counter: TokenCounter | None = None,
 ) -> tuple[str, pd.DataFrame]:
     """Prepare covariate data tables as context data for system prompt."""
     # create an empty list of covariates
     if len(selected_entities) == 0 or len(covariates) == 0:
         return "", pd.DataFrame()
 
+    covariate_index = (
+        covariates
+        if isinstance(covariates, CovariateIndex)
+        else CovariateIndex(covariates)
+    )
     selected_covariates = list[Covariate]()
-    record_df = pd.DataFrame()
-
-    # add context header
-    current_context_text = f"-----{context_name}-----" + "\n"
-
-    # add header
-    header = ["id", "entity"]
-    attributes = covariates[0].attributes or {} if len(covariates) > 0 else {}
-    attribute_cols = list(attributes.keys()) if len(covariates) > 0 else []
-    header.extend(attribute_cols)
-    current_context_text += column_delimiter.join(header) + "\n"
-    current_tokens = num_tokens(current_context_text, token_encoder)
-
-    all_context_records = [header]
     for entity in selected_entities:
-        selected_covariates.extend([
-            cov for cov in covariates if cov.subject_id == entity.title
-        ])
-
-    for covariate in selected_covariates:
-        new_context = [
-            covariate.short_id if covariate.short_id else "",
-            covariate.subject_id,
-        ]
-        for field in attribute_cols:
-            field_value = (
-                str(covariate.attributes.get(field))
-                if covariate.attributes and covariate.attributes.get(field)
-                else ""
-            )
-            new_context.append(field_value)
-
-        new_context_text = column_delimiter.join(new_context) + "\n"
-        new_tokens = num_tokens(new_context_text, token_encoder)
-        if current_tokens + new_tokens > max_tokens:
-            break
-        current_context_text += new_context_text
-        all_context_records.append(new_context)
-        current_tokens += new_tokens
-
-        if len(all_context_records) > 1:
-            record_df = pd.DataFrame(
-                all_context_records[1:], columns=cast(Any, all_context_records[0])
-            )
-        else:
-            record_df = pd.DataFrame()
-
-    return current_context_text, record_df
+        selected_covariates.extend(covariate_index.get_by_subjects([entity.title]))
+
+    header = _covariate_header(covariates)
+    current_context_text, context_records, _ = _fit_records(
+        rows=(
+            (covariate, _covariate_record(covariate, header))
+            for covariate in selected_covariates
+        ),
+        header=header,
+        count_tokens=token_counter or TokenCounter(token_encoder),
+        max_tokens=max_tokens,
+        column_delimiter=column_delimiter,
+        context_name=context_name,
+    )
+    return current_context_text, _to_record_df(header, context_records)
 
 
 def build_relationship_context(
     selected_entities: list[Entity],
-    relationships: list[Relationship],
+    relationships: Sequence[Relationship],
     token_encoder: tiktoken.Encoding | None = None,
     include_relationship_weight: bool = False,
     max_tokens: int = 8000,
@@ -160,6 +100,7 @@ def build_relationship_context(
     relationship_ranking_attribute: str = "rank",
     column_delimiter: str = "|",
     context_name: str = "Relationships",
+    token_counter: TokenCounter | None = None,
 ) -> tuple[str, pd.DataFrame]:
     """Prepare relationship data tables as context data for system prompt."""
     selected_relationships = _filter_relationships(
@@ -172,64 +113,187 @@ def build_relationship_context(
     if len(selected_entities) == 0 or len(selected_relationships) == 0:
         return "", pd.DataFrame()
 
-    # add headers
-    current_context_text = f"-----{context_name}-----" + "\n"
-    header = ["id", "source", "target", "description"]
-    if include_relationship_weight:
-        header.append("weight")
-    attribute_cols = (
-        list(selected_relationships[0].attributes.keys())
-        if selected_relationships[0].attributes
-        else []
+    header = _relationship_header(selected_relationships, include_relationship_weight)
+    current_context_text, context_records, _ = _fit_records(
+        rows=(
+            (rel, _relationship_record(rel, header, include_relationship_weight))
+            for rel in selected_relationships
+        ),
+        header=header,
+        count_tokens=token_counter or TokenCounter(token_encoder),
+        max_tokens=max_tokens,
+        column_delimiter=column_delimiter,
+        context_name=context_name,
+        dynamic_columns=_relationship_dynamic_columns(header),
     )
-    attribute_cols = [col for col in attribute_cols if col not in header]
-    header.extend(attribute_cols)
-
-    current_context_text += column_delimiter.join(header) + "\n"
-    current_tokens = num_tokens(current_context_text, token_encoder)
-
-    all_context_records = [header]
-    for rel in selected_relationships:
-        new_context = [
-            rel.short_id if rel.short_id else "",
-            rel.source,
-            rel.target,
-            rel.description if rel.description else "",
-        ]
-        if include_relationship_weight:
-            new_context.append(str(rel.weight if rel.weight else ""))
-        for field in attribute_cols:
-            field_value = (
-                str(rel.attributes.get(field))
-                if rel.attributes and rel.attributes.get(field)
-                else ""
-            )
-            new_context.append(field_value)
-        new_context_text = column_delimiter.join(new_context) + "\n"
-        new_tokens = num_tokens(new_context_text, token_encoder)
-        if current_tokens + new_tokens > max_tokens:
-            break
-        current_context_text += new_context_text
-        all_context_records.append(new_context)
-        current_tokens += new_tokens
-
-    if len(all_context_records) > 1:
-        record_df = pd.DataFrame(
-            all_context_records[1:], columns=cast(Any, all_context_records[0])
+    return current_context_text, _to_record_df(header, context_records)
+
+
+class LocalContextAssembler:
+    """Fit the relationships and covariates of the selected entities into a token budget.
+
+    Entities are added one at a time, and an entity is only kept if the context still
+    fits afterwards. Rows are counted with a `TokenCounter`, which keeps the counts of
+    their static columns on the model objects, instead of re-tokenizing the whole
+    tables for every entity added, and the context tables are only built once, for
+    the entities that fit.
+    """
+
+    def __init__(
+        self,
+        relationships: Sequence[Relationship],
+        covariates: dict[str, Sequence[Covariate]],
+        token_encoder: tiktoken.Encoding | None = None,
+        include_relationship_weight: bool = False,
+        max_tokens: int = 8000,
+        top_k_relationships: int = 10,
+        relationship_ranking_attribute: str = "rank",
+        column_delimiter: str = "|",
+        context_name: str = "Relationships",
+        token_counter: TokenCounter | None = None,
+    ):
+        self.relationships = (
+            relationships
+            if isinstance(relationships, RelationshipIndex)
+            else RelationshipIndex(relationships)
         )
-    else:
-        record_df = pd.DataFrame()
+        self.covariates = {
+            name: values if isinstance(values, CovariateIndex) else CovariateIndex(values)
+            for name, values in covariates.items()
+        }
+        self.token_counter = token_counter or TokenCounter(token_encoder)
+        self.include_relationship_weight = include_relationship_weight
+        self.max_tokens = max_tokens
+        self.top_k_relationships = top_k_relationships
+        self.relationship_ranking_attribute = relationship_ranking_attribute
+        self.column_delimiter = column_delimiter
+        self.context_name = context_name
+        self.selected_entities: list[Entity] = []
+        self._relationship_table = _ContextTable("", [], [], 0)
+        self._covariate_tables = {
+            name: _ContextTable("", [], [], 0) for name in self.covariates
+        }
+
+    def fit_entity_context(
+        self,
+        selected_entities: list[Entity],
+        include_entity_rank: bool = True,
+        rank_description: str = "number of relationships",
+        context_name: str = "Entities",
+    ) -> tuple[str, pd.DataFrame, int]:
+        """Prepare the entity data table of the selected entities and count its tokens."""
+        table = _fit_entity_table(
+            selected_entities=selected_entities,
+            count_tokens=self.token_counter,
+            max_tokens=self.max_tokens,
+            include_entity_rank=include_entity_rank,
+            rank_description=rank_description,
+            column_delimiter=self.column_delimiter,
+            context_name=context_name,
+        )
+        return table.text, table.to_record_df(), table.tokens
+
+    def add(self, entity: Entity, max_tokens: int) -> bool:
+        """Add an entity if its relationships and covariates fit in max_tokens.
+
+        Returns False, and leaves the context as it was, if they do not fit.
+        """
+        selected_entities = [*self.selected_entities, entity]
+        # the relationships of every selected entity are re-ranked, since the entity
+        # can turn out-network relationships into in-network ones
+        relationship_table = self._fit_relationships(selected_entities)
+        covariate_tables = {
+            name: self._add_covariates(name, entity) for name in self.covariates
+        }
+        total_tokens = relationship_table.tokens + sum(
+            table.tokens for table in covariate_tables.values()
+        )
+        if total_tokens > max_tokens:
+            return False
+
+        self.selected_entities = selected_entities
+        self._relationship_table = relationship_table
+        self._covariate_tables = covariate_tables
+        return True
+
+    def build(self) -> tuple[list[str], dict[str, pd.DataFrame]]:
+        """Build the relationship and covariate context of the entities added so far."""
+        if not self.selected_entities:
+            return [], {}
+
+        context = [self._relationship_table.text]
+        context_data = {"relationships": self._relationship_table.to_record_df()}
+        for name, table in self._covariate_tables.items():
+            context.append(table.text)
+            context_data[name.lower()] = table.to_record_df()
+        return context, context_data
+
+    def _fit_relationships(self, selected_entities: list[Entity]) -> "_ContextTable":
+        selected_relationships = _filter_relationships(
+            selected_entities=selected_entities,
+            relationships=self.relationships,
+            top_k_relationships=self.top_k_relationships,
+            relationship_ranking_attribute=self.relationship_ranking_attribute,
+        )
+        if len(selected_relationships) == 0:
+            return _ContextTable("", [], [], 0)
 
-    return current_context_text, record_df
+        header = _relationship_header(
+            selected_relationships, self.include_relationship_weight
+        )
+        text, records, tokens = _fit_records(
+            rows=(
+                (rel, _relationship_record(rel, header, self.include_relationship_weight))
+                for rel in selected_relationships
+            ),
+            header=header,
+            count_tokens=self.token_counter,
+            max_tokens=self.max_tokens,
+            column_delimiter=self.column_delimiter,
+            context_name=self.context_name,
+            dynamic_columns=_relationship_dynamic_columns(header),
+        )
+        return _ContextTable(text, header, records, tokens)
+
+    def _add_covariates(self, name: str, entity: Entity) -> "_ContextTable":
+        covariates = self.covariates[name]
+        if len(covariates) == 0:
+            return _ContextTable("", [], [], 0)
+
+        table = self._covariate_tables[name]
+        if not table.header:
+            header = _covariate_header(covariates)
+            text = f"-----{name}-----" + "\n" + self.column_delimiter.join(header) + "\n"
+            table = _ContextTable(text, header, [], self.token_counter(text))
+        if table.full:
+            return table
+
+        # covariates are listed per entity, so the rows of the new entity go last
+        text, records, tokens = table.text, list(table.records), table.tokens
+        for covariate in covariates.get_by_subjects([entity.title]):
+            record = _covariate_record(covariate, table.header)
+            new_context_text = self.column_delimiter.join(record) + "\n"
+            new_tokens = self.token_counter.count_row(
+                covariate, record, self.column_delimiter
+            )
+            if tokens + new_tokens > self.max_tokens:
+                return _ContextTable(text, table.header, records, tokens, full=True)
+            text += new_context_text
+            records.append(record)
+            tokens += new_tokens
+        return _ContextTable(text, table.header, records, tokens)
 
 
 def _filter_relationships(
     selected_entities: list[Entity],
-    relationships: list[Relationship],
+    relationships: Sequence[Relationship],
     top_k_relationships: int = 10,
     relationship_ranking_attribute: str = "rank",
 ) -> list[Relationship]:
     """Filter and sort relationships based on a set of selected entities and a ranking attribute."""
+    if not isinstance(relationships, RelationshipIndex):
+        relationships = RelationshipIndex(relationships)
+
     # First priority: in-network relationships (i.e. relationships between selected entities)
     in_network_relationships = get_in_network_relationships(
         selected_entities=selected_entities,
@@ -249,68 +313,54 @@ def _filter_relationships(
 
     # within out-of-network relationships, prioritize mutual relationships
     # (i.e. relationships with out-network entities that are shared with multiple selected entities)
-    selected_entity_names = [entity.title for entity in selected_entities]
-    out_network_source_names = [
-        relationship.source
-        for relationship in out_network_relationships
-        if relationship.source not in selected_entity_names
-    ]
-    out_network_target_names = [
-        relationship.target
-        for relationship in out_network_relationships
-        if relationship.target not in selected_entity_names
-    ]
-    out_network_entity_names = list(
-        set(out_network_source_names + out_network_target_names)
-    )
-    out_network_entity_links = defaultdict(int)
-    for entity_name in out_network_entity_names:
-        targets = [
-            relationship.target
-            for relationship in out_network_relationships
-            if relationship.source == entity_name
-        ]
-        sources = [
-            relationship.source
-            for relationship in out_network_relationships
-            if relationship.target == entity_name
-        ]
-        out_network_entity_links[entity_name] = len(set(targets + sources))
-
-    # sort out-network relationships by number of links and rank_attributes
-    for rel in out_network_relationships:
-        if rel.attributes is None:
-            rel.attributes = {}
-        rel.attributes["links"] = (
+    selected_entity_names = {entity.title for entity in selected_entities}
+    out_network_entity_neighbors = defaultdict(set)
+    for relationship in out_network_relationships:
+        if relationship.source not in selected_entity_names:
+            out_network_entity_neighbors[relationship.source].add(relationship.target)
+        if relationship.target not in selected_entity_names:
+            out_network_entity_neighbors[relationship.target].add(relationship.source)
+    out_network_entity_links = {
+        entity_name: len(neighbors)
+        for entity_name, neighbors in out_network_entity_neighbors.items()
+    }
+
+    def links(rel: Relationship) -> int:
+        return (
             out_network_entity_links[rel.source]
             if rel.source in out_network_entity_links
             else out_network_entity_links[rel.target]
         )
 
-    # sort by attributes[links] first, then by ranking_attribute
+    # sort by links first, then by ranking_attribute
     if relationship_ranking_attribute == "weight":
         out_network_relationships.sort(
-            key=lambda x: (x.attributes["links"], x.weight),  # type: ignore
+            key=lambda x: (links(x), x.weight),  # type: ignore
             reverse=True,  # type: ignore
         )
     else:
         out_network_relationships.sort(
             key=lambda x: (
-                x.attributes["links"],  # type: ignore
+                links(x),
                 x.attributes[relationship_ranking_attribute],  # type: ignore
             ),  # type: ignore
             reverse=True,
         )
 
+    # the relationships of a loaded index are shared by queries, so the links of
+    # this selection go into copies instead of the relationship attributes
     relationship_budget = top_k_relationships * len(selected_entities)
-    return in_network_relationships + out_network_relationships[:relationship_budget]
+    return in_network_relationships + [
+        replace(rel, attributes={**(rel.attributes or {}), "links": links(rel)})
+        for rel in out_network_relationships[:relationship_budget]
+    ]
 
 
 def get_candidate_context(
     selected_entities: list[Entity],
-    entities: list[Entity],
-    relationships: list[Relationship],
-    covariates: dict[str, list[Covariate]],
+    entities: Sequence[Entity],
+    relationships: Sequence[Relationship],
+    covariates: dict[str, Sequence[Covariate]],
     include_entity_rank: bool = True,
     entity_rank_description: str = "number of relationships",
     include_relationship_weight: bool = False,
@@ -344,3 +394,165 @@ def get_candidate_context(
         )
 
     return candidate_context
+
+
+@dataclass
+class _ContextTable:
+    """A context table, with the rows that fit in the token budget."""
+
+    text: str
+    header: list[str]
+    records: list[list[str]]
+    tokens: int
+    full: bool = False
+
+    def to_record_df(self) -> pd.DataFrame:
+        return _to_record_df(self.header, self.records)
+
+
+def _fit_entity_table(
+    selected_entities: list[Entity],
+    count_tokens: TokenCounter,
+    max_tokens: int,
+    include_entity_rank: bool,
+    rank_description: str,
+    column_delimiter: str,
+    context_name: str,
+) -> _ContextTable:
+    if len(selected_entities) == 0:
+        return _ContextTable("", [], [], 0)
+
+    header = ["id", "entity", "description"]
+    if include_entity_rank:
+        header.append(rank_description)
+    attribute_cols = (
+        list(selected_entities[0].attributes.keys())
+        if selected_entities[0].attributes
+        else []
+    )
+    header.extend(attribute_cols)
+    text, records, tokens = _fit_records(
+        rows=(
+            (entity, _entity_record(entity, header, include_entity_rank))
+            for entity in selected_entities
+        ),
+        header=header,
+        count_tokens=count_tokens,
+        max_tokens=max_tokens,
+        column_delimiter=column_delimiter,
+        context_name=context_name,
+    )
+    return _ContextTable(text, header, records, tokens)
+
+
+def _fit_records(
+    rows: Iterable[tuple[Any, list[str]]],
+    header: list[str],
+    count_tokens: TokenCounter,
+    max_tokens: int,
+    column_delimiter: str,
+    context_name: str,
+    dynamic_columns: int = 0,
+) -> tuple[str, list[list[str]], int]:
+    """Add the rows of model objects to a context table until the next one does not fit in max_tokens."""
+    current_context_text = f"-----{context_name}-----" + "\n"
+    current_context_text += column_delimiter.join(header) + "\n"
+    current_tokens = count_tokens(current_context_text)
+
+    context_records = []
+    for item, new_context in rows:
+        new_context_text = column_delimiter.join(new_context) + "\n"
+        new_tokens = count_tokens.count_row(
+            item, new_context, column_delimiter, dynamic_columns
+        )
+        if current_tokens + new_tokens > max_tokens:
+            break
+        current_context_text += new_context_text
+        context_records.append(new_context)
+        current_tokens += new_tokens
+    return current_context_text, context_records, current_tokens
+
+
+def _to_record_df(header: list[str], records: list[list[str]]) -> pd.DataFrame:
+    if len(records) == 0:
+        return pd.DataFrame()
+    return pd.DataFrame(records, columns=cast(Any, header))
+
+
+def _entity_record(
+    entity: Entity, header: list[str], include_entity_rank: bool
+) -> list[str]:
+    new_context = [
+        entity.short_id if entity.short_id else "",
+        entity.title,
+        entity.description if entity.description else "",
+    ]
+    if include_entity_rank:
+        new_context.append(str(entity.rank))
+    for field in header[len(new_context) :]:
+        field_value = (
+            str(entity.attributes.get(field))
+            if entity.attributes and entity.attributes.get(field)
+            else ""
+        )
+        new_context.append(field_value)
+    return new_context
+
+
+def _relationship_header(
+    relationships: list[Relationship], include_relationship_weight: bool
+) -> list[str]:
+    header = ["id", "source", "target", "description"]
+    if include_relationship_weight:
+        header.append("weight")
+    # in-network relationships come first and carry no links, so the attribute
+    # columns are collected over every selected relationship
+    for rel in relationships:
+        header.extend(col for col in (rel.attributes or {}) if col not in header)
+    return header
+
+
+def _relationship_dynamic_columns(header: list[str]) -> int:
+    """Return the number of columns, from the "links" column on, that change per query."""
+    return len(header) - header.index("links") if "links" in header else 0
+
+
+def _relationship_record(
+    rel: Relationship, header: list[str], include_relationship_weight: bool
+) -> list[str]:
+    new_context = [
+        rel.short_id if rel.short_id else "",
+        rel.source,
+        rel.target,
+        rel.description if rel.description else "",
+    ]
+    if include_relationship_weight:
+        new_context.append(str(rel.weight if rel.weight else ""))
+    for field in header[len(new_context) :]:
+        field_value = (
+            str(rel.attributes.get(field))
+            if rel.attributes and rel.attributes.get(field)
+            else ""
+        )
+        new_context.append(field_value)
+    return new_context
+
+
+def _covariate_header(covariates: Sequence[Covariate]) -> list[str]:
+    attributes = covariates[0].attributes or {}
+    return ["id", "entity", *attributes.keys()]
+
+
+def _covariate_record(covariate: Covariate, header: list[str]) -> list[str]:
+    new_context = [
+        covariate.short_id if covariate.short_id else "",
+        covariate.subject_id,
+    ]
+    for field in header[len(new_context) :]:
+        field_value = (
+            str(covariate.attributes.get(field))
+            if covariate.attributes and covariate.attributes.get(field)
+            else ""
+        )
+        new_context.append(field_value)
+    return new_context
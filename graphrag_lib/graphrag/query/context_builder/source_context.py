@@ -10,7 +10,8 @@ import pandas as pd
 import tiktoken
 
 from graphrag.model import Entity, Relationship, TextUnit
-from graphrag.query.llm.text_utils import num_tokens
+from ..input.retrieval.relationships import RelationshipIndex
+from ..llm.text_utils import TokenCounter
 
 """
 Contain util functions to build text unit context for the search's system prompt
@@ -25,8 +26,10 @@ def build_text_unit_context(
     max_tokens: int = 8000,
     context_name: str = "Sources",
     random_state: int = 86,
+    token_counter: TokenCounter | None = None,
 ) -> tuple[str, dict[str, pd.DataFrame]]:
     """Prepare text-unit data table as context data for system prompt."""
+    count_tokens = token_counter or TokenCounter(token_encoder)
     if text_units is None or len(text_units) == 0:
         return ("", {})
 
@@ -46,7 +49,7 @@ def build_text_unit_context(
     header.extend(attribute_cols)
 
     current_context_text += column_delimiter.join(header) + "\n"
-    current_tokens = num_tokens(current_context_text, token_encoder)
+    current_tokens = count_tokens(current_context_text)
     all_context_records = [header]
 
     for unit in text_units:
@@ -59,7 +62,7 @@ def build_text_unit_context(
             ],
         ]
         new_context_text = column_delimiter.join(new_context) + "\n"
-        new_tokens = num_tokens(new_context_text, token_encoder)
+        new_tokens = count_tokens.count_row(unit, new_context, column_delimiter)
 
         if current_tokens + new_tokens > max_tokens:
             break
@@ -78,18 +81,22 @@ def build_text_unit_context(
 
 
 def count_relationships(
-    text_unit: TextUnit, entity: Entity, relationships: dict[str, Relationship]
+    text_unit: TextUnit,
+    entity: Entity,
+    relationships: dict[str, Relationship] | RelationshipIndex,
 ) -> int:
     """Count the number of relationships of the selected entity that are associated with the text unit."""
+    relationship_index = (
+        relationships
+        if isinstance(relationships, RelationshipIndex)
+        else RelationshipIndex(relationships.values())
+    )
     matching_relationships = list[Relationship]()
     if text_unit.relationship_ids is None:
         entity_relationships = [
             rel
-            for rel in relationships.values()
-            if rel.source == entity.title or rel.target == entity.title
-        ]
-        entity_relationships = [
-            rel for rel in entity_relationships if rel.text_unit_ids
+            for rel in relationship_index.get_adjacent([entity.title])
+            if rel.text_unit_ids
         ]
         matching_relationships = [
             rel
@@ -98,9 +105,9 @@ def count_relationships(
         ]  # type: ignore
     else:
         text_unit_relationships = [
-            relationships[rel_id]
+            relationship_index.by_id[rel_id]
             for rel_id in text_unit.relationship_ids
-            if rel_id in relationships
+            if rel_id in relationship_index.by_id
         ]
         matching_relationships = [
             rel
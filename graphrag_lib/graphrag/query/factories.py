@@ -3,6 +3,8 @@
 
 """Query Factory methods to support CLI."""
 
+import sys
+
 import tiktoken
 from azure.identity import DefaultAzureCredential, get_bearer_token_provider
 
@@ -18,12 +20,22 @@ from graphrag.model import (
     Relationship,
     TextUnit,
 )
+from .context_builder.community_context import build_community_context
 from graphrag.query.context_builder.entity_extraction import EntityVectorStoreKey
+from .context_builder.local_context import (
+    build_covariates_context,
+    build_entity_context,
+    build_relationship_context,
+)
+from .context_builder.source_context import build_text_unit_context
 from graphrag.query.llm.oai.chat_openai import ChatOpenAI
-from graphrag.query.llm.oai.embedding import OpenAIEmbedding
+from .llm.oai.embedding import OpenAIEmbedding
 from graphrag.query.llm.oai.typing import OpenaiApiType
+from .llm.text_utils import TokenCounter
+from .llm.oai.client_pool import get_client_pool
+from .llm.oai.embedding_cache import get_query_embedding_cache
 from graphrag.query.structured_search.base import BaseSearch
-from graphrag.query.structured_search.global_search.community_context import (
+from .structured_search.global_search.community_context import (
     GlobalCommunityContext,
 )
 from graphrag.query.structured_search.global_search.search import GlobalSearch
@@ -56,7 +68,7 @@ def get_llm(config: GraphRagConfig) -> ChatOpenAI:
         cognitive_services_endpoint = config.llm.cognitive_services_endpoint
     print(f"Creating llm client with {llm_debug_info}")  # noqa T201
     
-    return ChatOpenAI(
+    llm = ChatOpenAI(
         api_key=config.llm.api_key,
         azure_ad_token_provider=(
             get_bearer_token_provider(
@@ -74,6 +86,8 @@ def get_llm(config: GraphRagConfig) -> ChatOpenAI:
         max_retries=config.llm.max_retries,
         request_timeout=config.llm.request_timeout,
     )
+    client_pool = get_client_pool()
+    return client_pool.attach(llm) if client_pool is not None else llm
 
 
 def get_text_embedder(config: GraphRagConfig) -> OpenAIEmbedding:
@@ -89,7 +103,7 @@ def get_text_embedder(config: GraphRagConfig) -> OpenAIEmbedding:
     else:
         cognitive_services_endpoint = config.embeddings.llm.cognitive_services_endpoint
     print(f"creating embedding llm client with {llm_debug_info}")  # noqa T201
-    return OpenAIEmbedding(
+    text_embedder = OpenAIEmbedding(
         api_key=config.embeddings.llm.api_key,
         azure_ad_token_provider=(
             get_bearer_token_provider(
@@ -105,7 +119,10 @@ def get_text_embedder(config: GraphRagConfig) -> OpenAIEmbedding:
         deployment_name=config.embeddings.llm.deployment_name,
         api_version=config.embeddings.llm.api_version,
         max_retries=config.embeddings.llm.max_retries,
+        cache=get_query_embedding_cache(),
     )
+    client_pool = get_client_pool()
+    return client_pool.attach(text_embedder) if client_pool is not None else text_embedder
 
 
 def get_local_search_engine(
@@ -117,7 +134,8 @@ def get_local_search_engine(
     covariates: dict[str, list[Covariate]],
     response_type: str,
     description_embedding_store: BaseVectorStore,
-    system_prompt:str
+    system_prompt:str,
+    token_counter: TokenCounter | None = None,
 ) -> BaseSearch:
     """Create a local search engine based on data + configuration."""
     llm = get_llm(config)
@@ -139,6 +157,7 @@ def get_local_search_engine(
             embedding_vectorstore_key=EntityVectorStoreKey.ID,  # if the vectorstore uses entity title as ids, set this to EntityVectorStoreKey.TITLE
             text_embedder=text_embedder,
             token_encoder=token_encoder,
+            token_counter=token_counter,
         ),
         token_encoder=token_encoder,
         system_prompt=system_prompt,
@@ -148,24 +167,87 @@ def get_local_search_engine(
             "top_p": ls_config.top_p,
             "n": ls_config.n,
         },
-        context_builder_params={
-            "text_unit_prop": ls_config.text_unit_prop,
-            "community_prop": ls_config.community_prop,
-            "conversation_history_max_turns": ls_config.conversation_history_max_turns,
-            "conversation_history_user_turns_only": True,
-            "top_k_mapped_entities": ls_config.top_k_entities,
-            "top_k_relationships": ls_config.top_k_relationships,
-            "include_entity_rank": True,
-            "include_relationship_weight": True,
-            "include_community_rank": False,
-            "return_candidate_context": False,
-            "embedding_vectorstore_key": EntityVectorStoreKey.ID,  # set this to EntityVectorStoreKey.TITLE if the vectorstore uses entity title as ids
-            "max_tokens": ls_config.max_tokens,  # change this based on the token limit you have on your model (if you are using a model with 8k limit, a good setting could be 5000)
-        },
+        context_builder_params=_get_local_context_builder_params(config),
         response_type=response_type,
     )
 
 
+def _get_local_context_builder_params(config: GraphRagConfig) -> dict:
+    ls_config = config.local_search
+    return {
+        "text_unit_prop": ls_config.text_unit_prop,
+        "community_prop": ls_config.community_prop,
+        "conversation_history_max_turns": ls_config.conversation_history_max_turns,
+        "conversation_history_user_turns_only": True,
+        "top_k_mapped_entities": ls_config.top_k_entities,
+        "top_k_relationships": ls_config.top_k_relationships,
+        "include_entity_rank": True,
+        "include_relationship_weight": True,
+        "include_community_rank": False,
+        "return_candidate_context": False,
+        "embedding_vectorstore_key": EntityVectorStoreKey.ID,  # set this to EntityVectorStoreKey.TITLE if the vectorstore uses entity title as ids
+        "max_tokens": ls_config.max_tokens,  # change this based on the token limit you have on your model (if you are using a model with 8k limit, a good setting could be 5000)
+    }
+
+
+def get_local_search_token_counter(
+    config: GraphRagConfig,
+    reports: list[CommunityReport],
+    text_units: list[TextUnit],
+    entities: list[Entity],
+    relationships: list[Relationship],
+    covariates: dict[str, list[Covariate]],
+) -> TokenCounter:
+    """Create a token counter with the static columns of every context table row counted.
+
+    The tables are built once over all rows of the index, with the parameters of
+    `get_local_search_engine`, which stores the token count of each row on its model
+    object. Queries then only encode the columns that change per query, like the
+    "links" of relationships.
+    """
+    token_counter = TokenCounter(tiktoken.get_encoding(config.encoding_model))
+    params = _get_local_context_builder_params(config)
+    unlimited = sys.maxsize
+
+    build_entity_context(
+        selected_entities=entities,
+        max_tokens=unlimited,
+        include_entity_rank=params["include_entity_rank"],
+        token_counter=token_counter,
+    )
+    build_relationship_context(
+        selected_entities=entities,
+        relationships=relationships,
+        include_relationship_weight=params["include_relationship_weight"],
+        max_tokens=unlimited,
+        top_k_relationships=params["top_k_relationships"],
+        token_counter=token_counter,
+    )
+    for name, values in covariates.items():
+        build_covariates_context(
+            selected_entities=entities,
+            covariates=values,
+            max_tokens=unlimited,
+            context_name=name,
+            token_counter=token_counter,
+        )
+    build_community_context(
+        community_reports=reports,
+        use_community_summary=False,
+        shuffle_data=False,
+        include_community_rank=params["include_community_rank"],
+        max_tokens=unlimited,
+        token_counter=token_counter,
+    )
+    build_text_unit_context(
+        text_units=text_units,
+        shuffle_data=False,
+        max_tokens=unlimited,
+        token_counter=token_counter,
+    )
+    return token_counter
+
+
 def get_global_search_engine(
     config: GraphRagConfig,
     reports: list[CommunityReport],
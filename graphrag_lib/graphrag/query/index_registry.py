@@ -0,0 +1,259 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Process-wide registry of loaded GraphRAG indexes.
+
+Each domain root (one of the ``graphrag_*`` folders) is loaded once: its config,
+output parquet tables, knowledge model objects, entity description store, the token
+counts of the context table rows and the search engines built on top of them are
+kept in memory and shared by every later request. An entry is reloaded when the mtime of any of its parquet files changes.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pandas as pd
+
+from graphrag.config import GraphRagConfig, load_config
+from graphrag.index.create_pipeline_config import create_pipeline_config
+from graphrag.index.storage.file_pipeline_storage import FilePipelineStorage
+from graphrag.model import CommunityReport, Covariate, Entity, Relationship, TextUnit
+from graphrag.utils.storage import _create_storage, _load_table_from_storage
+
+from ..vector_stores import BaseVectorStore
+from ..vector_stores.typing import VectorStoreType
+from .api import _get_embedding_description_store
+from .factories import get_local_search_engine, get_local_search_token_counter
+from .indexer_adapters import (
+    read_indexer_covariates,
+    read_indexer_entities,
+    read_indexer_relationships,
+    read_indexer_reports,
+    read_indexer_text_units,
+)
+from .llm.text_utils import TokenCounter
+from .structured_search.base import BaseSearch
+
+log = logging.getLogger(__name__)
+
+LOCAL_SEARCH_PARQUET_LIST = [
+    "create_final_nodes.parquet",
+    "create_final_community_reports.parquet",
+    "create_final_text_units.parquet",
+    "create_final_relationships.parquet",
+    "create_final_entities.parquet",
+]
+LOCAL_SEARCH_OPTIONAL_LIST = ["create_final_covariates.parquet"]
+
+
+@dataclass
+class DomainIndex:
+    """The resident, query-ready state of a single GraphRAG root."""
+
+    root_dir: str
+    config: GraphRagConfig
+    community_level: int
+    dataframes: dict[str, pd.DataFrame | None]
+    storage_dir: str | None
+    mtimes: dict[str, float]
+    entities: list[Entity]
+    reports: list[CommunityReport]
+    text_units: list[TextUnit]
+    relationships: list[Relationship]
+    covariates: list[Covariate]
+    description_embedding_store: BaseVectorStore
+    token_counter: TokenCounter
+    search_engines: dict[tuple[str, str], BaseSearch] = field(default_factory=dict)
+
+    def get_local_search_engine(
+        self, response_type: str, system_prompt: str
+    ) -> BaseSearch:
+        """Return the local search engine for this index, building it on first use."""
+        key = (response_type, system_prompt)
+        search_engine = self.search_engines.get(key)
+        if search_engine is None:
+            search_engine = get_local_search_engine(
+                config=self.config,
+                reports=self.reports,
+                text_units=self.text_units,
+                entities=self.entities,
+                relationships=self.relationships,
+                covariates={"claims": self.covariates},
+                description_embedding_store=self.description_embedding_store,
+                response_type=response_type,
+                system_prompt=system_prompt,
+                token_counter=self.token_counter,
+            )
+            self.search_engines[key] = search_engine
+        return search_engine
+
+
+class IndexRegistry:
+    """Load GraphRAG indexes once per process and serve them from memory."""
+
+    def __init__(self):
+        self._entries: dict[tuple, DomainIndex] = {}
+        self._locks: dict[tuple, asyncio.Lock] = {}
+
+    async def get(
+        self,
+        root_dir: str,
+        config_filepath: str | None,
+        data_dir: str | None,
+        community_level: int,
+    ) -> DomainIndex:
+        """Return the loaded index for a root, (re)loading it if missing or stale."""
+        key = (str(Path(root_dir).resolve()), config_filepath, data_dir, community_level)
+        entry = self._entries.get(key)
+        if entry is not None and not _is_stale(entry):
+            return entry
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # another request may have finished loading while we waited
+            entry = self._entries.get(key)
+            if entry is not None and not _is_stale(entry):
+                return entry
+            if entry is not None:
+                log.info("index files changed, reloading %s", root_dir)
+            entry = await _load_domain_index(
+                root_dir, config_filepath, data_dir, community_level
+            )
+            self._entries[key] = entry
+            return entry
+
+    async def preload(
+        self,
+        root_dirs: list[str],
+        community_level: int,
+    ) -> None:
+        """Load every root that has a settings.yaml; failures are logged and skipped."""
+        for root_dir in dict.fromkeys(root_dirs):
+            config_filepath = f"{root_dir}/settings.yaml"
+            if not Path(config_filepath).is_file():
+                continue
+            try:
+                await self.get(root_dir, config_filepath, None, community_level)
+                log.info("preloaded graphrag index %s", root_dir)
+            except Exception:
+                log.exception("failed to preload graphrag index %s", root_dir)
+
+    def invalidate(self, root_dir: str | None = None) -> None:
+        """Drop the entries of one root, or of every root when root_dir is None."""
+        if root_dir is None:
+            self._entries.clear()
+            return
+        resolved = str(Path(root_dir).resolve())
+        for key in [key for key in self._entries if key[0] == resolved]:
+            del self._entries[key]
+
+
+_index_registry = IndexRegistry()
+
+
+def get_index_registry() -> IndexRegistry:
+    """Return the process-wide index registry."""
+    return _index_registry
+
+
+async def _load_domain_index(
+    root_dir: str,
+    config_filepath: str | None,
+    data_dir: str | None,
+    community_level: int,
+) -> DomainIndex:
+    root = Path(root_dir).resolve()
+    config = load_config(root, config_filepath)
+    config.storage.base_dir = data_dir or config.storage.base_dir
+
+    pipeline_config = create_pipeline_config(config)
+    storage = _create_storage(root_dir=root_dir, config=pipeline_config.storage)
+
+    storage_dir = (
+        storage._root_dir  # noqa: SLF001
+        if isinstance(storage, FilePipelineStorage)
+        else None
+    )
+    mtimes = _file_mtimes(
+        storage_dir, LOCAL_SEARCH_PARQUET_LIST + LOCAL_SEARCH_OPTIONAL_LIST
+    )
+    dataframes: dict[str, pd.DataFrame | None] = {}
+    for parquet_file in LOCAL_SEARCH_PARQUET_LIST:
+        dataframes[parquet_file.split(".")[0]] = await _load_table_from_storage(
+            name=parquet_file, storage=storage
+        )
+    for optional_file in LOCAL_SEARCH_OPTIONAL_LIST:
+        df_key = optional_file.split(".")[0]
+        if await storage.has(optional_file):
+            dataframes[df_key] = await _load_table_from_storage(
+                name=optional_file, storage=storage
+            )
+        else:
+            dataframes[df_key] = None
+
+    nodes = dataframes["create_final_nodes"]
+    covariates = dataframes["create_final_covariates"]
+    entities = read_indexer_entities(
+        nodes, dataframes["create_final_entities"], community_level
+    )
+
+    vector_store_args = (
+        config.embeddings.vector_store if config.embeddings.vector_store else {}
+    )
+    vector_store_type = vector_store_args.get("type", VectorStoreType.LanceDB)
+    description_embedding_store = _get_embedding_description_store(
+        entities=entities,
+        vector_store_type=vector_store_type,
+        config_args=vector_store_args,
+        root_dir=config.root_dir,
+    )
+
+    reports = read_indexer_reports(
+        dataframes["create_final_community_reports"], nodes, community_level
+    )
+    text_units = read_indexer_text_units(dataframes["create_final_text_units"])
+    relationships = read_indexer_relationships(dataframes["create_final_relationships"])
+    claims = read_indexer_covariates(covariates) if covariates is not None else []
+    # the entity, relationship, report and text unit rows do not change until the
+    # index is reloaded, so their token counts are computed once, here
+    token_counter = get_local_search_token_counter(
+        config=config,
+        reports=reports,
+        text_units=text_units,
+        entities=entities,
+        relationships=relationships,
+        covariates={"claims": claims},
+    )
+
+    return DomainIndex(
+        root_dir=root_dir,
+        config=config,
+        community_level=community_level,
+        dataframes=dataframes,
+        storage_dir=storage_dir,
+        mtimes=mtimes,
+        entities=entities,
+        reports=reports,
+        text_units=text_units,
+        relationships=relationships,
+        covariates=claims,
+        description_embedding_store=description_embedding_store,
+        token_counter=token_counter,
+    )
+
+
+def _file_mtimes(storage_dir: str | None, names: list[str]) -> dict[str, float]:
+    """Stat the given files of a file storage; other storage types are never stale."""
+    if storage_dir is None:
+        return {}
+    mtimes = {}
+    for name in names:
+        path = Path(storage_dir) / name
+        mtimes[name] = path.stat().st_mtime if path.exists() else 0.0
+    return mtimes
+
+
+def _is_stale(entry: DomainIndex) -> bool:
+    return _file_mtimes(entry.storage_dir, list(entry.mtimes)) != entry.mtimes
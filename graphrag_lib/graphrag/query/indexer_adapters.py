@@ -11,7 +11,7 @@ from typing import cast
 import pandas as pd
 
 from graphrag.model import CommunityReport, Covariate, Entity, Relationship, TextUnit
-from graphrag.query.input.loaders.dfs import (
+from .input.loaders.dfs import (
     read_community_reports,
     read_covariates,
     read_entities,
@@ -14,14 +14,16 @@ from graphrag.model import (
     Relationship,
     TextUnit,
 )
-from graphrag.query.input.loaders.utils import (
-    to_list,
-    to_optional_dict,
-    to_optional_float,
-    to_optional_int,
-    to_optional_list,
-    to_optional_str,
-    to_str,
+from .utils import (
+    column_attributes,
+    column_short_ids,
+    column_to_list,
+    column_to_optional_dict,
+    column_to_optional_float,
+    column_to_optional_int,
+    column_to_optional_list,
+    column_to_optional_str,
+    column_to_str,
 )
 from graphrag.vector_stores import BaseVectorStore, VectorStoreDocument
 
@@ -42,32 +44,59 @@ def read_entities(
     rank_col: str | None = "degree",
     attributes_cols: list[str] | None = None,
 ) -> list[Entity]:
-    """Read entities from a dataframe."""
-    entities = []
-    for idx, row in df.iterrows():
-        entity = Entity(
-            id=to_str(row, id_col),
-            short_id=to_optional_str(row, short_id_col) if short_id_col else str(idx),
-            title=to_str(row, title_col),
-            type=to_optional_str(row, type_col),
-            description=to_optional_str(row, description_col),
-            name_embedding=to_optional_list(row, name_embedding_col, item_type=float),
-            description_embedding=to_optional_list(
-                row, description_embedding_col, item_type=float
-            ),
-            graph_embedding=to_optional_list(row, graph_embedding_col, item_type=float),
-            community_ids=to_optional_list(row, community_col, item_type=str),
-            text_unit_ids=to_optional_list(row, text_unit_ids_col),
-            document_ids=to_optional_list(row, document_ids_col),
-            rank=to_optional_int(row, rank_col),
-            attributes=(
-                {col: row.get(col) for col in attributes_cols}
-                if attributes_cols
-                else None
-            ),
+    """Read entities from a dataframe.
+
+    Columns are converted whole and zipped into model objects, instead of
+    converting cell by cell over ``df.iterrows()``.
+    """
+    columns = zip(
+        column_to_str(df, id_col),
+        column_short_ids(df, short_id_col),
+        column_to_str(df, title_col),
+        column_to_optional_str(df, type_col),
+        column_to_optional_str(df, description_col),
+        column_to_optional_list(df, name_embedding_col, item_type=float),
+        column_to_optional_list(df, description_embedding_col, item_type=float),
+        column_to_optional_list(df, graph_embedding_col, item_type=float),
+        column_to_optional_list(df, community_col, item_type=str),
+        column_to_optional_list(df, text_unit_ids_col),
+        column_to_optional_list(df, document_ids_col),
+        column_to_optional_int(df, rank_col),
+        column_attributes(df, attributes_cols),
+        strict=True,
+    )
+    return [
+        Entity(
+            id=row_id,
+            short_id=short_id,
+            title=title,
+            type=row_type,
+            description=description,
+            name_embedding=name_embedding,
+            description_embedding=description_embedding,
+            graph_embedding=graph_embedding,
+            community_ids=community_ids,
+            text_unit_ids=text_unit_ids,
+            document_ids=document_ids,
+            rank=rank,
+            attributes=attributes,
         )
-        entities.append(entity)
-    return entities
+        for (
+            row_id,
+            short_id,
+            title,
+            row_type,
+            description,
+            name_embedding,
+            description_embedding,
+            graph_embedding,
+            community_ids,
+            text_unit_ids,
+            document_ids,
+            rank,
+            attributes,
+        ) in columns
+    ]
 
 
 def store_entity_semantic_embeddings(
@@ -128,28 +157,45 @@ def read_relationships(
     attributes_cols: list[str] | None = None,
 ) -> list[Relationship]:
     """Read relationships from a dataframe."""
-    relationships = []
-    for idx, row in df.iterrows():
-        rel = Relationship(
-            id=to_str(row, id_col),
-            short_id=to_optional_str(row, short_id_col) if short_id_col else str(idx),
-            source=to_str(row, source_col),
-            target=to_str(row, target_col),
-            description=to_optional_str(row, description_col),
-            description_embedding=to_optional_list(
-                row, description_embedding_col, item_type=float
-            ),
-            weight=to_optional_float(row, weight_col),
-            text_unit_ids=to_optional_list(row, text_unit_ids_col, item_type=str),
-            document_ids=to_optional_list(row, document_ids_col, item_type=str),
-            attributes=(
-                {col: row.get(col) for col in attributes_cols}
-                if attributes_cols
-                else None
-            ),
+    columns = zip(
+        column_to_str(df, id_col),
+        column_short_ids(df, short_id_col),
+        column_to_str(df, source_col),
+        column_to_str(df, target_col),
+        column_to_optional_str(df, description_col),
+        column_to_optional_list(df, description_embedding_col, item_type=float),
+        column_to_optional_float(df, weight_col),
+        column_to_optional_list(df, text_unit_ids_col, item_type=str),
+        column_to_optional_list(df, document_ids_col, item_type=str),
+        column_attributes(df, attributes_cols),
+        strict=True,
+    )
+    return [
+        Relationship(
+            id=row_id,
+            short_id=short_id,
+            source=source,
+            target=target,
+            description=description,
+            description_embedding=description_embedding,
+            weight=weight,
+            text_unit_ids=text_unit_ids,
+            document_ids=document_ids,
+            attributes=attributes,
         )
-        relationships.append(rel)
-    return relationships
+        for (
+            row_id,
+            short_id,
+            source,
+            target,
+            description,
+            description_embedding,
+            weight,
+            text_unit_ids,
+            document_ids,
+            attributes,
+        ) in columns
+    ]
 
 
 def read_covariates(
@@ -163,25 +209,38 @@ def read_covariates(
     attributes_cols: list[str] | None = None,
 ) -> list[Covariate]:
     """Read covariates from a dataframe."""
-    covariates = []
-    for idx, row in df.iterrows():
-        cov = Covariate(
-            id=to_str(row, id_col),
-            short_id=to_optional_str(row, short_id_col) if short_id_col else str(idx),
-            subject_id=to_str(row, subject_col),
-            covariate_type=(
-                to_str(row, covariate_type_col) if covariate_type_col else "claim"
-            ),
-            text_unit_ids=to_optional_list(row, text_unit_ids_col, item_type=str),
-            document_ids=to_optional_list(row, document_ids_col, item_type=str),
-            attributes=(
-                {col: row.get(col) for col in attributes_cols}
-                if attributes_cols
-                else None
-            ),
+    columns = zip(
+        column_to_str(df, id_col),
+        column_short_ids(df, short_id_col),
+        column_to_str(df, subject_col),
+        column_to_str(df, covariate_type_col)
+        if covariate_type_col
+        else ["claim"] * len(df),
+        column_to_optional_list(df, text_unit_ids_col, item_type=str),
+        column_to_optional_list(df, document_ids_col, item_type=str),
+        column_attributes(df, attributes_cols),
+        strict=True,
+    )
+    return [
+        Covariate(
+            id=row_id,
+            short_id=short_id,
+            subject_id=subject_id,
+            covariate_type=covariate_type,
+            text_unit_ids=text_unit_ids,
+            document_ids=document_ids,
+            attributes=attributes,
         )
-        covariates.append(cov)
-    return covariates
+        for (
+            row_id,
+            short_id,
+            subject_id,
+            covariate_type,
+            text_unit_ids,
+            document_ids,
+            attributes,
+        ) in columns
+    ]
 
 
 def read_communities(
@@ -196,26 +255,39 @@ def read_communities(
     attributes_cols: list[str] | None = None,
 ) -> list[Community]:
     """Read communities from a dataframe."""
-    communities = []
-    for idx, row in df.iterrows():
-        comm = Community(
-            id=to_str(row, id_col),
-            short_id=to_optional_str(row, short_id_col) if short_id_col else str(idx),
-            title=to_str(row, title_col),
-            level=to_str(row, level_col),
-            entity_ids=to_optional_list(row, entities_col, item_type=str),
-            relationship_ids=to_optional_list(row, relationships_col, item_type=str),
-            covariate_ids=to_optional_dict(
-                row, covariates_col, key_type=str, value_type=str
-            ),
-            attributes=(
-                {col: row.get(col) for col in attributes_cols}
-                if attributes_cols
-                else None
-            ),
+    columns = zip(
+        column_to_str(df, id_col),
+        column_short_ids(df, short_id_col),
+        column_to_str(df, title_col),
+        column_to_str(df, level_col),
+        column_to_optional_list(df, entities_col, item_type=str),
+        column_to_optional_list(df, relationships_col, item_type=str),
+        column_to_optional_dict(df, covariates_col, key_type=str, value_type=str),
+        column_attributes(df, attributes_cols),
+        strict=True,
+    )
+    return [
+        Community(
+            id=row_id,
+            short_id=short_id,
+            title=title,
+            level=level,
+            entity_ids=entity_ids,
+            relationship_ids=relationship_ids,
+            covariate_ids=covariate_ids,
+            attributes=attributes,
         )
-        communities.append(comm)
-    return communities
+        for (
+            row_id,
+            short_id,
+            title,
+            level,
+            entity_ids,
+            relationship_ids,
+            covariate_ids,
+            attributes,
+        ) in columns
+    ]
 
 
 def read_community_reports(
@@ -232,30 +304,45 @@ def read_community_reports(
     attributes_cols: list[str] | None = None,
 ) -> list[CommunityReport]:
     """Read community reports from a dataframe."""
-    reports = []
-    for idx, row in df.iterrows():
-        report = CommunityReport(
-            id=to_str(row, id_col),
-            short_id=to_optional_str(row, short_id_col) if short_id_col else str(idx),
-            title=to_str(row, title_col),
-            community_id=to_str(row, community_col),
-            summary=to_str(row, summary_col),
-            full_content=to_str(row, content_col),
-            rank=to_optional_float(row, rank_col),
-            summary_embedding=to_optional_list(
-                row, summary_embedding_col, item_type=float
-            ),
-            full_content_embedding=to_optional_list(
-                row, content_embedding_col, item_type=float
-            ),
-            attributes=(
-                {col: row.get(col) for col in attributes_cols}
-                if attributes_cols
-                else None
-            ),
+    columns = zip(
+        column_to_str(df, id_col),
+        column_short_ids(df, short_id_col),
+        column_to_str(df, title_col),
+        column_to_str(df, community_col),
+        column_to_str(df, summary_col),
+        column_to_str(df, content_col),
+        column_to_optional_float(df, rank_col),
+        column_to_optional_list(df, summary_embedding_col, item_type=float),
+        column_to_optional_list(df, content_embedding_col, item_type=float),
+        column_attributes(df, attributes_cols),
+        strict=True,
+    )
+    return [
+        CommunityReport(
+            id=row_id,
+            short_id=short_id,
+            title=title,
+            community_id=community_id,
+            summary=summary,
+            full_content=full_content,
+            rank=rank,
+            summary_embedding=summary_embedding,
+            full_content_embedding=full_content_embedding,
+            attributes=attributes,
         )
-        reports.append(report)
-    return reports
+        for (
+            row_id,
+            short_id,
+            title,
+            community_id,
+            summary,
+            full_content,
+            rank,
+            summary_embedding,
+            full_content_embedding,
+            attributes,
+        ) in columns
+    ]
 
 
 def read_text_units(
@@ -272,28 +359,45 @@ def read_text_units(
     attributes_cols: list[str] | None = None,
 ) -> list[TextUnit]:
     """Read text units from a dataframe."""
-    text_units = []
-    for idx, row in df.iterrows():
-        chunk = TextUnit(
-            id=to_str(row, id_col),
-            short_id=to_optional_str(row, short_id_col) if short_id_col else str(idx),
-            text=to_str(row, text_col),
-            entity_ids=to_optional_list(row, entities_col, item_type=str),
-            relationship_ids=to_optional_list(row, relationships_col, item_type=str),
-            covariate_ids=to_optional_dict(
-                row, covariates_col, key_type=str, value_type=str
-            ),
-            text_embedding=to_optional_list(row, embedding_col, item_type=float),  # type: ignore
-            n_tokens=to_optional_int(row, tokens_col),
-            document_ids=to_optional_list(row, document_ids_col, item_type=str),
-            attributes=(
-                {col: row.get(col) for col in attributes_cols}
-                if attributes_cols
-                else None
-            ),
+    columns = zip(
+        column_to_str(df, id_col),
+        column_short_ids(df, short_id_col),
+        column_to_str(df, text_col),
+        column_to_optional_list(df, entities_col, item_type=str),
+        column_to_optional_list(df, relationships_col, item_type=str),
+        column_to_optional_dict(df, covariates_col, key_type=str, value_type=str),
+        column_to_optional_list(df, embedding_col, item_type=float),
+        column_to_optional_int(df, tokens_col),
+        column_to_optional_list(df, document_ids_col, item_type=str),
+        column_attributes(df, attributes_cols),
+        strict=True,
+    )
+    return [
+        TextUnit(
+            id=row_id,
+            short_id=short_id,
+            text=text,
+            entity_ids=entity_ids,
+            relationship_ids=relationship_ids,
+            covariate_ids=covariate_ids,
+            text_embedding=text_embedding,  # type: ignore
+            n_tokens=n_tokens,
+            document_ids=document_ids,
+            attributes=attributes,
         )
-        text_units.append(chunk)
-    return text_units
+        for (
+            row_id,
+            short_id,
+            text,
+            entity_ids,
+            relationship_ids,
+            covariate_ids,
+            text_embedding,
+            n_tokens,
+            document_ids,
+            attributes,
+        ) in columns
+    ]
 
 
 def read_documents(
@@ -310,27 +414,42 @@ def read_documents(
     attributes_cols: list[str] | None = None,
 ) -> list[Document]:
     """Read documents from a dataframe."""
-    docs = []
-    for idx, row in df.iterrows():
-        doc = Document(
-            id=to_str(row, id_col),
-            short_id=to_optional_str(row, short_id_col) if short_id_col else str(idx),
-            title=to_str(row, title_col),
-            type=to_str(row, type_col),
-            summary=to_optional_str(row, summary_col),
-            raw_content=to_str(row, raw_content_col),
-            summary_embedding=to_optional_list(
-                row, summary_embedding_col, item_type=float
-            ),
-            raw_content_embedding=to_optional_list(
-                row, content_embedding_col, item_type=float
-            ),
-            text_units=to_list(row, text_units_col, item_type=str),  # type: ignore
-            attributes=(
-                {col: row.get(col) for col in attributes_cols}
-                if attributes_cols
-                else None
-            ),
+    columns = zip(
+        column_to_str(df, id_col),
+        column_short_ids(df, short_id_col),
+        column_to_str(df, title_col),
+        column_to_str(df, type_col),
+        column_to_optional_str(df, summary_col),
+        column_to_str(df, raw_content_col),
+        column_to_optional_list(df, summary_embedding_col, item_type=float),
+        column_to_optional_list(df, content_embedding_col, item_type=float),
+        column_to_list(df, text_units_col, item_type=str),
+        column_attributes(df, attributes_cols),
+        strict=True,
+    )
+    return [
+        Document(
+            id=row_id,
+            short_id=short_id,
+            title=title,
+            type=row_type,
+            summary=summary,
+            raw_content=raw_content,
+            summary_embedding=summary_embedding,
+            raw_content_embedding=raw_content_embedding,
+            text_units=text_units,  # type: ignore
+            attributes=attributes,
         )
-        docs.append(doc)
-    return docs
+        for (
+            row_id,
+            short_id,
+            title,
+            row_type,
+            summary,
+            raw_content,
+            summary_embedding,
+            raw_content_embedding,
+            text_units,
+            attributes,
+        ) in columns
+    ]
@@ -243,3 +243,199 @@ def to_optional_dict(
 
     msg = f"Column {column_name} not found in data"
     raise ValueError(msg)
+
+
+def column_to_str(df: pd.DataFrame, column_name: str | None) -> list[str]:
+    """Convert and validate a whole column to strings."""
+    if column_name is None:
+        msg = "Column name is None"
+        raise ValueError(msg)
+
+    if column_name in df.columns:
+        return [str(value) for value in df[column_name].tolist()]
+    msg = f"Column {column_name} not found in data"
+    raise ValueError(msg)
+
+
+def column_to_optional_str(
+    df: pd.DataFrame, column_name: str | None
+) -> list[str | None]:
+    """Convert and validate a whole column to optional strings."""
+    if column_name is None:
+        msg = "Column name is None"
+        raise ValueError(msg)
+
+    if column_name in df.columns:
+        return [
+            None if value is None else str(value)
+            for value in df[column_name].tolist()
+        ]
+    msg = f"Column {column_name} not found in data"
+    raise ValueError(msg)
+
+
+def column_to_list(
+    df: pd.DataFrame, column_name: str | None, item_type: type | None = None
+) -> list[list]:
+    """Convert and validate a whole column to lists."""
+    if column_name is None:
+        msg = "Column name is None"
+        raise ValueError(msg)
+
+    if column_name in df.columns:
+        values = column_to_optional_list(df, column_name, item_type=item_type)
+        for value in values:
+            if value is None:
+                msg = f"value is not a list: {value} ({type(value)})"
+                raise ValueError(msg)
+        return values  # type: ignore
+
+    msg = f"Column {column_name} not found in data"
+    raise ValueError(msg)
+
+
+def column_to_optional_list(
+    df: pd.DataFrame, column_name: str | None, item_type: type | None = None
+) -> list[list | None]:
+    """Convert and validate a whole column to optional lists.
+
+    Numpy arrays (how parquet list columns are materialized) are converted with a
+    single ``tolist()`` per cell, and float arrays skip the per-item type check
+    since their dtype already guarantees it.
+    """
+    if column_name is None or column_name not in df.columns:
+        return [None] * len(df)
+
+    out: list[list | None] = []
+    for value in df[column_name].tolist():
+        if value is None:
+            out.append(None)
+            continue
+
+        trusted = False
+        if isinstance(value, np.ndarray):
+            trusted = item_type is float and value.dtype.kind == "f"
+            value = value.tolist()
+
+        if not isinstance(value, list):
+            msg = f"value is not a list: {value} ({type(value)})"
+            raise ValueError(msg)
+
+        if item_type is not None and not trusted:
+            for v in value:
+                if not isinstance(v, item_type):
+                    msg = f"list item has item that is not {item_type}: {v} ({type(v)})"
+                    raise TypeError(msg)
+        out.append(value)
+    return out
+
+
+def column_to_optional_int(
+    df: pd.DataFrame, column_name: str | None
+) -> list[int | None]:
+    """Convert and validate a whole column to optional ints."""
+    if column_name is None:
+        return [None] * len(df)
+
+    if column_name not in df.columns:
+        msg = f"Column {column_name} not found in data"
+        raise ValueError(msg)
+
+    out: list[int | None] = []
+    for value in df[column_name].tolist():
+        if value is None:
+            out.append(None)
+            continue
+        if isinstance(value, float):
+            value = int(value)
+        if not isinstance(value, int):
+            msg = f"value is not an int: {value} ({type(value)})"
+            raise ValueError(msg)
+        out.append(int(value))
+    return out
+
+
+def column_to_optional_float(
+    df: pd.DataFrame, column_name: str | None
+) -> list[float | None]:
+    """Convert and validate a whole column to optional floats."""
+    if column_name is None:
+        return [None] * len(df)
+
+    if column_name not in df.columns:
+        msg = f"Column {column_name} not found in data"
+        raise ValueError(msg)
+
+    out: list[float | None] = []
+    for value in df[column_name].tolist():
+        if value is None:
+            out.append(None)
+            continue
+        if not isinstance(value, float):
+            msg = f"value is not a float: {value} ({type(value)})"
+            raise ValueError(msg)
+        out.append(float(value))
+    return out
+
+
+def column_to_optional_dict(
+    df: pd.DataFrame,
+    column_name: str | None,
+    key_type: type | None = None,
+    value_type: type | None = None,
+) -> list[dict | None]:
+    """Convert and validate a whole column to optional dicts."""
+    if column_name is None:
+        return [None] * len(df)
+
+    if column_name not in df.columns:
+        msg = f"Column {column_name} not found in data"
+        raise ValueError(msg)
+
+    out: list[dict | None] = []
+    for value in df[column_name].tolist():
+        if value is None:
+            out.append(None)
+            continue
+        if not isinstance(value, dict):
+            msg = f"value is not a dict: {value} ({type(value)})"
+            raise TypeError(msg)
+
+        if key_type is not None:
+            for v in value:
+                if not isinstance(v, key_type):
+                    msg = f"dict key has item that is not {key_type}: {v} ({type(v)})"
+                    raise TypeError(msg)
+
+        if value_type is not None:
+            for v in value.values():
+                if not isinstance(v, value_type):
+                    msg = (
+                        f"dict value has item that is not {value_type}: {v} ({type(v)})"
+                    )
+                    raise TypeError(msg)
+        out.append(value)
+    return out
+
+
+def column_attributes(
+    df: pd.DataFrame, attributes_cols: list[str] | None
+) -> list[dict | None]:
+    """Collect the attribute columns of every row into per-row dicts."""
+    if not attributes_cols:
+        return [None] * len(df)
+
+    columns = {
+        col: df[col].tolist() if col in df.columns else [None] * len(df)
+        for col in attributes_cols
+    }
+    return [
+        {col: values[i] for col, values in columns.items()} for i in range(len(df))
+    ]
+
+
+def column_short_ids(df: pd.DataFrame, short_id_col: str | None) -> list[str | None]:
+    """Read the short id column, falling back to the dataframe index."""
+    if short_id_col:
+        return column_to_optional_str(df, short_id_col)
+    return [str(idx) for idx in df.index]
@@ -20,9 +20,9 @@ def get_candidate_communities(
     selected_community_ids = [
         entity.community_ids for entity in selected_entities if entity.community_ids
     ]
-    selected_community_ids = [
+    selected_community_ids = {
         item for sublist in selected_community_ids for item in sublist
-    ]
+    }
     selected_reports = [
         community
         for community in community_reports
@@ -3,24 +3,70 @@
 
 """Util functions to retrieve covariates from a collection."""
 
-from typing import Any, cast
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, cast, overload
 
 import pandas as pd
 
 from graphrag.model import Covariate, Entity
 
 
+class CovariateIndex(Sequence[Covariate]):
+    """A list of covariates with a hash index by subject.
+
+    The covariates of a subject are returned in list order, the same order a scan
+    over the list would return them in.
+    """
+
+    def __init__(self, covariates: Iterable[Covariate]):
+        self._covariates = list(covariates)
+        self._subject_positions: dict[str, list[int]] = {}
+        for position, covariate in enumerate(self._covariates):
+            self._subject_positions.setdefault(covariate.subject_id, []).append(
+                position
+            )
+
+    @overload
+    def __getitem__(self, index: int) -> Covariate: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Covariate]: ...
+
+    def __getitem__(self, index: int | slice) -> Covariate | list[Covariate]:
+        """Get the covariate at a position of the list."""
+        return self._covariates[index]
+
+    def __iter__(self) -> Iterator[Covariate]:
+        """Iterate over the covariates in list order."""
+        return iter(self._covariates)
+
+    def __len__(self) -> int:
+        """Get the number of covariates."""
+        return len(self._covariates)
+
+    def get_by_subjects(self, subject_ids: Iterable[str]) -> list[Covariate]:
+        """Get the covariates of any of the given subjects, in list order."""
+        positions = {
+            position
+            for subject_id in set(subject_ids)
+            for position in self._subject_positions.get(subject_id, ())
+        }
+        return [self._covariates[position] for position in sorted(positions)]
+
+
 def get_candidate_covariates(
     selected_entities: list[Entity],
-    covariates: list[Covariate],
+    covariates: Iterable[Covariate],
 ) -> list[Covariate]:
     """Get all covariates that are related to selected entities."""
-    selected_entity_names = [entity.title for entity in selected_entities]
-    return [
-        covariate
-        for covariate in covariates
-        if covariate.subject_id in selected_entity_names
-    ]
+    covariate_index = (
+        covariates
+        if isinstance(covariates, CovariateIndex)
+        else CovariateIndex(covariates)
+    )
+    return covariate_index.get_by_subjects(
+        entity.title for entity in selected_entities
+    )
 
 
 def to_covariate_dataframe(covariates: list[Covariate]) -> pd.DataFrame:
@@ -4,32 +4,95 @@
 """Util functions to get entities from a collection."""
 
 import uuid
-from collections.abc import Iterable
-from typing import Any, cast
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, cast, overload
 
 import pandas as pd
 
 from graphrag.model import Entity
 
 
+class EntityIndex(Sequence[Entity]):
+    """A list of entities with hash indexes by id, title and any other key looked up.
+
+    The indexes keep the position of the entities, so lookups return the same
+    entities, in the same order, as a scan over the list would.
+    """
+
+    def __init__(self, entities: Iterable[Entity]):
+        self._entities = list(entities)
+        self._positions: dict[str, dict[Any, int]] = {}
+        self._title_positions: dict[str, list[int]] = {}
+        for position, entity in enumerate(self._entities):
+            self._title_positions.setdefault(entity.title, []).append(position)
+        self._get_positions("id")
+        self._get_positions("title")
+
+    @overload
+    def __getitem__(self, index: int) -> Entity: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Entity]: ...
+
+    def __getitem__(self, index: int | slice) -> Entity | list[Entity]:
+        """Get the entity at a position of the list."""
+        return self._entities[index]
+
+    def __iter__(self) -> Iterator[Entity]:
+        """Iterate over the entities in list order."""
+        return iter(self._entities)
+
+    def __len__(self) -> int:
+        """Get the number of entities."""
+        return len(self._entities)
+
+    def get_by_key(self, key: str, value: str | int) -> Entity | None:
+        """Get the first entity whose key attribute equals the value."""
+        positions = self._get_positions(key)
+        values = [value]
+        if isinstance(value, str) and is_valid_uuid(value):
+            values.append(value.replace("-", ""))
+        matches = [positions[match] for match in values if match in positions]
+        return self._entities[min(matches)] if matches else None
+
+    def get_by_names(self, entity_names: Iterable[str]) -> list[Entity]:
+        """Get the entities with any of the given names, in list order."""
+        positions = {
+            position
+            for name in set(entity_names)
+            for position in self._title_positions.get(name, ())
+        }
+        return [self._entities[position] for position in sorted(positions)]
+
+    def _get_positions(self, key: str) -> dict[Any, int]:
+        positions = self._positions.get(key)
+        if positions is None:
+            positions = {}
+            for position, entity in enumerate(self._entities):
+                positions.setdefault(getattr(entity, key), position)
+            self._positions[key] = positions
+        return positions
+
+
 def get_entity_by_key(
     entities: Iterable[Entity], key: str, value: str | int
 ) -> Entity | None:
     """Get entity by key."""
+    if isinstance(entities, EntityIndex):
+        return entities.get_by_key(key, value)
+    values = [value]
+    if isinstance(value, str) and is_valid_uuid(value):
+        values.append(value.replace("-", ""))
     for entity in entities:
-        if isinstance(value, str) and is_valid_uuid(value):
-            if getattr(entity, key) == value or getattr(entity, key) == value.replace(
-                "-", ""
-            ):
-                return entity
-        else:
-            if getattr(entity, key) == value:
-                return entity
+        if getattr(entity, key) in values:
+            return entity
     return None
 
 
 def get_entity_by_name(entities: Iterable[Entity], entity_name: str) -> list[Entity]:
     """Get entities by name."""
+    if isinstance(entities, EntityIndex):
+        return entities.get_by_names([entity_name])
     return [entity for entity in entities if entity.title == entity_name]
 
 
@@ -3,23 +3,73 @@
 
 """Util functions to retrieve relationships from a collection."""
 
-from typing import Any, cast
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, cast, overload
 
 import pandas as pd
 
 from graphrag.model import Entity, Relationship
+from .entities import EntityIndex
+
+
+class RelationshipIndex(Sequence[Relationship]):
+    """A list of relationships with hash indexes by id and by adjacent entity.
+
+    The relationships of a set of entities are returned in list order, the same
+    order a scan over the list would return them in.
+    """
+
+    def __init__(self, relationships: Iterable[Relationship]):
+        self._relationships = list(relationships)
+        self.by_id = {
+            relationship.id: relationship for relationship in self._relationships
+        }
+        self._adjacent_positions: dict[str, list[int]] = {}
+        for position, relationship in enumerate(self._relationships):
+            for name in {relationship.source, relationship.target}:
+                self._adjacent_positions.setdefault(name, []).append(position)
+
+    @overload
+    def __getitem__(self, index: int) -> Relationship: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Relationship]: ...
+
+    def __getitem__(self, index: int | slice) -> Relationship | list[Relationship]:
+        """Get the relationship at a position of the list."""
+        return self._relationships[index]
+
+    def __iter__(self) -> Iterator[Relationship]:
+        """Iterate over the relationships in list order."""
+        return iter(self._relationships)
+
+    def __len__(self) -> int:
+        """Get the number of relationships."""
+        return len(self._relationships)
+
+    def get_adjacent(self, entity_names: Iterable[str]) -> list[Relationship]:
+        """Get the relationships whose source or target is one of the given entities."""
+        positions = {
+            position
+            for name in set(entity_names)
+            for position in self._adjacent_positions.get(name, ())
+        }
+        return [self._relationships[position] for position in sorted(positions)]
 
 
 def get_in_network_relationships(
     selected_entities: list[Entity],
-    relationships: list[Relationship],
+    relationships: Iterable[Relationship],
     ranking_attribute: str = "rank",
 ) -> list[Relationship]:
     """Get all directed relationships between selected entities, sorted by ranking_attribute."""
-    selected_entity_names = [entity.title for entity in selected_entities]
+    selected_entity_names = {entity.title for entity in selected_entities}
+    adjacent_relationships = _as_index(relationships).get_adjacent(
+        selected_entity_names
+    )
     selected_relationships = [
         relationship
-        for relationship in relationships
+        for relationship in adjacent_relationships
         if relationship.source in selected_entity_names
         and relationship.target in selected_entity_names
     ]
@@ -34,20 +84,23 @@ def get_in_network_relationships(
 
 def get_out_network_relationships(
     selected_entities: list[Entity],
-    relationships: list[Relationship],
+    relationships: Iterable[Relationship],
     ranking_attribute: str = "rank",
 ) -> list[Relationship]:
     """Get relationships from selected entities to other entities that are not within the selected entities, sorted by ranking_attribute."""
-    selected_entity_names = [entity.title for entity in selected_entities]
+    selected_entity_names = {entity.title for entity in selected_entities}
+    adjacent_relationships = _as_index(relationships).get_adjacent(
+        selected_entity_names
+    )
     source_relationships = [
         relationship
-        for relationship in relationships
+        for relationship in adjacent_relationships
         if relationship.source in selected_entity_names
         and relationship.target not in selected_entity_names
     ]
     target_relationships = [
         relationship
-        for relationship in relationships
+        for relationship in adjacent_relationships
         if relationship.target in selected_entity_names
         and relationship.source not in selected_entity_names
     ]
@@ -59,25 +112,23 @@ def get_out_network_relationships(
 
 def get_candidate_relationships(
     selected_entities: list[Entity],
-    relationships: list[Relationship],
+    relationships: Iterable[Relationship],
 ) -> list[Relationship]:
     """Get all relationships that are associated with the selected entities."""
-    selected_entity_names = [entity.title for entity in selected_entities]
-    return [
-        relationship
-        for relationship in relationships
-        if relationship.source in selected_entity_names
-        or relationship.target in selected_entity_names
-    ]
+    return _as_index(relationships).get_adjacent(
+        entity.title for entity in selected_entities
+    )
 
 
 def get_entities_from_relationships(
-    relationships: list[Relationship], entities: list[Entity]
+    relationships: list[Relationship], entities: Iterable[Entity]
 ) -> list[Entity]:
     """Get all entities that are associated with the selected relationships."""
-    selected_entity_names = [relationship.source for relationship in relationships] + [
+    selected_entity_names = {relationship.source for relationship in relationships} | {
         relationship.target for relationship in relationships
-    ]
+    }
+    if isinstance(entities, EntityIndex):
+        return entities.get_by_names(selected_entity_names)
     return [entity for entity in entities if entity.title in selected_entity_names]
 
 
@@ -171,3 +222,10 @@ def to_relationship_dataframe(
             new_record.append(field_value)
         records.append(new_record)
     return pd.DataFrame(records, columns=cast(Any, header))
+
+
+def _as_index(relationships: Iterable[Relationship]) -> RelationshipIndex:
+    """Use the given relationship index, or index a plain list of relationships."""
+    if isinstance(relationships, RelationshipIndex):
+        return relationships
+    return RelationshipIndex(relationships)
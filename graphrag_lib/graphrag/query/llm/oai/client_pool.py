@@ -0,0 +1,119 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Shared OpenAI clients backed by keep-alive connection pools."""
+
+import httpx
+from openai import AsyncAzureOpenAI, AsyncOpenAI, AzureOpenAI, OpenAI
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+
+
+class OpenAIClientPool:
+    """Hand out OpenAI SDK clients that share one sync and one async HTTP pool.
+
+    LLM and embedding wrappers created per request otherwise each open their own
+    httpx clients, paying connection setup and TLS handshakes every time. Wrappers
+    with the same endpoint and credentials also share the SDK client objects.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+    ):
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._http_client = httpx.Client(limits=limits)
+        self._async_http_client = httpx.AsyncClient(limits=limits)
+        self._clients: dict[tuple, tuple[OpenAI | AzureOpenAI, AsyncOpenAI | AsyncAzureOpenAI]] = {}
+
+    def attach(self, llm):
+        """Replace the clients of an OpenAI LLM/embedding wrapper with pooled ones."""
+        sync_client, async_client = self.clients_for(llm)
+        llm.set_clients(sync_client=sync_client, async_client=async_client)
+        return llm
+
+    def clients_for(
+        self, llm
+    ) -> tuple[OpenAI | AzureOpenAI, AsyncOpenAI | AsyncAzureOpenAI]:
+        """Return the pooled (sync, async) clients for the wrapper's endpoint settings."""
+        key = (
+            str(llm.api_type),
+            llm.api_key,
+            id(llm.azure_ad_token_provider),
+            llm.api_base,
+            llm.api_version,
+            llm.deployment_name,
+            llm.organization,
+            llm.request_timeout,
+            llm.max_retries,
+        )
+        clients = self._clients.get(key)
+        if clients is None:
+            clients = self._create_clients(llm)
+            self._clients[key] = clients
+        return clients
+
+    def _create_clients(
+        self, llm
+    ) -> tuple[OpenAI | AzureOpenAI, AsyncOpenAI | AsyncAzureOpenAI]:
+        if llm.api_type == "azure":
+            if llm.api_base is None:
+                msg = "api_base is required for Azure OpenAI"
+                raise ValueError(msg)
+            azure_args = {
+                "api_key": llm.api_key,
+                "azure_ad_token_provider": llm.azure_ad_token_provider,
+                "organization": llm.organization,
+                "api_version": llm.api_version,
+                "azure_endpoint": llm.api_base,
+                "azure_deployment": llm.deployment_name,
+                "timeout": llm.request_timeout,
+                "max_retries": llm.max_retries,
+            }
+            return (
+                AzureOpenAI(**azure_args, http_client=self._http_client),
+                AsyncAzureOpenAI(**azure_args, http_client=self._async_http_client),
+            )
+
+        openai_args = {
+            "api_key": llm.api_key,
+            "base_url": llm.api_base,
+            "organization": llm.organization,
+            "timeout": llm.request_timeout,
+            "max_retries": llm.max_retries,
+        }
+        return (
+            OpenAI(**openai_args, http_client=self._http_client),
+            AsyncOpenAI(**openai_args, http_client=self._async_http_client),
+        )
+
+    def close(self) -> None:
+        """Close the sync pool."""
+        self._http_client.close()
+
+    async def aclose(self) -> None:
+        """Close both pools."""
+        self._http_client.close()
+        await self._async_http_client.aclose()
+
+
+_client_pool: OpenAIClientPool | None = None
+
+
+def set_client_pool(pool: OpenAIClientPool | None) -> None:
+    """Install the process-wide client pool used by the query factories."""
+    global _client_pool  # noqa: PLW0603
+    _client_pool = pool
+
+
+def get_client_pool() -> OpenAIClientPool | None:
+    """Return the process-wide client pool, if one was installed."""
+    return _client_pool
@@ -20,6 +20,7 @@ from tenacity import (
 
 from graphrag.query.llm.base import BaseTextEmbedding
 from graphrag.query.llm.oai.base import OpenAILLMImpl
+from .embedding_cache import QueryEmbeddingCache
 from graphrag.query.llm.oai.typing import (
     OPENAI_RETRY_ERROR_TYPES,
     OpenaiApiType,
@@ -47,6 +48,7 @@ class OpenAIEmbedding(BaseTextEmbedding, OpenAILLMImpl):
         request_timeout: float = 180.0,
         retry_error_types: tuple[type[BaseException]] = OPENAI_RETRY_ERROR_TYPES,  # type: ignore
         reporter: StatusReporter | None = None,
+        cache: QueryEmbeddingCache | None = None,
     ):
         OpenAILLMImpl.__init__(
             self=self,
@@ -67,6 +69,7 @@ class OpenAIEmbedding(BaseTextEmbedding, OpenAILLMImpl):
         self.max_tokens = max_tokens
         self.token_encoder = tiktoken.get_encoding(self.encoding_name)
         self.retry_error_types = retry_error_types
+        self.cache = cache
 
     def embed(self, text: str, **kwargs: Any) -> list[float]:
         """
@@ -75,6 +78,23 @@ class OpenAIEmbedding(BaseTextEmbedding, OpenAILLMImpl):
         For text longer than max_tokens, chunk texts into max_tokens, embed each chunk, then combine using weighted average.
         Please refer to: https://github.com/openai/openai-cookbook/blob/main/examples/Embedding_long_inputs.ipynb
         """
+        # request options such as dimensions change the embedding, those calls are not cached
+        if self.cache is None or kwargs:
+            return self._embed(text, **kwargs)
+        return self.cache.embed(self.model, text, self._embed)
+
+    async def aembed(self, text: str, **kwargs: Any) -> list[float]:
+        """
+        Embed text using OpenAI Embedding's async function.
+
+        For text longer than max_tokens, chunk texts into max_tokens, embed each chunk, then combine using weighted average.
+        Concurrent calls for the same text share one embedding call when a cache is set.
+        """
+        if self.cache is None or kwargs:
+            return await self._aembed(text, **kwargs)
+        return await self.cache.aembed(self.model, text, self._aembed)
+
+    def _embed(self, text: str, **kwargs: Any) -> list[float]:
         token_chunks = chunk_text(
             text=text, token_encoder=self.token_encoder, max_tokens=self.max_tokens
         )
@@ -97,12 +117,7 @@ class OpenAIEmbedding(BaseTextEmbedding, OpenAILLMImpl):
         chunk_embeddings = chunk_embeddings / np.linalg.norm(chunk_embeddings)
         return chunk_embeddings.tolist()
 
-    async def aembed(self, text: str, **kwargs: Any) -> list[float]:
-        """
-        Embed text using OpenAI Embedding's async function.
-
-        For text longer than max_tokens, chunk texts into max_tokens, embed each chunk, then combine using weighted average.
-        """
+    async def _aembed(self, text: str, **kwargs: Any) -> list[float]:
         token_chunks = chunk_text(
             text=text, token_encoder=self.token_encoder, max_tokens=self.max_tokens
         )
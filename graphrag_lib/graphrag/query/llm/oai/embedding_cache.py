@@ -0,0 +1,149 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A cache of query embeddings shared by the embedding wrappers of a process."""
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+import numpy as np
+
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+def normalize_query(text: str) -> str:
+    """Normalize a query text so that trivially different spellings share an embedding."""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+class QueryEmbeddingCache:
+    """Cache embeddings by model and normalized text.
+
+    Recently used embeddings are kept in an in-memory LRU of `max_entries` entries.
+    With a `path`, embeddings are also written to a SQLite file, so they survive
+    restarts and are shared by the worker processes of a server. Concurrent async
+    requests for the same text wait for a single embedding call.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, path: str | Path | None = None):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._in_flight: dict[str, asyncio.Future] = {}
+        self._conn = None
+        if path is not None:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+
+    def embed(self, model: str, text: str, embed: Callable[[str], list[float]]) -> list[float]:
+        """Return the cached embedding of the text, embedding it on a miss.
+
+        `embed` is called with the normalized text.
+        """
+        text = normalize_query(text)
+        key = _cache_key(model, text)
+        embedding = self.get(key)
+        if embedding is None:
+            embedding = embed(text)
+            self.set(key, embedding)
+        return list(embedding)
+
+    async def aembed(
+        self, model: str, text: str, aembed: Callable[[str], Awaitable[list[float]]]
+    ) -> list[float]:
+        """Return the cached embedding of the text, embedding it once for concurrent misses.
+
+        `aembed` is called with the normalized text.
+        """
+        text = normalize_query(text)
+        key = _cache_key(model, text)
+        embedding = self.get(key)
+        if embedding is not None:
+            return list(embedding)
+
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(aembed(text))
+            self._in_flight[key] = future
+
+            def done(future: asyncio.Future) -> None:
+                self._in_flight.pop(key, None)
+                if not future.cancelled() and future.exception() is None:
+                    self.set(key, future.result())
+
+            future.add_done_callback(done)
+        # a cancelled request does not cancel the call the other requests wait for
+        return list(await asyncio.shield(future))
+
+    def get(self, key: str) -> list[float] | None:
+        """Get an embedding by cache key, from memory or else from the disk tier."""
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is not None:
+                self._entries.move_to_end(key)
+                return embedding
+            if self._conn is None:
+                return None
+            row = self._conn.execute(
+                "SELECT vector FROM embeddings WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            embedding = np.frombuffer(row[0], dtype=np.float64).tolist()
+            self._remember(key, embedding)
+            return embedding
+
+    def set(self, key: str, embedding: list[float]) -> None:
+        """Store an embedding, empty embeddings of failed calls are not cached."""
+        if not embedding:
+            return
+        embedding = list(embedding)
+        with self._lock:
+            self._remember(key, embedding)
+            if self._conn is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO embeddings(key, vector) VALUES (?, ?)",
+                    (key, np.asarray(embedding, dtype=np.float64).tobytes()),
+                )
+
+    def close(self) -> None:
+        """Close the disk tier."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _remember(self, key: str, embedding: list[float]) -> None:
+        self._entries[key] = embedding
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+def _cache_key(model: str, text: str) -> str:
+    return hashlib.sha256(f"{model}\x1f{text}".encode()).hexdigest()
+
+
+_query_embedding_cache: QueryEmbeddingCache | None = QueryEmbeddingCache()
+
+
+def set_query_embedding_cache(cache: QueryEmbeddingCache | None) -> None:
+    """Install the process-wide query embedding cache used by the query factories."""
+    global _query_embedding_cache  # noqa: PLW0603
+    _query_embedding_cache = cache
+
+
+def get_query_embedding_cache() -> QueryEmbeddingCache | None:
+    """Return the process-wide query embedding cache, if caching is enabled."""
+    return _query_embedding_cache
@@ -4,7 +4,9 @@
 """Text Utilities for LLM."""
 
 from collections.abc import Iterator
+from functools import lru_cache
 from itertools import islice
+from typing import Any
 
 import tiktoken
 
@@ -16,6 +18,75 @@ def num_tokens(text: str, token_encoder: tiktoken.Encoding | None = None) -> int
     return len(token_encoder.encode(text))  # type: ignore
 
 
+class TokenCounter:
+    """Count the tokens of context table rows and other texts.
+
+    Entity descriptions, relationships, covariates, report texts and text units do not
+    change until their index is reloaded. `count_row` stores the token count of the
+    static columns of a row on the model object the row is built from, so it is
+    encoded once, normally when the index is loaded (see
+    `factories.get_local_search_token_counter`), and queries only encode the columns
+    that depend on the query, like the "links" of relationships. Other texts, such as
+    table headers and those per-query columns, are remembered among the
+    `max_entries` most recently counted texts.
+    """
+
+    def __init__(
+        self,
+        token_encoder: tiktoken.Encoding | None = None,
+        max_entries: int = 10_000,
+    ):
+        if token_encoder is None:
+            token_encoder = tiktoken.get_encoding("cl100k_base")
+        self.token_encoder = token_encoder
+        self.max_entries = max_entries
+
+        @lru_cache(maxsize=max_entries)
+        def count(text: str) -> int:
+            return len(token_encoder.encode(text))  # type: ignore
+
+        self._count = count
+
+    def __call__(self, text: str) -> int:
+        """Return the number of tokens in the given text."""
+        return self._count(text)
+
+    def count_row(
+        self,
+        item: Any,
+        row: list[str],
+        column_delimiter: str,
+        dynamic_columns: int = 0,
+    ) -> int:
+        """Return the number of tokens of the context table row of a model object.
+
+        The row text is the columns joined by `column_delimiter`, followed by a newline.
+        The last `dynamic_columns` columns change per query and are counted on every
+        call; the count of the others is kept on the `context_tokens` field of `item`.
+        """
+        row_text = column_delimiter.join(row) + "\n"
+        static_text = column_delimiter.join(row[: len(row) - dynamic_columns])
+        # the text after a letter or digit starts a new piece for the tokenizer, so
+        # the counts of both parts add up to the count of the row
+        if static_text[-1:].isalnum():
+            return self._count_static(item, static_text) + self(
+                row_text[len(static_text) :]
+            )
+        if dynamic_columns == 0:
+            return self._count_static(item, row_text)
+        return self(row_text)
+
+    def _count_static(self, item: Any, text: str) -> int:
+        key = hash(text)
+        # the model classes of an installed graphrag package have no such field
+        stored = getattr(item, "context_tokens", None)
+        if stored is not None and stored[0] == key:
+            return stored[1]
+        tokens = len(self.token_encoder.encode(text))  # type: ignore
+        item.context_tokens = (key, tokens)
+        return tokens
+
+
 def batched(iterable: Iterator, n: int):
     """
     Batch data into tuples of length n. The last batch may be shorter.
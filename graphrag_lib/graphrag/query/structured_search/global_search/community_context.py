@@ -9,12 +9,13 @@ import pandas as pd
 import tiktoken
 
 from graphrag.model import CommunityReport, Entity
-from graphrag.query.context_builder.community_context import (
+from ...context_builder.community_context import (
     build_community_context,
 )
 from graphrag.query.context_builder.conversation_history import (
     ConversationHistory,
 )
+from ...llm.text_utils import TokenCounter
 from graphrag.query.structured_search.base import GlobalContextBuilder
 
 
@@ -27,10 +28,13 @@ class GlobalCommunityContext(GlobalContextBuilder):
         entities: list[Entity] | None = None,
         token_encoder: tiktoken.Encoding | None = None,
         random_state: int = 86,
+        token_counter: TokenCounter | None = None,
     ):
         self.community_reports = community_reports
         self.entities = entities
         self.token_encoder = token_encoder
+        # the same report rows are counted query after query
+        self.token_counter = token_counter or TokenCounter(token_encoder)
         self.random_state = random_state
 
     def build_context(
@@ -86,6 +90,7 @@ class GlobalCommunityContext(GlobalContextBuilder):
             single_batch=False,
             context_name=context_name,
             random_state=self.random_state,
+            token_counter=self.token_counter,
         )
         if isinstance(community_context, list):
             final_context = [
@@ -16,33 +16,34 @@ from graphrag.model import (
     Relationship,
     TextUnit,
 )
-from graphrag.query.context_builder.community_context import (
+from ...context_builder.community_context import (
     build_community_context,
 )
 from graphrag.query.context_builder.conversation_history import (
     ConversationHistory,
 )
-from graphrag.query.context_builder.entity_extraction import (
+from ...context_builder.entity_extraction import (
     EntityVectorStoreKey,
     map_query_to_entities,
 )
-from graphrag.query.context_builder.local_context import (
-    build_covariates_context,
-    build_entity_context,
-    build_relationship_context,
+from ...context_builder.local_context import (
+    LocalContextAssembler,
     get_candidate_context,
 )
-from graphrag.query.context_builder.source_context import (
+from ...context_builder.source_context import (
     build_text_unit_context,
     count_relationships,
 )
-from graphrag.query.input.retrieval.community_reports import (
+from ...input.retrieval.community_reports import (
     get_candidate_communities,
 )
-from graphrag.query.input.retrieval.text_units import get_candidate_text_units
+from ...input.retrieval.covariates import CovariateIndex
+from ...input.retrieval.entities import EntityIndex
+from ...input.retrieval.relationships import RelationshipIndex
+from ...input.retrieval.text_units import get_candidate_text_units
 from graphrag.query.llm.base import BaseTextEmbedding
-from graphrag.query.llm.text_utils import num_tokens
-from graphrag.query.structured_search.base import LocalContextBuilder
+from ...llm.text_utils import TokenCounter, num_tokens
+from ...context_builder.builders import LocalContextBuilder
 from graphrag.vector_stores import BaseVectorStore
 
 log = logging.getLogger(__name__)
@@ -62,6 +63,7 @@ class LocalSearchMixedContext(LocalContextBuilder):
         covariates: dict[str, list[Covariate]] | None = None,
         token_encoder: tiktoken.Encoding | None = None,
         embedding_vectorstore_key: str = EntityVectorStoreKey.ID,
+        token_counter: TokenCounter | None = None,
     ):
         if community_reports is None:
             community_reports = []
@@ -80,9 +82,18 @@ class LocalSearchMixedContext(LocalContextBuilder):
             relationship.id: relationship for relationship in relationships
         }
         self.covariates = covariates
+        # hash indexes, so that the context of a query is built from the selected
+        # entities and their neighborhood instead of scans over the whole graph
+        self.entity_index = EntityIndex(self.entities.values())
+        self.relationship_index = RelationshipIndex(self.relationships.values())
+        self.covariate_indexes = {
+            name: CovariateIndex(values) for name, values in covariates.items()
+        }
         self.entity_text_embeddings = entity_text_embeddings
         self.text_embedder = text_embedder
         self.token_encoder = token_encoder
+        # the table rows of the index are counted once, and reused by every query
+        self.token_counter = token_counter or TokenCounter(token_encoder)
         self.embedding_vectorstore_key = embedding_vectorstore_key
 
     def filter_by_entity_keys(self, entity_keys: list[int] | list[str]):
@@ -112,12 +123,14 @@ class LocalSearchMixedContext(LocalContextBuilder):
         min_community_rank: int = 0,
         community_context_name: str = "Reports",
         column_delimiter: str = "|",
+        query_embedding: list[float] | None = None,
         **kwargs: dict[str, Any],
     ) -> tuple[str | list[str], dict[str, pd.DataFrame]]:
         """
         Build data context for local search prompt.
 
         Build a context by combining community reports and entity/relationship/covariate tables, and text units using a predefined ratio set by summary_prop.
+        The query is embedded with the text embedder unless its `query_embedding` is given.
         """
         
         if include_entity_names is None:
@@ -131,24 +144,20 @@ class LocalSearchMixedContext(LocalContextBuilder):
             raise ValueError(value_error)
 
         # map user query to entities
-        # if there is conversation history, attached the previous user questions to the current query
-        conversation_history
-        if conversation_history:
-            pre_user_questions = "\n".join(
-                conversation_history.get_user_turns(conversation_history_max_turns)
-            )
-            query = f"{query}\n{pre_user_questions}"
-
+        query = self._entity_query(
+            query, conversation_history, conversation_history_max_turns
+        )
         selected_entities = map_query_to_entities(
             query=query,
             text_embedding_vectorstore=self.entity_text_embeddings,
             text_embedder=self.text_embedder,
-            all_entities=list(self.entities.values()),
+            all_entities=self.entity_index,
             embedding_vectorstore_key=self.embedding_vectorstore_key,
             include_entity_names=include_entity_names,
             exclude_entity_names=exclude_entity_names,
             k=top_k_mapped_entities,
             oversample_scaler=2,
+            query_embedding=query_embedding,
         )
 
         # build context
@@ -221,6 +230,42 @@ class LocalSearchMixedContext(LocalContextBuilder):
 
         return ("\n\n".join(final_context), final_context_data)
 
+    async def abuild_context(
+        self,
+        query: str,
+        conversation_history: ConversationHistory | None = None,
+        conversation_history_max_turns: int | None = 5,
+        **kwargs: Any,
+    ) -> tuple[str | list[str], dict[str, pd.DataFrame]]:
+        """Build data context for local search prompt, embedding the query without blocking the event loop."""
+        entity_query = self._entity_query(
+            query, conversation_history, conversation_history_max_turns
+        )
+        query_embedding = (
+            await self.text_embedder.aembed(entity_query) if entity_query != "" else None
+        )
+        return self.build_context(
+            query=query,
+            conversation_history=conversation_history,
+            conversation_history_max_turns=conversation_history_max_turns,
+            query_embedding=query_embedding,
+            **kwargs,
+        )
+
+    @staticmethod
+    def _entity_query(
+        query: str,
+        conversation_history: ConversationHistory | None,
+        conversation_history_max_turns: int | None,
+    ) -> str:
+        """Get the text mapped to entities, the query followed by the previous user questions."""
+        if conversation_history:
+            pre_user_questions = "\n".join(
+                conversation_history.get_user_turns(conversation_history_max_turns)
+            )
+            return f"{query}\n{pre_user_questions}"
+        return query
+
     def _build_community_context(
         self,
         selected_entities: list[Entity],
@@ -273,6 +318,7 @@ class LocalSearchMixedContext(LocalContextBuilder):
             max_tokens=max_tokens,
             single_batch=True,
             context_name=context_name,
+            token_counter=self.token_counter,
         )
         if isinstance(context_text, list) and len(context_text) > 0:
             context_text = "\n\n".join(context_text)
@@ -324,7 +370,7 @@ class LocalSearchMixedContext(LocalContextBuilder):
                     text_unit_ids_set.add(text_id)
                     selected_unit = deepcopy(self.text_units[text_id])
                     num_relationships = count_relationships(
-                        selected_unit, entity, self.relationships
+                        selected_unit, entity, self.relationship_index
                     )
                     if selected_unit.attributes is None:
                         selected_unit.attributes = {}
@@ -350,6 +396,7 @@ class LocalSearchMixedContext(LocalContextBuilder):
             shuffle_data=False,
             context_name=context_name,
             column_delimiter=column_delimiter,
+            token_counter=self.token_counter,
         )
 
         if return_candidate_context:
@@ -388,70 +435,35 @@ class LocalSearchMixedContext(LocalContextBuilder):
         column_delimiter: str = "|",
     ) -> tuple[str, dict[str, pd.DataFrame]]:
         """Build data context for local search prompt combining entity/relationship/covariate tables."""
-        # build entity context
-        entity_context, entity_context_data = build_entity_context(
-            selected_entities=selected_entities,
+        assembler = LocalContextAssembler(
+            relationships=self.relationship_index,
+            covariates=self.covariate_indexes,
             token_encoder=self.token_encoder,
+            include_relationship_weight=include_relationship_weight,
             max_tokens=max_tokens,
+            top_k_relationships=top_k_relationships,
+            relationship_ranking_attribute=relationship_ranking_attribute,
             column_delimiter=column_delimiter,
-            include_entity_rank=include_entity_rank,
-            rank_description=rank_description,
-            context_name="Entities",
+            context_name="Relationships",
+            token_counter=self.token_counter,
         )
-        entity_tokens = num_tokens(entity_context, self.token_encoder)
 
-        # build relationship-covariate context
-        added_entities = []
-        final_context = []
-        final_context_data = {}
+        # build entity context
+        entity_context, entity_context_data, entity_tokens = (
+            assembler.fit_entity_context(
+                selected_entities=selected_entities,
+                include_entity_rank=include_entity_rank,
+                rank_description=rank_description,
+                context_name="Entities",
+            )
+        )
 
         # gradually add entities and associated metadata to the context until we reach limit
         for entity in selected_entities:
-            current_context = []
-            current_context_data = {}
-            added_entities.append(entity)
-
-            # build relationship context
-            (
-                relationship_context,
-                relationship_context_data,
-            ) = build_relationship_context(
-                selected_entities=added_entities,
-                relationships=list(self.relationships.values()),
-                token_encoder=self.token_encoder,
-                max_tokens=max_tokens,
-                column_delimiter=column_delimiter,
-                top_k_relationships=top_k_relationships,
-                include_relationship_weight=include_relationship_weight,
-                relationship_ranking_attribute=relationship_ranking_attribute,
-                context_name="Relationships",
-            )
-            current_context.append(relationship_context)
-            current_context_data["relationships"] = relationship_context_data
-            total_tokens = entity_tokens + num_tokens(
-                relationship_context, self.token_encoder
-            )
-
-            # build covariate context
-            for covariate in self.covariates:
-                covariate_context, covariate_context_data = build_covariates_context(
-                    selected_entities=added_entities,
-                    covariates=self.covariates[covariate],
-                    token_encoder=self.token_encoder,
-                    max_tokens=max_tokens,
-                    column_delimiter=column_delimiter,
-                    context_name=covariate,
-                )
-                total_tokens += num_tokens(covariate_context, self.token_encoder)
-                current_context.append(covariate_context)
-                current_context_data[covariate.lower()] = covariate_context_data
-
-            if total_tokens > max_tokens:
+            if not assembler.add(entity, max_tokens=max_tokens - entity_tokens):
                 log.info("Reached token limit - reverting to previous context state")
                 break
-
-            final_context = current_context
-            final_context_data = current_context_data
+        final_context, final_context_data = assembler.build()
 
         # attach entity context to final context
         final_context_text = entity_context + "\n\n" + "\n\n".join(final_context)
@@ -462,9 +474,9 @@ class LocalSearchMixedContext(LocalContextBuilder):
             # and add a tag to indicate which records were included in the context window
             candidate_context_data = get_candidate_context(
                 selected_entities=selected_entities,
-                entities=list(self.entities.values()),
-                relationships=list(self.relationships.values()),
-                covariates=self.covariates,
+                entities=self.entity_index,
+                relationships=self.relationship_index,
+                covariates=self.covariate_indexes,
                 include_entity_rank=include_entity_rank,
                 entity_rank_description=rank_description,
                 include_relationship_weight=include_relationship_weight,
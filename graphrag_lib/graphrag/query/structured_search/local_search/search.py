@@ -77,7 +77,7 @@ class LocalSearch(BaseSearch):
         start_time = time.time()
         search_prompt = ""
 
-        context_text, context_records = self.context_builder.build_context(
+        context_text, context_records = await self.context_builder.abuild_context(
             query=query,
             conversation_history=conversation_history,
             **kwargs,
@@ -131,7 +131,7 @@ class LocalSearch(BaseSearch):
         """Build local search context that fits a single context window and generate answer for the user query."""
         start_time = time.time()
         
-        context_text, context_records = self.context_builder.build_context(
+        context_text, context_records = await self.context_builder.abuild_context(
             query=query,
             conversation_history=conversation_history,
             **self.context_builder_params,
@@ -51,7 +51,7 @@ async def _load_table_from_storage(name: str, storage: PipelineStorage) -> pd.Da
     # except Exception:
     #     log.exception("error loading table from storage: %s", name)
     #     raise
-    if not storage.has(name):
+    if not await storage.has(name):
         msg = f"Could not find {name} in storage!"
         raise ValueError(msg)
     try:
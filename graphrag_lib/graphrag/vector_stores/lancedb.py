@@ -21,6 +21,10 @@ from .base import (
 class LanceDBVectorStore(BaseVectorStore):
     """The LanceDB vector storage implementation."""
 
+    # whether this store has (re)created its collection; documents appended after
+    # that are new, otherwise an append replaces the documents with the same ids
+    _overwritten: bool = False
+
     def connect(self, **kwargs: Any) -> Any:
         """Connect to the vector storage."""
         db_uri = kwargs.get("db_uri", "./lancedb")
@@ -51,6 +55,7 @@ class LanceDBVectorStore(BaseVectorStore):
             pa.field("attributes", pa.string()),
         ])
         if overwrite:
+            self._overwritten = True
             if data:
                 self.document_collection = self.db_connection.create_table(
                     self.collection_name, data=data, mode="overwrite"
@@ -65,6 +70,11 @@ class LanceDBVectorStore(BaseVectorStore):
                 self.collection_name
             )
             if data:
+                if not self._overwritten:
+                    ids = ", ".join(
+                        "'{}'".format(str(row["id"]).replace("'", "''")) for row in data
+                    )
+                    self.document_collection.delete(f"id in ({ids})")
                 self.document_collection.add(data)
 
     def filter_by_id(self, include_ids: list[str] | list[int]) -> Any:
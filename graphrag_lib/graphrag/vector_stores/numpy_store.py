@@ -0,0 +1,216 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""The in-process NumPy vector storage implementation package."""
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from graphrag.model.types import TextEmbedder
+
+from .base import (
+    BaseVectorStore,
+    VectorStoreDocument,
+    VectorStoreSearchResult,
+)
+
+VECTORS_FILE = "vectors.f32"
+DOCUMENTS_FILE = "documents.jsonl"
+META_FILE = "meta.json"
+
+
+class NumpyVectorStore(BaseVectorStore):
+    """The in-process NumPy vector storage implementation.
+
+    The vectors of a collection are stored L2-normalized as a raw float32 matrix in
+    `<db_uri>/<collection_name>.numpy/` and memory-mapped, so that a search is a single
+    matrix-vector product and the pages are shared between processes serving the same
+    index. Ids, texts and attributes are kept in memory. Appended documents replace
+    earlier documents with the same id.
+    """
+
+    def connect(self, **kwargs: Any) -> Any:
+        """Connect to the vector storage, opening the collection if it exists."""
+        db_uri = kwargs.get("db_uri", "./lancedb")
+        self.db_connection = Path(db_uri) / f"{self.collection_name}.numpy"
+        self._open()
+
+    @property
+    def fingerprint_path(self) -> Path:
+        """The file recording which entities the collection was built from."""
+        return self.db_connection / "fingerprint"
+
+    def load_documents(
+        self, documents: list[VectorStoreDocument], overwrite: bool = True
+    ) -> None:
+        """Load documents into vector storage."""
+        documents = [document for document in documents if document.vector is not None]
+        vectors = _normalize(
+            np.asarray([document.vector for document in documents], dtype=np.float32)
+        )
+        dimension = vectors.shape[1] if documents else None
+        records = "".join(
+            json.dumps({
+                "id": document.id,
+                "text": document.text,
+                "attributes": document.attributes,
+            })
+            + "\n"
+            for document in documents
+        )
+
+        self.db_connection.mkdir(parents=True, exist_ok=True)
+        if overwrite or not (self.db_connection / META_FILE).exists():
+            # replace the files, processes that mapped the old ones keep reading them
+            self._replace(VECTORS_FILE, vectors.tobytes())
+            self._replace(DOCUMENTS_FILE, records.encode())
+            self._replace(META_FILE, json.dumps({"dimension": dimension}).encode())
+            self._open()
+            return
+
+        if dimension is None:
+            return
+        if self._dimension is None:
+            self._replace(META_FILE, json.dumps({"dimension": dimension}).encode())
+        elif self._dimension != dimension:
+            msg = f"Vectors of size {dimension} cannot be added to collection {self.collection_name} of size {self._dimension}"
+            raise ValueError(msg)
+        with (self.db_connection / VECTORS_FILE).open("ab") as file:
+            file.write(vectors.tobytes())
+        with (self.db_connection / DOCUMENTS_FILE).open("a", encoding="utf-8") as file:
+            file.write(records)
+        self._dimension = dimension
+        self._add(documents)
+
+    def filter_by_id(self, include_ids: list[str] | list[int]) -> Any:
+        """Build a query filter to filter documents by id."""
+        if len(include_ids) == 0:
+            self.query_filter = None
+        else:
+            self.query_filter = np.zeros(len(self._ids), dtype=bool)
+            rows = [self._positions[id] for id in include_ids if id in self._positions]
+            self.query_filter[rows] = True
+        return self.query_filter
+
+    def similarity_search_by_vector(
+        self, query_embedding: list[float], k: int = 10, **kwargs: Any
+    ) -> list[VectorStoreSearchResult]:
+        """Perform a vector-based similarity search."""
+        if self.document_collection is None or k <= 0:
+            return []
+        query = _normalize(np.asarray(query_embedding, dtype=np.float32)[np.newaxis])[0]
+
+        mask = self._live if self.query_filter is None else self.query_filter
+        if mask is None:
+            candidates = None
+            scores = self.document_collection @ query
+        else:
+            candidates = np.flatnonzero(mask)
+            # gathering the rows copies them, only worth it for small selections
+            if len(candidates) * 4 < len(mask):
+                scores = self.document_collection[candidates] @ query
+            else:
+                scores = (self.document_collection @ query)[candidates]
+        k = min(k, len(scores))
+        if k == 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        rows = top if candidates is None else candidates[top]
+
+        return [
+            VectorStoreSearchResult(
+                document=VectorStoreDocument(
+                    id=self._ids[row],
+                    text=self._texts[row],
+                    vector=self.document_collection[row].tolist(),
+                    attributes=dict(self._attributes[row]),
+                ),
+                score=float(score),
+            )
+            for row, score in zip(rows.tolist(), scores[top].tolist(), strict=True)
+        ]
+
+    def similarity_search_by_text(
+        self, text: str, text_embedder: TextEmbedder, k: int = 10, **kwargs: Any
+    ) -> list[VectorStoreSearchResult]:
+        """Perform a similarity search using a given input text."""
+        query_embedding = text_embedder(text)
+        if query_embedding:
+            return self.similarity_search_by_vector(query_embedding, k)
+        return []
+
+    def _open(self) -> None:
+        """Read the documents and map the vectors of the collection, if it exists."""
+        self.document_collection = None
+        self.query_filter = None
+        self._dimension: int | None = None
+        self._ids: list[str | int] = []
+        self._texts: list[str | None] = []
+        self._attributes: list[dict[str, Any]] = []
+        self._positions: dict[str | int, int] = {}
+        self._live: np.ndarray | None = None
+
+        meta_path = self.db_connection / META_FILE
+        if not meta_path.exists():
+            return
+        self._dimension = json.loads(meta_path.read_text(encoding="utf-8"))["dimension"]
+        with (self.db_connection / DOCUMENTS_FILE).open(encoding="utf-8") as file:
+            documents = [json.loads(line) for line in file if line.endswith("\n")]
+        if self._dimension is not None:
+            # rows of an interrupted append are ignored
+            row_size = self._dimension * np.dtype(np.float32).itemsize
+            num_rows = (self.db_connection / VECTORS_FILE).stat().st_size // row_size
+            documents = documents[:num_rows]
+        self._add([
+            VectorStoreDocument(
+                id=document["id"],
+                text=document["text"],
+                vector=None,
+                attributes=document["attributes"],
+            )
+            for document in documents
+        ])
+
+    def _add(self, documents: list[VectorStoreDocument]) -> None:
+        """Register documents appended to the files and remap the vectors."""
+        for document in documents:
+            self._positions[document.id] = len(self._ids)
+            self._ids.append(document.id)
+            self._texts.append(document.text)
+            self._attributes.append(document.attributes)
+        if len(self._positions) < len(self._ids):
+            self._live = np.zeros(len(self._ids), dtype=bool)
+            self._live[list(self._positions.values())] = True
+        else:
+            self._live = None
+        self.query_filter = None
+
+        if self._dimension is None or not self._ids:
+            self.document_collection = None
+            return
+        self.document_collection = np.memmap(
+            self.db_connection / VECTORS_FILE,
+            dtype=np.float32,
+            mode="r",
+            shape=(len(self._ids), self._dimension),
+        )
+
+    def _replace(self, name: str, data: bytes) -> None:
+        path = self.db_connection / name
+        temp_path = path.with_name(f"{name}.tmp")
+        temp_path.write_bytes(data)
+        os.replace(temp_path, path)
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """Scale the rows of a matrix to unit length, leaving zero rows as they are."""
+    if vectors.size == 0:
+        return vectors.reshape(len(vectors), 0)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return vectors / norms
@@ -0,0 +1,49 @@
+import argparse
+import os
+import sys
+
+# 로컬 graphrag_lib 의 인덱싱 엔진을 사용 (pip 로 설치된 graphrag 보다 우선)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "graphrag_lib"))
+
+from config.configs import web_config
+from graphrag.index.api import DEFAULT_MAX_CONCURRENT_DOMAINS
+from graphrag.index.cli import batch_index_cli
+from graphrag.index.emit.types import TableEmitterType
+from graphrag.index.progress.types import ReporterType
+
+
+def graphrag_roots():
+    """DOMAIN_TO_FOLDER_MAP 에서 settings.yaml 이 있는 graphrag 루트만 중복 없이 반환"""
+    roots = []
+    for folder in web_config.DOMAIN_TO_FOLDER_MAP.values():
+        if folder and os.path.isfile(os.path.join(folder, "settings.yaml")) and folder not in roots:
+            roots.append(folder)
+    return roots
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="모든 도메인의 graphrag 인덱스를 한 프로세스에서 재구축")
+    parser.add_argument("--roots", nargs="+", default=None, help="재구축할 루트 (기본: DOMAIN_TO_FOLDER_MAP 전체)")
+    parser.add_argument("--max-concurrent-domains", type=int, default=DEFAULT_MAX_CONCURRENT_DOMAINS)
+    parser.add_argument("--tpm", type=int, default=None, help="모든 도메인이 공유하는 모델별 TPM")
+    parser.add_argument("--rpm", type=int, default=None, help="모든 도메인이 공유하는 모델별 RPM")
+    parser.add_argument("--concurrent-requests", type=int, default=None)
+    parser.add_argument("--nocache", action="store_true")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args()
+
+    roots = args.roots or graphrag_roots()
+    print(f" - 인덱싱 대상 ({len(roots)}):", roots)
+    batch_index_cli(
+        root_dirs=roots,
+        verbose=args.verbose,
+        memprofile=False,
+        nocache=args.nocache,
+        reporter=ReporterType.RICH,
+        emit=[TableEmitterType.Parquet],
+        skip_validations=False,
+        max_concurrent_domains=args.max_concurrent_domains,
+        tokens_per_minute=args.tpm,
+        requests_per_minute=args.rpm,
+        concurrent_requests=args.concurrent_requests,
+    )
@@ -4,6 +4,8 @@ import json
 import hashlib
 import sqlite3
 import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Optional, Any, Tuple
 import numpy as np
@@ -47,11 +49,112 @@ def _make_id(date: str, time_str: str, content: str) -> str:
 def _ensure_dir(p: Path):
     p.mkdir(parents=True, exist_ok=True)
 
+def _save_npy_atomic(path: Path, arr: np.ndarray):
+    """
+    np.save to a temp file then replace, so readers holding an mmap of the old file never see it truncated.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("wb") as f:
+        np.save(f, arr)
+    os.replace(tmp, path)
+
+class _PersonIndex:
+    """In-memory search state of one person: ids, mmap'd embeddings, FAISS index and id->record map."""
+
+    def __init__(self, ids: List[str], embs: np.ndarray, index, records: Dict[str, Dict[str, Any]]):
+        self.ids = ids
+        self.embs = embs
+        self.index = index
+        self.records = records
+        self.nbytes = (
+            embs.nbytes
+            + (index.ntotal * index.d * 4 if index is not None else 0)
+            + sum(len(r.get("content", "")) for r in records.values()) * 4
+        )
+
+def _read_npy_header(path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Read the header of an .npy file without loading the array.
+    Returns shape/dtype/fortran_order plus the byte offsets needed to rewrite the header in place.
+    """
+    try:
+        with path.open("rb") as f:
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+            data_offset = f.tell()
+    except Exception:
+        return None
+    len_size = 2 if version == (1, 0) else 4
+    return {
+        "version": version,
+        "shape": shape,
+        "fortran_order": fortran_order,
+        "dtype": dtype,
+        "header_offset": 8 + len_size,
+        "data_offset": data_offset,
+    }
+
+def _append_npy_rows(path: Path, rows: np.ndarray) -> bool:
+    """
+    Append rows to a 2-D .npy file in place: rewrite the shape in the header and write the new rows at the end.
+    numpy pads headers so the row count can grow; returns False (caller rewrites the file) if anything doesn't fit.
+    """
+    header = _read_npy_header(path)
+    if header is None or header["fortran_order"] or len(header["shape"]) != 2:
+        return False
+    n_rows, dim = header["shape"]
+    if rows.ndim != 2 or rows.shape[1] != dim or rows.dtype != header["dtype"]:
+        return False
+
+    d = {"descr": np.lib.format.dtype_to_descr(header["dtype"]), "fortran_order": False, "shape": (n_rows + rows.shape[0], dim)}
+    header_str = "{" + "".join(f"{k!r}: {v!r}, " for k, v in sorted(d.items())) + "}"
+    capacity = header["data_offset"] - header["header_offset"]
+    if len(header_str) + 1 > capacity:
+        return False
+    encoding = "utf8" if header["version"] >= (3, 0) else "latin1"
+    header_bytes = (header_str + " " * (capacity - len(header_str) - 1) + "\n").encode(encoding)
+
+    with path.open("r+b") as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell() != header["data_offset"] + n_rows * dim * header["dtype"].itemsize:
+            return False
+        f.write(np.ascontiguousarray(rows).tobytes())
+        f.seek(header["header_offset"])
+        f.write(header_bytes)
+    return True
+
+def _append_json_list(path: Path, items: List[str]) -> bool:
+    """
+    Append items to a JSON list file (e.g. ids.json) without rewriting it. Returns False if the file isn't a list.
+    """
+    with path.open("r+b") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        if size < 2:
+            return False
+        f.seek(size - 1)
+        if f.read(1) != b"]":
+            return False
+        f.seek(0)
+        empty = f.read(2) == b"[]"
+        tail = json.dumps(items, ensure_ascii=False)[1:]
+        f.seek(size - 1)
+        f.write((tail if empty else ", " + tail).encode("utf-8"))
+    return True
+
 class FarmingLanceDBManager:
     def __init__(self, root_dir: str = "lancedb_data",
                  sqlite_db_path: Optional[str] = None,
                  embedding_model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
-                 use_openai: bool = False):
+                 use_openai: bool = False,
+                 index_cache_bytes: int = 256 * 1024 * 1024,
+                 embedding_backend: Optional[Any] = None,
+                 embedding_batch_size: int = 64,
+                 embedding_dtype: str = "float32",
+                 query_cache_size: int = 1024):
         self.root = Path(root_dir)
         _ensure_dir(self.root)
         self.use_openai = use_openai
@@ -59,9 +162,30 @@ class FarmingLanceDBManager:
 
         if use_openai and openai is None:
             raise RuntimeError("openai package not available but use_openai=True")
+        if embedding_dtype not in ("float32", "float16"):
+            raise ValueError(f"embedding_dtype must be 'float32' or 'float16', got {embedding_dtype!r}")
+
+        # Local embedding backend: any object with a SentenceTransformer-style encode().
+        # If not given, embedding_model_name is loaded lazily on first use.
+        self.embed_model = embedding_backend
+        self._custom_embed_model = embedding_backend is not None
+        self.embedding_batch_size = embedding_batch_size
+        self.embedding_dtype = np.dtype(embedding_dtype)
+        self._embed_model_lock = threading.Lock()
+        self._embed_model_failed = False
 
         # Threading lock for sqlite usage
         self._sqlite_lock = threading.RLock()
+        # Serializes writes to the per-person files (records/ids/embeddings/faiss)
+        self._store_lock = threading.RLock()
+        # LRU cache of loaded per-person search state, bounded by index_cache_bytes
+        self._index_cache: "OrderedDict[str, _PersonIndex]" = OrderedDict()
+        self._index_cache_bytes = index_cache_bytes
+        self._index_cache_lock = threading.Lock()
+        # LRU of query embeddings, kept in memory only so searches never write to sqlite
+        self._query_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._query_cache_size = query_cache_size
+        self._query_cache_lock = threading.Lock()
 
         print('Farming DB root:', self.root)
 
@@ -73,6 +197,10 @@ class FarmingLanceDBManager:
         self._init_sqlite()
         # Ensure required columns (pid, person_name) exist
         self._ensure_table_columns()
+        # Ensure secondary indexes used by the per-person/date lookups exist
+        self._ensure_indexes()
+        # person identifier (folder / pid / person_name) -> canonical folder id
+        self._person_cache: Dict[str, str] = {}
 
     # -----------------------
     # SQLite init & schema utilities
@@ -103,6 +231,13 @@ class FarmingLanceDBManager:
             filepath TEXT,
             mtime REAL
         )""")
+        cur.execute("""
+        CREATE TABLE IF NOT EXISTS embedding_cache (
+            model TEXT,
+            hash TEXT,
+            vector BLOB,
+            PRIMARY KEY (model, hash)
+        )""")
         self.conn.commit()
 
     def _get_existing_columns(self, table_name: str) -> List[str]:
@@ -132,6 +267,27 @@ class FarmingLanceDBManager:
                     except Exception as e:
                         print(f"Warning: failed to add column {col}: {e}")
             self.conn.commit()
+        # column list is fixed from here on; cache it instead of running PRAGMA per record
+        self._records_columns = self._get_existing_columns("records")
+
+    def _ensure_indexes(self):
+        """
+        Schema migration: composite indexes for the (person|pid|person_name, date) lookups.
+        CREATE INDEX IF NOT EXISTS makes this a no-op on already-migrated databases.
+        """
+        indexes = {
+            "idx_records_person_date": "records(person, date)",
+            "idx_records_pid_date": "records(pid, date)",
+            "idx_records_person_name_date": "records(person_name, date)",
+        }
+        with self._sqlite_lock:
+            cur = self.conn.cursor()
+            existing = {row[0] for row in cur.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+            for name, target in indexes.items():
+                if name not in existing:
+                    cur.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+                    print(f"Added index '{name}' on {target}.")
+            self.conn.commit()
 
     # -----------------------
     # Person folder parsing
@@ -150,6 +306,37 @@ class FarmingLanceDBManager:
         else:
             return ("", folder_name)
 
+    def resolve_person(self, person: str) -> Optional[str]:
+        """
+        Resolve a person identifier - folder id ('1_taeyong'), pid ('1') or person_name ('taeyong') -
+        to the canonical folder id stored in records.person, trying each column in that order.
+        Each lookup is a single indexed query; results are cached. Returns None if nothing matches.
+        """
+        if not person:
+            return None
+        cached = self._person_cache.get(person)
+        if cached is not None:
+            return cached
+
+        resolved = None
+        with self._sqlite_lock:
+            cur = self.conn.cursor()
+            for col in ("person", "pid", "person_name"):
+                cur.execute(f"SELECT person FROM records WHERE {col} = ? LIMIT 1", (person,))
+                row = cur.fetchone()
+                if row:
+                    resolved = row[0]
+                    break
+        if resolved is None:
+            # no records yet: fall back to the folder names on disk
+            for folder in self.list_persons():
+                if person in (folder, *self._split_person_folder(folder)):
+                    resolved = folder
+                    break
+        if resolved is not None:
+            self._person_cache[person] = resolved
+        return resolved
+
     # -----------------------
     # File path helpers (per-person storage)
     # -----------------------
@@ -283,64 +470,306 @@ class FarmingLanceDBManager:
         p = self._meta_path(person)
         p.write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
 
-    def _compute_embeddings(self, texts: List[str]) -> np.ndarray:
+    def _get_embed_model(self):
+        """
+        Return the local embedding backend, loading embedding_model_name once (thread-safe).
+        Returns None if sentence-transformers isn't available or the model failed to load.
+        """
+        if self.embed_model is not None or self._embed_model_failed:
+            return self.embed_model
+        with self._embed_model_lock:
+            if self.embed_model is None and not self._embed_model_failed:
+                if SentenceTransformer is None:
+                    print("Warning: sentence_transformers not available; farming diary embeddings are disabled")
+                    self._embed_model_failed = True
+                else:
+                    try:
+                        print(f"Loading embedding model: {self.embedding_model_name}")
+                        self.embed_model = SentenceTransformer(self.embedding_model_name)
+                    except Exception as e:
+                        print(f"Warning: failed to load embedding model {self.embedding_model_name}: {e}")
+                        self._embed_model_failed = True
+        return self.embed_model
+
+    def _embedding_cache_key(self) -> str:
         if self.use_openai:
-            resp = openai.Embedding.create(input=texts, model="text-embedding-3-small")
-            embs = [r["embedding"] for r in resp["data"]]
-            arr = np.array(embs, dtype=np.float32)
-            norm = np.linalg.norm(arr, axis=1, keepdims=True)
-            norm[norm == 0] = 1.0
-            return arr / norm
+            return "openai:text-embedding-3-small"
+        if self._custom_embed_model:
+            return f"{type(self.embed_model).__name__}:{self.embedding_model_name}"
+        return self.embedding_model_name
+
+    def _load_cached_embeddings(self, hashes: List[str]) -> Dict[str, np.ndarray]:
+        model = self._embedding_cache_key()
+        out: Dict[str, np.ndarray] = {}
+        with self._sqlite_lock:
+            cur = self.conn.cursor()
+            for start in range(0, len(hashes), 500):
+                chunk = hashes[start:start + 500]
+                cur.execute(
+                    f"SELECT hash, vector FROM embedding_cache WHERE model = ? AND hash IN ({','.join('?' for _ in chunk)})",
+                    (model, *chunk),
+                )
+                for h, blob in cur.fetchall():
+                    out[h] = np.frombuffer(blob, dtype=np.float32)
+        return out
+
+    def _store_cached_embeddings(self, hashes: List[str], arr: np.ndarray):
+        model = self._embedding_cache_key()
+        arr = np.ascontiguousarray(arr, dtype=np.float32)
+        with self._sqlite_lock:
+            cur = self.conn.cursor()
+            cur.executemany(
+                "REPLACE INTO embedding_cache(model, hash, vector) VALUES (?, ?, ?)",
+                [(model, h, arr[i].tobytes()) for i, h in enumerate(hashes)],
+            )
+            self.conn.commit()
+
+    def _encode(self, texts: List[str]) -> Optional[np.ndarray]:
+        """
+        Embed texts with the configured backend in batches of embedding_batch_size.
+        Returns L2-normalized float32 rows, or None if no backend is available.
+        """
+        if self.use_openai:
+            parts = []
+            for start in range(0, len(texts), self.embedding_batch_size):
+                resp = openai.Embedding.create(input=texts[start:start + self.embedding_batch_size], model="text-embedding-3-small")
+                parts.append(np.array([r["embedding"] for r in resp["data"]], dtype=np.float32))
+            arr = np.concatenate(parts, axis=0)
         else:
-            if not hasattr(self, "embed_model") or self.embed_model is None:
-                return np.zeros((len(texts), 1), dtype=np.float32)
-            arr = self.embed_model.encode(texts, convert_to_numpy=True, show_progress_bar=False)
-            norm = np.linalg.norm(arr, axis=1, keepdims=True)
-            norm[norm == 0] = 1.0
-            return (arr / norm).astype(np.float32)
+            model = self._get_embed_model()
+            if model is None:
+                return None
+            arr = np.asarray(
+                model.encode(texts, batch_size=self.embedding_batch_size, convert_to_numpy=True, show_progress_bar=False),
+                dtype=np.float32,
+            )
+        norm = np.linalg.norm(arr, axis=1, keepdims=True)
+        norm[norm == 0] = 1.0
+        return arr / norm
+
+    def _compute_embeddings(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed texts, reusing vectors cached by content hash (sqlite embedding_cache table),
+        so unchanged text is never re-encoded. Rows are returned in embedding_dtype.
+        """
+        hashes = [hashlib.sha1(t.encode("utf-8")).hexdigest() for t in texts]
+        unique = list(dict.fromkeys(hashes))
+        vectors = self._load_cached_embeddings(unique)
+
+        missing = [h for h in unique if h not in vectors]
+        if missing:
+            text_by_hash = dict(zip(hashes, texts))
+            fresh = self._encode([text_by_hash[h] for h in missing])
+            if fresh is None:
+                return np.zeros((len(texts), 1), dtype=self.embedding_dtype)
+            self._store_cached_embeddings(missing, fresh)
+            vectors.update(zip(missing, fresh))
+
+        return np.stack([vectors[h] for h in hashes]).astype(self.embedding_dtype)
+
+    def _embed_query(self, text: str) -> np.ndarray:
+        """
+        Embed a query text as a single row in embedding_dtype. Unlike _compute_embeddings,
+        the vector is cached in the bounded in-memory query LRU, not in sqlite.
+        """
+        with self._query_cache_lock:
+            vec = self._query_cache.get(text)
+            if vec is not None:
+                self._query_cache.move_to_end(text)
+        if vec is None:
+            fresh = self._encode([text])
+            if fresh is None:
+                return np.zeros((1, 1), dtype=self.embedding_dtype)
+            vec = fresh[0]
+            with self._query_cache_lock:
+                self._query_cache[text] = vec
+                while len(self._query_cache) > self._query_cache_size:
+                    self._query_cache.popitem(last=False)
+        return vec[np.newaxis].astype(self.embedding_dtype)
 
     # -----------------------
     # Upsert / storage
     # -----------------------
     def upsert(self, person: str, records: List[Dict[str, Any]]):
+        """
+        Add or update records for a person.
+        Only new or changed records are embedded. New records are appended to
+        records.jsonl / ids.json / embeddings.npy / faiss.index in place; the files
+        are rewritten (compaction) only when an existing record changed or the
+        stored files are inconsistent.
+        """
+        with self._store_lock:
+            try:
+                self._upsert_locked(person, records)
+            finally:
+                self._invalidate_index_cache(person)
+
+    def _upsert_locked(self, person: str, records: List[Dict[str, Any]]):
         pdir = self._person_dir(person)
         _ensure_dir(pdir)
+
+        incoming: Dict[str, Dict[str, Any]] = {}
+        for r in records:
+            rid = r.get("id") or _make_id(r.get("date", ""), r.get("time", ""), r.get("content", ""))
+            r["id"] = rid
+            incoming[rid] = r
+        if not incoming:
+            return
+
+        ids = self._load_ids(person)
+        id_set = set(ids)
+        known = [rid for rid in incoming if rid in id_set]
+        new_ids = [rid for rid in incoming if rid not in id_set]
+
+        changed = []
+        if known:
+            existing = {r["id"]: r for r in self.get_by_person(person)}
+            changed = [rid for rid in known if existing.get(rid) != incoming[rid]]
+            if changed:
+                # same id but different fields: rewrite, re-embedding only records whose text changed
+                reembed = {rid for rid in changed if existing.get(rid, {}).get("content") != incoming[rid].get("content")}
+                existing.update(incoming)
+                self._compact(person, existing, ids, reembed=reembed)
+                return
+
+        if not new_ids:
+            return
+        if not self._append(person, ids, [incoming[rid] for rid in new_ids]):
+            existing = {r["id"]: r for r in self.get_by_person(person)}
+            existing.update(incoming)
+            self._compact(person, existing, ids, reembed=set(new_ids))
+
+    def compact(self, person: str):
+        """
+        Rewrite a person's records/ids/embeddings/faiss files from records.jsonl,
+        reusing stored embeddings and embedding only records that have none.
+        """
+        with self._store_lock:
+            try:
+                existing = {r["id"]: r for r in self.get_by_person(person)}
+                self._compact(person, existing, self._load_ids(person), reembed=set())
+            finally:
+                self._invalidate_index_cache(person)
+
+    def _load_ids(self, person: str) -> List[str]:
+        ids_path = self._ids_path(person)
+        if not ids_path.exists():
+            return []
+        try:
+            return json.loads(ids_path.read_text(encoding="utf-8"))
+        except Exception:
+            return []
+
+    def _append(self, person: str, ids: List[str], new_records: List[Dict[str, Any]]) -> bool:
+        """
+        Append-path upsert: embed only new_records and append them to the person's files.
+        Returns False when the stored files can't be appended to (caller compacts instead).
+        """
         records_path = self._records_path(person)
         ids_path = self._ids_path(person)
         emb_path = self._embeddings_path(person)
+        new_ids = [r["id"] for r in new_records]
 
-        existing = {}
-        if records_path.exists():
-            with records_path.open("r", encoding="utf-8") as f:
-                for line in f:
-                    if not line.strip():
-                        continue
-                    obj = json.loads(line)
-                    existing[obj["id"]] = obj
+        if ids:
+            header = _read_npy_header(emb_path)
+            if header is None or len(header["shape"]) != 2 or header["shape"][0] != len(ids):
+                return False
+        elif records_path.exists() and records_path.stat().st_size > 0:
+            # records without ids.json: let compaction rebuild from records.jsonl
+            return False
 
-        for r in records:
-            rid = r.get("id") or _make_id(r.get("date", ""), r.get("time", ""), r.get("content", ""))
-            r["id"] = rid
-            existing[rid] = r
+        new_embs = self._compute_embeddings([r.get("content", "") for r in new_records])
 
-        all_ids = list(existing.keys())
-        all_texts = [existing[_id].get("content", "") for _id in all_ids]
-        if all_texts:
-            all_embs = self._compute_embeddings(all_texts)
+        if ids:
+            if not _append_npy_rows(emb_path, new_embs):
+                return False
+            if not _append_json_list(ids_path, new_ids):
+                return False
         else:
-            all_embs = np.zeros((0, 1), dtype=np.float32)
+            np.save(str(emb_path), new_embs)
+            ids_path.write_text(json.dumps(new_ids, ensure_ascii=False), encoding="utf-8")
+
+        with records_path.open("a", encoding="utf-8") as f:
+            for r in new_records:
+                f.write(json.dumps(r, ensure_ascii=False) + "\n")
+
+        total = len(ids) + len(new_ids)
+        fpath = self._faiss_path(person)
+        if _FAISS_AVAILABLE:
+            index = None
+            if ids and fpath.exists():
+                try:
+                    index = faiss.read_index(str(fpath))
+                    if index.ntotal != len(ids) or index.d != new_embs.shape[1]:
+                        index = None
+                except Exception:
+                    index = None
+            if index is None:
+                all_embs = np.load(str(emb_path))
+                index = faiss.IndexFlatIP(all_embs.shape[1])
+                index.add(np.ascontiguousarray(all_embs, dtype=np.float32))
+            else:
+                index.add(np.ascontiguousarray(new_embs, dtype=np.float32))
+            faiss.write_index(index, str(fpath))
+
+        self._save_meta(person, {"count": total})
+        return True
+
+    def _compact(self, person: str, records_by_id: Dict[str, Dict[str, Any]], stored_ids: List[str], reembed: set):
+        """
+        Rewrite every per-person file. Embeddings of unchanged records are taken
+        from the stored matrix; records in `reembed` or without a stored row are embedded.
+        """
+        records_path = self._records_path(person)
+        ids_path = self._ids_path(person)
+        emb_path = self._embeddings_path(person)
+
+        stored_embs = None
+        if stored_ids and emb_path.exists():
+            try:
+                stored_embs = np.load(str(emb_path), mmap_mode="r")
+                if stored_embs.ndim != 2 or stored_embs.shape[0] != len(stored_ids):
+                    stored_embs = None
+            except Exception:
+                stored_embs = None
+        stored_pos = {rid: i for i, rid in enumerate(stored_ids)} if stored_embs is not None else {}
+
+        all_ids = list(records_by_id.keys())
+        todo = [rid for rid in all_ids if rid in reembed or rid not in stored_pos]
+        if todo:
+            fresh = self._compute_embeddings([records_by_id[rid].get("content", "") for rid in todo])
+            if stored_embs is not None and fresh.shape[1] != stored_embs.shape[1]:
+                # embedding dimension changed (e.g. model switch): re-embed everything
+                todo = all_ids
+                fresh = self._compute_embeddings([records_by_id[rid].get("content", "") for rid in todo])
+                stored_pos = {}
+            dim, dtype = fresh.shape[1], fresh.dtype
+        elif stored_embs is not None:
+            fresh = None
+            dim, dtype = stored_embs.shape[1], stored_embs.dtype
+        else:
+            fresh = None
+            dim, dtype = 1, np.float32
+
+        all_embs = np.zeros((len(all_ids), dim), dtype=dtype)
+        fresh_pos = {rid: i for i, rid in enumerate(todo)}
+        for i, rid in enumerate(all_ids):
+            if rid in fresh_pos:
+                all_embs[i] = fresh[fresh_pos[rid]]
+            else:
+                all_embs[i] = stored_embs[stored_pos[rid]]
+        del stored_embs  # release the mmap before overwriting the file
 
         with records_path.open("w", encoding="utf-8") as f:
             for _id in all_ids:
-                f.write(json.dumps(existing[_id], ensure_ascii=False) + "\n")
+                f.write(json.dumps(records_by_id[_id], ensure_ascii=False) + "\n")
 
         ids_path.write_text(json.dumps(all_ids, ensure_ascii=False), encoding="utf-8")
-        np.save(str(emb_path), all_embs)
+        _save_npy_atomic(emb_path, all_embs)
 
         if _FAISS_AVAILABLE and all_embs.shape[0] > 0:
-            dim = all_embs.shape[1]
             index = faiss.IndexFlatIP(dim)
-            index.add(all_embs)
+            index.add(np.ascontiguousarray(all_embs, dtype=np.float32))
             faiss.write_index(index, str(self._faiss_path(person)))
         else:
             fpath = self._faiss_path(person)
@@ -367,39 +796,82 @@ class FarmingLanceDBManager:
         return out
 
     def query_by_text(self, person: str, text: str, top_k: int = 5) -> List[Dict[str, Any]]:
-        ids_path = self._ids_path(person)
-        emb_path = self._embeddings_path(person)
-        if not ids_path.exists() or not emb_path.exists():
+        pindex = self._get_person_index(person)
+        if pindex is None or not pindex.ids:
             return []
 
-        ids = json.loads(ids_path.read_text(encoding="utf-8"))
-        embs = np.load(str(emb_path))
-        q_emb = self._compute_embeddings([text])[0:1]
+        q_emb = self._embed_query(text)
+        k = min(top_k, len(pindex.ids))
 
-        if _FAISS_AVAILABLE and self._faiss_path(person).exists():
-            index = faiss.read_index(str(self._faiss_path(person)))
-            D, I = index.search(q_emb, min(top_k, embs.shape[0]))
+        if pindex.index is not None:
+            D, I = pindex.index.search(np.ascontiguousarray(q_emb, dtype=np.float32), k)
             hits = []
-            for idx in I[0]:
-                if idx < 0 or idx >= len(ids):
+            for score, idx in zip(D[0], I[0]):
+                if idx < 0 or idx >= len(pindex.ids):
                     continue
-                rid = ids[idx]
-                hits.append((rid, float(D[0][idx])))
+                hits.append((pindex.ids[idx], float(score)))
         else:
-            sims = (embs @ q_emb.T).reshape(-1)
-            top_idx = np.argsort(-sims)[:top_k]
-            hits = [(ids[int(i)], float(sims[int(i)])) for i in top_idx]
+            sims = (pindex.embs @ q_emb.T.astype(pindex.embs.dtype)).reshape(-1)
+            top_idx = np.argsort(-sims)[:k]
+            hits = [(pindex.ids[int(i)], float(sims[int(i)])) for i in top_idx]
 
-        all_records = {r["id"]: r for r in self.get_by_person(person)}
         out = []
         for rid, score in hits:
-            rec = all_records.get(rid)
+            rec = pindex.records.get(rid)
             if rec:
                 rec_copy = dict(rec)
                 rec_copy["_score"] = score
                 out.append(rec_copy)
         return out
 
+    # -----------------------
+    # Per-person index cache
+    # -----------------------
+    def _get_person_index(self, person: str) -> Optional[_PersonIndex]:
+        # keyed like the person directories, so every spelling of a person shares one entry
+        key = _sanitize_person(person)
+        with self._index_cache_lock:
+            pindex = self._index_cache.get(key)
+            if pindex is not None:
+                self._index_cache.move_to_end(key)
+                return pindex
+
+        # load under the store lock so we never read half-written files
+        with self._store_lock:
+            pindex = self._load_person_index(person)
+        if pindex is None:
+            return None
+
+        with self._index_cache_lock:
+            if pindex.nbytes <= self._index_cache_bytes:
+                self._index_cache[key] = pindex
+                used = sum(p.nbytes for p in self._index_cache.values())
+                while used > self._index_cache_bytes and len(self._index_cache) > 1:
+                    _, evicted = self._index_cache.popitem(last=False)
+                    used -= evicted.nbytes
+        return pindex
+
+    def _load_person_index(self, person: str) -> Optional[_PersonIndex]:
+        ids_path = self._ids_path(person)
+        emb_path = self._embeddings_path(person)
+        if not ids_path.exists() or not emb_path.exists():
+            return None
+
+        ids = json.loads(ids_path.read_text(encoding="utf-8"))
+        embs = np.load(str(emb_path), mmap_mode="r")
+        index = None
+        if _FAISS_AVAILABLE and self._faiss_path(person).exists():
+            index = faiss.read_index(str(self._faiss_path(person)))
+        records = {r["id"]: r for r in self.get_by_person(person)}
+        return _PersonIndex(ids, embs, index, records)
+
+    def _invalidate_index_cache(self, person: Optional[str] = None):
+        with self._index_cache_lock:
+            if person is None:
+                self._index_cache.clear()
+            else:
+                self._index_cache.pop(_sanitize_person(person), None)
+
     # -----------------------
     # SQLite helper methods
     # -----------------------
@@ -424,36 +896,68 @@ class FarmingLanceDBManager:
             cur.execute("REPLACE INTO processed_files(filepath, mtime) VALUES (?, ?)", (filepath, float(mtime)))
             self.conn.commit()
 
+    def _record_sql(self) -> Tuple[str, List[str]]:
+        """
+        REPLACE statement for the 'records' table, including pid and person_name
+        if those columns exist in the table.
+        """
+        cols = ["id", "person", "date", "time", "content", "filepath", "mtime"]
+        cols += [c for c in ("pid", "person_name") if c in self._records_columns]
+        placeholders = ",".join("?" for _ in cols)
+        return f"REPLACE INTO records({','.join(cols)}) VALUES ({placeholders})", cols
+
+    def _record_values(self, rec: Dict[str, Any], filepath: str, mtime: float, cols: List[str]) -> tuple:
+        vals = {
+            "id": rec["id"],
+            "person": rec.get("person", ""),
+            "date": rec.get("date", ""),
+            "time": rec.get("time", ""),
+            "content": rec.get("content", ""),
+            "filepath": filepath,
+            "mtime": float(mtime),
+            "pid": rec.get("pid", ""),
+            "person_name": rec.get("person_name", ""),
+        }
+        return tuple(vals[c] for c in cols)
+
     def _upsert_record_sqlite(self, rec: Dict[str, Any], filepath: str, mtime: float):
         """
         Upsert record into sqlite 'records' table. This will include pid and person_name
         if those columns exist in the table.
         """
+        sql, cols = self._record_sql()
         with self._sqlite_lock:
-            existing_cols = self._get_existing_columns("records")
-            cols = ["id", "person", "date", "time", "content", "filepath", "mtime"]
-            vals = [
-                rec["id"],
-                rec.get("person", ""),
-                rec.get("date", ""),
-                rec.get("time", ""),
-                rec.get("content", ""),
-                filepath,
-                float(mtime)
-            ]
-            if "pid" in existing_cols:
-                cols.append("pid")
-                vals.append(rec.get("pid", ""))
-            if "person_name" in existing_cols:
-                cols.append("person_name")
-                vals.append(rec.get("person_name", ""))
-
-            placeholders = ",".join("?" for _ in cols)
-            cols_sql = ",".join(cols)
-            sql = f"REPLACE INTO records({cols_sql}) VALUES ({placeholders})"
             cur = self.conn.cursor()
-            cur.execute(sql, tuple(vals))
+            cur.execute(sql, self._record_values(rec, filepath, mtime, cols))
             self.conn.commit()
+        # new records can change which folder a pid or person_name resolves to
+        self._person_cache.clear()
+
+    def _bulk_write_sqlite(self, records: List[Tuple[Dict[str, Any], str, float]], processed_files: List[Tuple[str, float]]):
+        """
+        Write many records and processed_files marks in a single transaction (executemany, one commit).
+        """
+        sql, cols = self._record_sql()
+        with self._sqlite_lock:
+            try:
+                cur = self.conn.cursor()
+                cur.executemany(sql, [self._record_values(rec, fp, mt, cols) for rec, fp, mt in records])
+                cur.executemany(
+                    "REPLACE INTO processed_files(filepath, mtime) VALUES (?, ?)",
+                    [(fp, float(mt)) for fp, mt in processed_files],
+                )
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
+        self._person_cache.clear()
+
+    def _load_processed_files(self) -> Dict[str, float]:
+        with self._sqlite_lock:
+            cur = self.conn.cursor()
+            cur.execute("SELECT filepath, mtime FROM processed_files")
+            rows = cur.fetchall()
+        return {fp: float(mt) for fp, mt in rows}
 
     def sql_query(self, sql: str, params: tuple = ()):
         with self._sqlite_lock:
@@ -541,106 +1045,149 @@ class FarmingLanceDBManager:
     # -----------------------
     # Ingest from server (robust JSON shapes)
     # -----------------------
-    def ingest_from_server(self, server_root: str, person_dir_pattern: Optional[str] = None):
+    def _parse_diary_file(self, jf: Path) -> Tuple[Path, Optional[List[Dict[str, Any]]]]:
+        """
+        Read one diary JSON file and return its normalized entries (None if the file can't be parsed).
+        Runs in the ingest thread pool, so it must not touch sqlite.
+        """
+        jpath = str(jf.resolve())
+        try:
+            raw = jf.read_text(encoding="utf-8")
+            data = json.loads(raw)
+        except Exception as e:
+            print(f"Warning: failed to parse JSON file {jpath}: {e}")
+            return jf, None
+
+        try:
+            entries = self._extract_entries_from_json(data)
+        except Exception as e:
+            print(f"Warning: error while extracting entries from {jpath}: {e}")
+            entries = []
+
+        if not isinstance(entries, list):
+            if isinstance(entries, dict):
+                entries = [entries]
+            else:
+                entries = []
+        return jf, entries
+
+    def ingest_from_server(self, server_root: str, person_dir_pattern: Optional[str] = None,
+                           max_workers: int = 8, show_progress: bool = True) -> Dict[str, Any]:
+        """
+        Ingest every new/modified diary JSON under server_root/<person>/.
+        JSON files are parsed in a thread pool; each person's records and processed-file
+        marks are written to sqlite in one transaction. Returns throughput counters.
+        """
         sroot = Path(server_root)
         if not sroot.exists():
             raise FileNotFoundError(f"{server_root} not found")
 
-        for p in sroot.iterdir():
-            if not p.is_dir():
-                continue
-            pname = p.name
-            if person_dir_pattern and person_dir_pattern not in pname:
-                continue
-
-            pid, person_name = self._split_person_folder(pname)
-            person_folder_identifier = pname
-            collected_records = []
-            for jf in p.rglob("*.json"):
-                jpath = str(jf.resolve())
-                mtime = self._get_file_mtime(jf)
-                try:
-                    if self._is_file_processed(jpath, mtime):
+        stats = {"persons": 0, "files_seen": 0, "files_skipped": 0, "files_failed": 0,
+                 "files_parsed": 0, "records": 0, "seconds": 0.0}
+        start = time.perf_counter()
+        processed = self._load_processed_files()
+
+        person_dirs = [
+            p for p in sorted(sroot.iterdir())
+            if p.is_dir() and not (person_dir_pattern and person_dir_pattern not in p.name)
+        ]
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for p in tqdm(person_dirs, desc="ingest", unit="person", disable=not show_progress):
+                pname = p.name
+                pid, person_name = self._split_person_folder(pname)
+                person_folder_identifier = pname
+
+                to_parse = []
+                for jf in p.rglob("*.json"):
+                    stats["files_seen"] += 1
+                    mtime = self._get_file_mtime(jf)
+                    if processed.get(str(jf.resolve()), -1.0) >= float(mtime):
+                        stats["files_skipped"] += 1
                         continue
-                except Exception as e:
-                    print("Warning: _is_file_processed error:", e)
-
-                try:
-                    raw = jf.read_text(encoding="utf-8")
-                    data = json.loads(raw)
-                except Exception as e:
-                    print(f"Warning: failed to parse JSON file {jpath}: {e}")
+                    to_parse.append((jf, mtime))
+                if not to_parse:
                     continue
 
-                try:
-                    entries = self._extract_entries_from_json(data)
-                except Exception as e:
-                    print(f"Warning: error while extracting entries from {jpath}: {e}")
-                    entries = []
-
-                if not isinstance(entries, list):
-                    if isinstance(entries, dict):
-                        entries = [entries]
-                    else:
-                        entries = []
-
-                if not entries:
+                mtimes = {jf: mtime for jf, mtime in to_parse}
+                collected_records = []
+                processed_files = []
+                for jf, entries in pool.map(self._parse_diary_file, [jf for jf, _ in to_parse]):
+                    if entries is None:
+                        stats["files_failed"] += 1
+                        continue
+                    stats["files_parsed"] += 1
+                    jpath = str(jf.resolve())
+                    mtime = mtimes[jf]
+                    processed_files.append((jpath, mtime))
+
+                    for e in entries:
+                        if not isinstance(e, dict):
+                            continue
+                        date = e.get("date", "")
+                        time_str = e.get("time", "")
+                        content = e.get("content", "")
+                        if not content and not date:
+                            continue
+                        rid = _make_id(date, time_str, content)
+                        rec = {
+                            "id": rid,
+                            "date": date,
+                            "time": time_str,
+                            "content": content,
+                            "person": person_folder_identifier,
+                            "pid": pid,
+                            "person_name": person_name
+                        }
+                        collected_records.append((rec, jpath, mtime))
+
+                if collected_records:
+                    recs_only = [r for (r, _, _) in collected_records]
                     try:
-                        self._mark_file_processed(jpath, mtime)
+                        self.upsert(person_folder_identifier, recs_only)
                     except Exception as e:
-                        print("Warning: _mark_file_processed error on empty file:", e)
-                    continue
-
-                for e in entries:
-                    if not isinstance(e, dict):
-                        continue
-                    date = e.get("date", "")
-                    time_str = e.get("time", "")
-                    content = e.get("content", "")
-                    if not content and not date:
-                        continue
-                    rid = _make_id(date, time_str, content)
-                    rec = {
-                        "id": rid,
-                        "date": date,
-                        "time": time_str,
-                        "content": content,
-                        "person": person_folder_identifier,
-                        "pid": pid,
-                        "person_name": person_name
-                    }
-                    collected_records.append((rec, jpath, mtime))
-
+                        # keep the files unmarked so the next ingest retries them
+                        print(f"Warning: upsert failed for {person_folder_identifier}: {e}")
+                        processed_files = []
                 try:
-                    self._mark_file_processed(jpath, mtime)
+                    self._bulk_write_sqlite(collected_records, processed_files)
                 except Exception as e:
-                    print("Warning: _mark_file_processed error:", e)
-
-            if collected_records:
-                recs_only = [r for (r, _, _) in collected_records]
-                self.upsert(person_folder_identifier, recs_only)
-                for rec, filepath, mtime in collected_records:
-                    try:
-                        self._upsert_record_sqlite(rec, filepath, mtime)
-                    except Exception as e:
-                        print("Warning: _upsert_record_sqlite error:", e)
+                    print(f"Warning: sqlite bulk write failed for {person_folder_identifier}: {e}")
+                    continue
+                for jpath, mtime in processed_files:
+                    processed[jpath] = float(mtime)
+                stats["persons"] += 1
+                stats["records"] += len(collected_records)
+
+        stats["seconds"] = time.perf_counter() - start
+        elapsed = max(stats["seconds"], 1e-9)
+        print(
+            f"[ingest_from_server] persons={stats['persons']} files={stats['files_parsed']}/{stats['files_seen']} "
+            f"(skipped={stats['files_skipped']}, failed={stats['files_failed']}) records={stats['records']} "
+            f"in {stats['seconds']:.2f}s ({stats['files_parsed'] / elapsed:.1f} files/s, {stats['records'] / elapsed:.1f} records/s)"
+        )
+        return stats
 
     def delete_person(self, person: str):
-        pdir = self._person_dir(person)
-        if pdir.exists() and pdir.is_dir():
-            for f in pdir.iterdir():
-                try:
-                    f.unlink()
-                except Exception:
-                    pass
+        with self._store_lock:
             try:
-                pdir.rmdir()
-            except Exception:
-                pass
-        with self._sqlite_lock:
-            cur = self.conn.cursor()
-            cur.execute("DELETE FROM records WHERE person = ?", (person,))
-            self.conn.commit()
+                self._person_cache.clear()
+                pdir = self._person_dir(person)
+                if pdir.exists() and pdir.is_dir():
+                    for f in pdir.iterdir():
+                        try:
+                            f.unlink()
+                        except Exception:
+                            pass
+                    try:
+                        pdir.rmdir()
+                    except Exception:
+                        pass
+                with self._sqlite_lock:
+                    cur = self.conn.cursor()
+                    cur.execute("DELETE FROM records WHERE person = ?", (person,))
+                    self.conn.commit()
+            finally:
+                self._invalidate_index_cache(person)
             
     def add_entry_and_persist(self, person_folder_identifier: str, entry: Dict[str, Any], target_filename: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -0,0 +1,83 @@
+"""Application-scoped registry of pooled LLM clients."""
+
+import json
+
+from graphrag_lib.graphrag.query.llm.oai.client_pool import (
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    OpenAIClientPool,
+    set_client_pool,
+)
+from graphrag_lib.graphrag.query.llm.oai.embedding_cache import (
+    DEFAULT_MAX_ENTRIES,
+    QueryEmbeddingCache,
+    set_query_embedding_cache,
+)
+from llm.oai.chat_openai import ChatOpenAI
+from llm.utils import get_llm
+
+
+class LLMClientRegistry:
+    """Build each LLM wrapper once and route all of them through one connection pool.
+
+    The pool is also installed for the GraphRAG query factories, so the search
+    engines' chat and embedding clients reuse the same keep-alive connections,
+    together with the query embedding cache the embedding clients share.
+    """
+
+    def __init__(
+        self, pool_config: dict | None = None, embedding_cache_config: dict | None = None
+    ):
+        pool_config = pool_config or {}
+        embedding_cache_config = embedding_cache_config or {}
+        self.client_pool = OpenAIClientPool(
+            max_connections=pool_config.get("max_connections", DEFAULT_MAX_CONNECTIONS),
+            max_keepalive_connections=pool_config.get(
+                "max_keepalive_connections", DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+            ),
+            keepalive_expiry=pool_config.get("keepalive_expiry", DEFAULT_KEEPALIVE_EXPIRY),
+        )
+        self._llms: dict[str, ChatOpenAI] = {}
+        set_client_pool(self.client_pool)
+        self.embedding_cache = QueryEmbeddingCache(
+            max_entries=embedding_cache_config.get("max_entries", DEFAULT_MAX_ENTRIES),
+            path=embedding_cache_config.get("path"),
+        )
+        set_query_embedding_cache(self.embedding_cache)
+
+    def get_llm(self, config: dict) -> ChatOpenAI:
+        """Return the pooled chat client for config['llm'], creating it on first use."""
+        key = json.dumps(config["llm"], sort_keys=True, default=str)
+        llm = self._llms.get(key)
+        if llm is None:
+            llm = self.client_pool.attach(get_llm(config))
+            self._llms[key] = llm
+        return llm
+
+    async def aclose(self) -> None:
+        """Drop the cached clients and close the connection pool."""
+        self._llms.clear()
+        set_client_pool(None)
+        await self.client_pool.aclose()
+        self.embedding_cache.close()
+
+
+_llm_client_registry: LLMClientRegistry | None = None
+
+
+def init_llm_client_registry(config: dict) -> LLMClientRegistry:
+    """Create the process-wide registry from llm_config (call once at startup)."""
+    global _llm_client_registry
+    _llm_client_registry = LLMClientRegistry(
+        config.get("client_pool"), config.get("embedding_cache")
+    )
+    return _llm_client_registry
+
+
+def get_llm_client_registry() -> LLMClientRegistry:
+    """Return the process-wide registry, creating it lazily outside the server."""
+    global _llm_client_registry
+    if _llm_client_registry is None:
+        _llm_client_registry = LLMClientRegistry()
+    return _llm_client_registry
@@ -266,7 +266,7 @@ class ChatOpenAI(BaseLLM, OpenAILLMImpl):
         if not model:
             raise ValueError(_MODEL_REQUIRED_MSG)
         response = await self.async_client.chat.completions.create(  # type: ignore
-            model=model,
+            # model=model,
             messages=messages,  # type: ignore
             stream=streaming,
             **kwargs,
@@ -6,11 +6,34 @@ from routing.routing_prompt import get_domain_query_routing_prompt
 
 def query_domain_routing(query, domains, llm, llm_config):
 
+    domain_routing_response = llm.generate(
+        **_domain_routing_request(query, domains, llm_config)
+    )
+
+    # print('Domain routing:', domain_routing_response)
+    return domain_routing_response
+
+
+async def aquery_domain_routing(query, domains, llm, llm_config):
+    """질문을 도메인 목록과 함께 라우팅 프롬프트로 LLM 에 보내고, 답할 도메인 이름을 응답으로 받음.
+    다른 요청과 함께 서버 이벤트 루프에서 대기하도록 agenerate 로 호출"""
+
+    domain_routing_response = await llm.agenerate(
+        **_domain_routing_request(query, domains, llm_config)
+    )
+
+    return domain_routing_response
+
+
+def _domain_routing_request(query, domains, llm_config):
+    """query_domain_routing / aquery_domain_routing 이 generate, agenerate 에 넘기는 인자.
+    프롬프트와 LLM 설정을 한 곳에서 만들어 동기/비동기 호출이 같은 요청을 보내도록 함"""
+
     routing_system_prompt, routing_user_prompt = get_domain_query_routing_prompt(current_question=query, \
         domains=domains)
     print('Routing user prompt:', routing_user_prompt)
-    
-    domain_routing_response = llm.generate(
+
+    return dict(
         messages=[
             # {"role": "system", "content": routing_system_prompt},
             {"role": "user", "content": routing_user_prompt},
@@ -24,9 +47,6 @@ def query_domain_routing(query, domains, llm, llm_config):
         # **config['llm'],
     )
 
-    # print('Domain routing:', domain_routing_response)
-    return domain_routing_response
-
 
 def get_domain_info(domain_routing_response):
 
@@ -1,7 +1,7 @@
 from typing import List, Dict, Tuple, Any, Optional
 import os, glob
 
-def _person_condition(person: Optional[str]) -> Tuple[str, Tuple[Any, ...]]:
+def _person_condition(db, person: Optional[str]) -> Tuple[str, Tuple[Any, ...]]:
     """
     Build a SQL condition and params to match a person value.
     We accept three possible ways to identify a person:
@@ -9,16 +9,15 @@ def _person_condition(person: Optional[str]) -> Tuple[str, Tuple[Any, ...]]:
       - pid: '1' (matches records.pid)
       - person_name: 'taeyong' (matches records.person_name)
 
+    The identifier is resolved once to the canonical folder id (db.resolve_person), so the
+    condition is a single 'person = ?' that can use the (person, date) index.
     If person is falsy (None or empty), returns a no-op condition ("1=1") and empty params.
     """
     if not person:
         return "1=1", tuple()
 
-    # We'll match against person (folder), pid and person_name.
-    # This is simple and flexible: the same input will be tried in all three columns.
-    cond = "(person = ? OR pid = ? OR person_name = ?)"
-    params = (person, person, person)
-    return cond, params
+    resolved = db.resolve_person(person)
+    return "person = ?", (resolved or person,)
 
 def get_persons(db):
     # print("Persons:", db.list_persons())
@@ -41,7 +40,7 @@ def get_all_works_date(db, person: Optional[str], date: str) -> List[Dict[str, A
 
     Returns list of rows (dicts). Also prints a short debug log.
     """
-    cond, params = _person_condition(person)
+    cond, params = _person_condition(db, person)
     sql = f"SELECT * FROM records WHERE {cond} AND date = ? ORDER BY mtime ASC"
     query_params = params + (date,)
     rows = db.sql_query(sql, query_params)
@@ -53,6 +52,14 @@ def get_all_works_date(db, person: Optional[str], date: str) -> List[Dict[str, A
     #     print(" - Works: None")
     return rows
 
+def get_work_dates(db, person: Optional[str]) -> List[str]:
+    """
+    Return the distinct dates (ascending) that have records for the given person (folder/pid/person_name).
+    """
+    cond, params = _person_condition(db, person)
+    rows = db.sql_query(f"SELECT DISTINCT date FROM records WHERE {cond} ORDER BY date ASC", params)
+    return [r["date"] for r in rows if r.get("date")]
+
 def get_search_works(db, person, target):
     # Full-text-ish SQL query (LIKE)
     rows = db.sql_query(f"SELECT * FROM records WHERE content LIKE ? LIMIT 10", ("%{target}%",))
@@ -6,6 +6,29 @@ from utils.sql_extraction.sql_extraction_prompt import get_business_list_sql_ext
 
 def sql_extraction(query, llm, llm_config, text_path=None, verbose=False):
 
+    sql_extraction_response = llm.generate(
+        **_sql_extraction_request(query, llm_config, verbose)
+    )
+    # print('sql_extraction_response:', sql_extraction_response)
+
+    return _parse_sql_filter(sql_extraction_response)
+
+
+async def asql_extraction(query, llm, llm_config, text_path=None, verbose=False):
+    """지원사업 목록 질문을 오늘 날짜 기준의 SQL WHERE 절로 변환해 반환.
+    LLM 응답에서 JSON 부분만 잘라 sql_where_clause 를 꺼내며, 호출은 agenerate 로 await"""
+
+    sql_extraction_response = await llm.agenerate(
+        **_sql_extraction_request(query, llm_config, verbose)
+    )
+
+    return _parse_sql_filter(sql_extraction_response)
+
+
+def _sql_extraction_request(query, llm_config, verbose=False):
+    """sql_extraction / asql_extraction 이 generate, agenerate 에 넘기는 인자.
+    오늘 날짜를 넣은 SQL 추출 프롬프트와 LLM 설정을 한 곳에서 만듦"""
+
     current_date = datetime.now().strftime('%Y-%m-%d')
     sql_extraction_prompt = get_business_list_sql_extraction_prompt().format(
         current_date=current_date, user_query=query
@@ -19,7 +42,7 @@ def sql_extraction(query, llm, llm_config, text_path=None, verbose=False):
     #     {"role": "user", "content": sql_extraction_prompt}
     # ]
 
-    sql_extraction_response = llm.generate(
+    return dict(
         messages=[
             # {"role": "system", "content": routing_system_prompt},
             {"role": "user", "content": sql_extraction_prompt},
@@ -32,7 +55,9 @@ def sql_extraction(query, llm, llm_config, text_path=None, verbose=False):
         top_p=llm_config['llm']['top_p']
         # **config['llm'],
     )
-    # print('sql_extraction_response:', sql_extraction_response)
+
+
+def _parse_sql_filter(sql_extraction_response):
 
     start_index = sql_extraction_response.find('{')
     end_index = sql_extraction_response.rfind('}') + 1